@@ -0,0 +1,222 @@
+"""
+Audio device discovery, done once.
+
+sd.query_devices() is slow on the Pi (PulseAudio/ALSA enumeration) and a
+hard-coded index breaks whenever USB devices re-enumerate. The manager
+resolves devices by a case-insensitive name pattern, caches the index in
+memory and in audio_devices.json (tagged with the boot id, so a reboot
+re-resolves; an entry whose index now names another device, e.g. after the
+mic was replugged, is dropped on load), and only enumerates again when:
+  - a udev "sound" hotplug event arrives (if pyudev is installed), or
+  - opening the cached device fails (see with_input_device()).
+
+Usage from any script:
+
+    from audio_devices import devices
+    mic = devices.input_device("usb")
+"""
+import contextlib
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+import sounddevice as sd
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent
+CACHE_FILE = BASE_DIR / "audio_devices.json"
+
+# AURA_MIC / AURA_SPEAKER override the patterns passed in by the scripts
+INPUT_PATTERN = os.environ.get("AURA_MIC")
+OUTPUT_PATTERN = os.environ.get("AURA_SPEAKER")
+
+
+def boot_id() -> str:
+    try:
+        return Path("/proc/sys/kernel/random/boot_id").read_text().strip()
+    except OSError:
+        return ""
+
+
+class AudioDeviceManager:
+    def __init__(self, cache_file: Path = CACHE_FILE):
+        self.cache_file = Path(cache_file)
+        self._lock = threading.Lock()
+        self._resolved = {}  # (kind, pattern) -> {"index": int, "name": str}
+        self._hotplug = None
+        self._open_streams = 0     # PortAudio streams opened through stream_open()
+        self._reinit_pending = False  # a hotplug event arrived; re-init PortAudio when idle
+        self._unmatched = set()
+        self._load()
+
+    # ----- persistence -----
+    def _load(self):
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("boot_id") != boot_id():
+            return
+        for key, entry in data.get("devices", {}).items():
+            if entry.get("index") is None:  # written by older versions; resolve again
+                continue
+            if not self._same_device(entry):
+                logger.info(f"Cached device {entry['index']} is no longer {entry.get('name')!r}, resolving again")
+                continue
+            kind, _, pattern = key.partition(":")
+            self._resolved[(kind, pattern)] = entry
+
+    @staticmethod
+    def _same_device(entry: dict) -> bool:
+        # one device lookup, not a full enumeration
+        try:
+            return sd.query_devices(entry["index"])["name"] == entry.get("name")
+        except (sd.PortAudioError, ValueError, TypeError):
+            return False
+
+    def _save(self):
+        data = {
+            "boot_id": boot_id(),
+            "devices": {f"{kind}:{pattern}": entry for (kind, pattern), entry in self._resolved.items()},
+        }
+        try:
+            self.cache_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not write {self.cache_file}: {e}")
+
+    # ----- resolution -----
+    def _enumerate(self, kind: str, pattern: str) -> Optional[dict]:
+        channels_key = "max_input_channels" if kind == "input" else "max_output_channels"
+        regex = re.compile(pattern, re.IGNORECASE) if pattern else None
+        for index, device in enumerate(sd.query_devices()):
+            if device[channels_key] <= 0:
+                continue
+            if regex is None or regex.search(device["name"]):
+                return {"index": index, "name": device["name"]}
+        return None
+
+    def resolve(self, kind: str = "input", pattern: Optional[str] = None) -> Optional[int]:
+        """
+        Index of the first input/output device whose name matches pattern.
+        None means "use the system default" (no pattern, or nothing matched).
+        """
+        override = INPUT_PATTERN if kind == "input" else OUTPUT_PATTERN
+        pattern = override or pattern or ""
+        key = (kind, pattern)
+        with self._lock:
+            entry = self._resolved.get(key)
+            if entry is None and pattern:
+                self._reinit_if_idle()
+                entry = self._enumerate(kind, pattern)
+                if entry is None:
+                    # not cached: the device may just be late (USB mic still enumerating)
+                    if key not in self._unmatched:
+                        logger.warning(f"No {kind} device matches '{pattern}', using the default device")
+                        self._unmatched.add(key)
+                    return None
+                logger.info(f"Resolved {kind} device '{pattern}' -> {entry['index']}: {entry['name']}")
+                self._unmatched.discard(key)
+                self._resolved[key] = entry
+                self._save()
+            return entry["index"] if entry is not None else None
+
+    def input_device(self, pattern: Optional[str] = None) -> Optional[int]:
+        return self.resolve("input", pattern)
+
+    def output_device(self, pattern: Optional[str] = None) -> Optional[int]:
+        return self.resolve("output", pattern)
+
+    def name(self, kind: str = "input", pattern: Optional[str] = None) -> str:
+        self.resolve(kind, pattern)
+        override = INPUT_PATTERN if kind == "input" else OUTPUT_PATTERN
+        entry = self._resolved.get((kind, override or pattern or ""))
+        return entry["name"] if entry is not None else "default"
+
+    def invalidate(self):
+        """Forget every resolved device; the next lookup enumerates again."""
+        with self._lock:
+            self._resolved.clear()
+            self._save()
+        logger.info("Audio device cache invalidated")
+
+    def with_input_device(self, fn: Callable[[Optional[int]], object], pattern: Optional[str] = None):
+        """
+        Call fn(device_index). If opening the device fails, re-resolve once and
+        retry when the device moved (e.g. the USB mic re-enumerated).
+        """
+        device = self.input_device(pattern)
+        try:
+            with self.stream_open():
+                return fn(device)
+        except sd.PortAudioError as e:  # not fn's own errors: those would repeat the recording
+            # the stream is closed again, so PortAudio may re-init and list the devices afresh
+            self._reinit_pending = True
+            self.invalidate()
+            new_device = self.input_device(pattern)
+            if new_device == device:
+                raise
+            logger.warning(f"Input device {device} failed ({e}), retrying with {new_device}")
+            with self.stream_open():
+                return fn(new_device)
+
+    def stream_opened(self):
+        """Call when a PortAudio stream opens (and stream_closed() after): no re-init happens in between."""
+        with self._lock:
+            self._open_streams += 1
+
+    def stream_closed(self):
+        with self._lock:
+            self._open_streams = max(0, self._open_streams - 1)
+
+    @contextlib.contextmanager
+    def stream_open(self):
+        """stream_opened()/stream_closed() around a block."""
+        self.stream_opened()
+        try:
+            yield
+        finally:
+            self.stream_closed()
+
+    def _reinit_if_idle(self):
+        # PortAudio only sees new devices after a re-init, which would kill any
+        # open stream; so it waits for a lookup with none open (caller holds the lock)
+        if not self._reinit_pending or self._open_streams:
+            return
+        self._reinit_pending = False
+        try:
+            sd._terminate()
+            sd._initialize()
+        except Exception as e:
+            logger.warning(f"Could not re-initialize PortAudio: {e}")
+
+    # ----- hotplug -----
+    def watch_hotplug(self) -> bool:
+        """Invalidate the cache on udev sound events. Returns False without pyudev."""
+        if self._hotplug is not None:
+            return True
+        try:
+            import pyudev
+        except ImportError:
+            return False
+
+        monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        monitor.filter_by(subsystem="sound")
+
+        def on_event(action, device):
+            if action in ("add", "remove"):
+                logger.info(f"Sound device {action}: {device.sys_name}")
+                self._reinit_pending = True  # done by the next resolve() with no stream open
+                self.invalidate()
+
+        self._hotplug = pyudev.MonitorObserver(monitor, on_event, name="audio-hotplug")
+        self._hotplug.daemon = True
+        self._hotplug.start()
+        return True
+
+
+devices = AudioDeviceManager()
@@ -0,0 +1,8 @@
+from .scheduler import AnimationScheduler
+from .starfield import CLASSIC, DEEP, SpaceBackground, Starfield
+from .orb import AuraCore, OrbRenderer, PulseOrb
+from .button import GLOW_STYLE, VIOLET_STYLE, GlowButton
+from .camera_view import CameraView
+from .presets import PRESETS, AuraConfig
+from .window import AuraMain, run
+from .jobs import EnrollJob, JobRunner, PrerenderJob, ReindexJob, RetrainJob
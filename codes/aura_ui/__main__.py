@@ -0,0 +1,24 @@
+"""
+Open the AURA window for a preset (run from the codes/ folder):
+
+    python -m aura_ui            # t3
+    python -m aura_ui t6
+    python -m aura_ui mg
+"""
+import sys
+
+from .presets import PRESETS
+from .window import run
+
+
+def main(argv):
+    name = argv[0] if argv else "t3"
+    if name in ("-h", "--help") or name not in PRESETS:
+        print(__doc__)
+        print("presets:", ", ".join(PRESETS))
+        return 0 if name in ("-h", "--help") else 2
+    return run(PRESETS[name])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
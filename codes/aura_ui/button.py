@@ -0,0 +1,125 @@
+"""
+The glowing AURA menu button.
+
+The old GlowButton animated a `_scale_prop` whose setter called
+setStyleSheet(base_stylesheet(scale=v)): every step of the 220 ms hover
+animation formatted a large CSS string and made Qt re-parse it and re-polish
+the button. The `transform: scale()` it set isn't a Qt stylesheet property
+either, so all that work only printed "Unknown property transform".
+
+Here the stylesheet is built once (GLOW_STYLE) and the hover grows the button
+in paintEvent with a painter transform; an animation step is just update().
+The glow is still the drop-shadow effect's blur radius.
+
+GLOW_STYLE is the blue look of t3/t6/test2/mg, VIOLET_STYLE the purple one of
+aarav_gui/mohit_gui.
+"""
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+HOVER_MS = 220
+HOVER_SCALE = 1.03  # size on hover relative to rest
+PRESS_DIP = 0.02    # shrink while pressed
+GLOW_BLUR = 36
+
+GLOW_STYLE = """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 rgba(10, 40, 90, 220),
+        stop:1 rgba(25, 90, 160, 240));
+    border: 2px solid rgba(30,150,255,0.35);
+    border-radius: 18px;
+    padding: 10px 18px;
+    color: rgb(235,245,255);
+    font-size: 24px;
+    font-weight: 600;
+    letter-spacing: 0.6px;
+    text-align: center;
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 rgba(20, 70, 140, 240),
+        stop:1 rgba(70, 150, 255, 255));
+    border: 2px solid rgba(80,200,255,0.70);
+}
+"""
+
+VIOLET_STYLE = """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 rgba(40,0,60,200), stop:1 rgba(80,0,100,240));
+    border: 2px solid rgba(170,0,255,0.3);
+    border-radius: 18px;
+    padding: 10px 18px;
+    color: rgb(240,230,255);
+    font-size: 24px;
+    font-weight: 600;
+    letter-spacing: 0.6px;
+    text-align: center;
+}
+"""
+
+
+class GlowButton(QtWidgets.QPushButton):
+    def __init__(self, text, parent=None, height=50, min_width=100, style=GLOW_STYLE):
+        super().__init__(text, parent)
+        self.setFixedHeight(height)
+        self.setMinimumWidth(min_width)
+        self.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.setFocusPolicy(QtCore.Qt.NoFocus)
+
+        self.shadow = QtWidgets.QGraphicsDropShadowEffect(self)
+        self.shadow.setOffset(0, 0)
+        self.shadow.setBlurRadius(0)
+        self.shadow.setColor(QtGui.QColor(170, 0, 255, 160))
+        self.setGraphicsEffect(self.shadow)
+
+        self._scale = 1.0
+        self.anim_group = QtCore.QParallelAnimationGroup(self)
+        self.blur_anim = QtCore.QPropertyAnimation(self.shadow, b"blurRadius")
+        self.scale_anim = QtCore.QPropertyAnimation(self, b"_scale_prop")
+
+        for anim in (self.blur_anim, self.scale_anim):
+            anim.setDuration(HOVER_MS)
+            anim.setEasingCurve(QtCore.QEasingCurve.OutCubic)
+        self.anim_group.addAnimation(self.blur_anim)
+        self.anim_group.addAnimation(self.scale_anim)
+
+        self.setStyleSheet(style)
+
+    def get_scale(self):
+        return self._scale
+
+    def set_scale(self, v):
+        self._scale = v
+        self.update()
+
+    _scale_prop = QtCore.pyqtProperty(float, fget=get_scale, fset=set_scale)
+
+    def _animate(self, blur, scale):
+        self.anim_group.stop()
+        self.blur_anim.setStartValue(self.shadow.blurRadius())
+        self.blur_anim.setEndValue(blur)
+        self.scale_anim.setStartValue(self._scale)
+        self.scale_anim.setEndValue(scale)
+        self.anim_group.start()
+
+    def enterEvent(self, e):
+        self._animate(GLOW_BLUR, HOVER_SCALE)
+        super().enterEvent(e)
+
+    def leaveEvent(self, e):
+        self._animate(0, 1.0)
+        super().leaveEvent(e)
+
+    def paintEvent(self, e):
+        # at rest the button is drawn HOVER_SCALE times smaller than its rect, so it can grow into it
+        scale = (self._scale - (PRESS_DIP if self.isDown() else 0.0)) / HOVER_SCALE
+        p = QtWidgets.QStylePainter(self)
+        p.setRenderHint(QtGui.QPainter.Antialiasing)
+        centre = QtCore.QRectF(self.rect()).center()
+        p.translate(centre)
+        p.scale(scale, scale)
+        p.translate(-centre)
+        opt = QtWidgets.QStyleOptionButton()
+        self.initStyleOption(opt)
+        p.drawControl(QtWidgets.QStyle.CE_PushButton, opt)
@@ -0,0 +1,76 @@
+"""
+Live camera view for the AURA window, fed by the recognizer service through
+shared memory (vision/frames.py).
+
+The frame in shared memory is wrapped as a QImage without copying (BGR888,
+so no colour conversion either) and drawn straight into the widget. A cheap
+timer only compares the ring's sequence number; the widget repaints when a
+new frame has actually arrived.
+"""
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from vision.frames import FRAME_RING, FrameRing
+
+# Format_BGR888 arrived in Qt 5.14; older Qt needs a swapped copy per paint
+BGR888 = getattr(QtGui.QImage, "Format_BGR888", None)
+
+
+class CameraView(QtWidgets.QWidget):
+    def __init__(self, ring_name=FRAME_RING, poll_ms=10, parent=None):
+        super().__init__(parent)
+        self.ring_name = ring_name
+        self.ring = None
+        self.seq = -1
+        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent)  # we paint every pixel
+        self.setMinimumSize(320, 240)
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(poll_ms)
+        self.timer.timeout.connect(self.poll)
+
+    def start(self):
+        self.seq = -1
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+        self.update()
+
+    def poll(self):
+        if self.ring is None:
+            try:
+                self.ring = FrameRing.attach(self.ring_name)
+            except FileNotFoundError:
+                return  # recognizer hasn't created the ring yet
+        seq = self.ring.latest_seq()
+        if seq != self.seq:
+            self.seq = seq
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), QtCore.Qt.black)
+        pinned = self.ring.pin_latest() if self.ring is not None else None
+        if pinned is None:
+            return
+        try:
+            frame, _ = pinned
+            h, w = frame.shape[:2]
+            if BGR888 is not None:
+                image = QtGui.QImage(frame.data, w, h, w * 3, BGR888)
+            else:
+                image = QtGui.QImage(frame.data, w, h, w * 3, QtGui.QImage.Format_RGB888).rgbSwapped()
+            # letterbox into the widget, scaled by the paint engine (no intermediate image)
+            scale = min(self.width() / w, self.height() / h)
+            target = QtCore.QRectF(0, 0, w * scale, h * scale)
+            target.moveCenter(QtCore.QRectF(self.rect()).center())
+            painter.drawImage(target, image)
+        finally:
+            painter.end()
+            self.ring.unpin()
+
+    def closeEvent(self, event):
+        self.stop()
+        super().closeEvent(event)
@@ -0,0 +1,228 @@
+"""
+Background jobs for the AURA window, run on the Qt thread pool.
+
+Each job asks a resident service to do the work (services/) and then follows
+it from a pool thread, so the GUI thread never waits on a socket:
+
+    EnrollJob(services, name)   capture a person's faces (progress: faces / 300)
+    RetrainJob(services)        retrain the recognizer (progress: people loaded, training)
+    ReindexJob(services)        re-read the knowledge file, encode new FAQ questions
+    PrerenderJob(services)      synthesize the welcome and fixed prompts
+
+    jobs = JobRunner(parent=self)
+    jobs.progress.connect(lambda key, pct, message: ...)
+    jobs.submit(EnrollJob(services, "Asha"), on_done=lambda status: ...)
+    jobs.cancel("enroll")
+
+A job with the same key as one still running is not started again; submit()
+returns the running one and on_done is called when it finishes. The services
+deduplicate too, so a retrain the enroller already started is followed, not
+repeated. on_done(status) gets status["state"] "done", "error" or "cancelled".
+"""
+import threading
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from services import ServiceError
+
+POLL_S = 0.25
+THREADS = 4  # jobs mostly wait on a service; one thread each so none queues behind another
+READY_TIMEOUT_S = 120.0  # how long a job waits for its service to finish loading
+
+
+class JobSignals(QObject):
+    progress = pyqtSignal(str, int, str)  # key, percent (-1 if unknown), message
+    finished = pyqtSignal(str, dict)      # key, final status
+
+
+class Job(QRunnable):
+    kind = "job"
+    service = None
+
+    def __init__(self, services):
+        super().__init__()
+        self.services = services
+        self.signals = JobSignals()
+        self.cancel_event = threading.Event()
+        self.ticket = None
+
+    @property
+    def key(self):
+        return self.kind
+
+    # ----- for subclasses -----
+    def begin(self):
+        """Ask the service to start; returns the id to follow."""
+        raise NotImplementedError
+
+    def poll(self):
+        """Current status: {"state": running | done | error | cancelled, "progress", "message"}."""
+        raise NotImplementedError
+
+    def stop(self):
+        """Ask the service to stop the work."""
+
+    # ----- running -----
+    def cancel(self):
+        self.cancel_event.set()
+
+    def wait_ready(self):
+        """Wait (cancellably) until the service has finished loading its models."""
+        waited = 0.0
+        while not self.cancel_event.is_set():
+            state = self.services.status(self.service).get("state")
+            if state not in ("loading", "stopped"):
+                return
+            if waited >= READY_TIMEOUT_S:
+                raise ServiceError(f"The {self.service} service is not ready")
+            self.signals.progress.emit(self.key, -1, f"Waiting for the {self.service} service...")
+            self.cancel_event.wait(POLL_S * 4)
+            waited += POLL_S * 4
+
+    def run(self):
+        status = {"state": "error", "message": ""}
+        try:
+            self.wait_ready()
+            if not self.cancel_event.is_set():
+                self.ticket = self.begin()
+            stopping = False
+            while self.ticket is not None:
+                if self.cancel_event.is_set() and not stopping:
+                    self.stop()
+                    stopping = True
+                status = self.poll()
+                if status["state"] != "running":
+                    break
+                progress = status.get("progress")
+                self.signals.progress.emit(self.key, -1 if progress is None else int(progress * 100),
+                                           status.get("message", ""))
+                if stopping:
+                    time.sleep(POLL_S)  # wait for the service to wind down
+                else:
+                    self.cancel_event.wait(POLL_S)
+            if self.ticket is None:
+                status = {"state": "cancelled", "message": f"{self.kind} cancelled"}
+            elif stopping and status["state"] != "error":
+                status["state"] = "cancelled"
+        except Exception as e:
+            status = {"state": "error", "message": str(e)}
+        self.signals.finished.emit(self.key, status)
+
+
+class ServiceJob(Job):
+    """The service's main job (one at a time, e.g. enrollment), followed through "status"."""
+
+    def begin(self):
+        return self.services.call(self.service, "start", **self.args())["job"]
+
+    def args(self):
+        return {}
+
+    def poll(self):
+        status = self.services.status(self.service)
+        if status.get("state") == "stopped":
+            return {"state": "error", "message": f"The {self.service} service stopped"}
+        if status.get("finished_job", 0) < self.ticket:
+            return {"state": "running", "progress": status.get("progress"), "message": status.get("message", "")}
+        return {"state": "done" if status.get("state") == "idle" else "error", "message": status.get("message", "")}
+
+    def stop(self):
+        self.services.call(self.service, "stop")
+
+
+class TaskJob(Job):
+    """A background task inside a service, followed through "task_status"."""
+
+    task = None
+
+    def begin(self):
+        return self.services.call(self.service, "task", kind=self.task, **self.args())["task"]
+
+    def args(self):
+        return {}
+
+    def poll(self):
+        try:
+            return self.services.call(self.service, "task_status", task=self.ticket)
+        except ServiceError as e:
+            return {"state": "error", "message": str(e)}
+
+    def stop(self):
+        self.services.call(self.service, "cancel", task=self.ticket)
+
+
+class EnrollJob(ServiceJob):
+    kind = "enroll"
+    service = "enroller"
+
+    def __init__(self, services, name):
+        super().__init__(services)
+        self.name = name
+
+    def args(self):
+        return {"name": self.name}
+
+
+class RetrainJob(TaskJob):
+    kind = "retrain"
+    service = "recognizer"
+    task = "retrain"
+
+
+class ReindexJob(TaskJob):
+    kind = "reindex"
+    service = "voice"
+    task = "reindex"
+
+
+class PrerenderJob(TaskJob):
+    kind = "prerender"
+    service = "voice"
+    task = "prerender"
+
+
+class JobRunner(QObject):
+    progress = pyqtSignal(str, int, str)  # key, percent (-1 if unknown), message
+    busy = pyqtSignal(bool)               # True while any job runs
+
+    def __init__(self, threadpool=None, parent=None):
+        super().__init__(parent)
+        if threadpool is None:
+            threadpool = QThreadPool(self)
+            threadpool.setMaxThreadCount(THREADS)
+        self.pool = threadpool
+        self.jobs = {}  # key -> (job, [on_done])
+
+    def submit(self, job, on_done=None):
+        """Start job, or join the running job with the same key; returns the job that runs."""
+        if job.key in self.jobs:
+            running, callbacks = self.jobs[job.key]
+            if on_done is not None:
+                callbacks.append(on_done)
+            return running
+        if not self.jobs:
+            self.busy.emit(True)
+        self.jobs[job.key] = (job, [on_done] if on_done is not None else [])
+        job.signals.progress.connect(self.progress)
+        job.signals.finished.connect(self._finished)
+        self.pool.start(job)
+        return job
+
+    def running(self, key):
+        return key in self.jobs
+
+    def cancel(self, key):
+        if key in self.jobs:
+            self.jobs[key][0].cancel()
+
+    def cancel_all(self):
+        for job, _ in self.jobs.values():
+            job.cancel()
+
+    def _finished(self, key, status):
+        _, callbacks = self.jobs.pop(key, (None, []))
+        for on_done in callbacks:
+            on_done(status)
+        if not self.jobs:
+            self.busy.emit(False)
@@ -0,0 +1,229 @@
+"""
+The pulsing AURA orb, drawn from cached sprites.
+
+The old AuraCore built three radial gradients and filled them with
+antialiasing on an 800x800 translucent widget every 16 ms. The gradients only
+change size with the pulse and brightness with an alpha factor, so
+OrbRenderer renders the glow and the core into pixmaps at a few size steps
+and each frame blits them with an opacity. The thin rings and the shimmer dot
+are still drawn as shapes. The sprites are dropped only when pulse_react()
+changes the colour.
+
+    core = AuraCore()                                           # t3, test2
+    core = AuraCore(size=(900, 800), core=450.0, halo_pad=100.0)  # t6
+
+PulseOrb is the simpler breathing orb of mg/aarav_gui/mohit_gui: one radial
+gradient scaled by the painter, which pops outwards on pulse_react().
+"""
+import math
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from metrics import metrics
+
+from .scheduler import AnimationScheduler
+
+GLOW_STEP = 12.0  # px of glow radius between sprites (soft edge, the steps don't show)
+CORE_STEP = 3.0   # px of core radius between sprites
+
+CORE_PULSE = 0.14  # core radius grows by up to 14%
+HALO_PULSE = 0.26  # halo radius grows by up to 26%
+GLOW_SPREAD = 1.1  # glow gradient reaches 10% past the halo
+
+
+def _sprite(radius, stops, ratio):
+    """Radial gradient filled into a transparent square pixmap of the given radius."""
+    side = 2 * max(1, math.ceil(radius * ratio))
+    pixmap = QtGui.QPixmap(side, side)
+    pixmap.fill(QtCore.Qt.transparent)
+    grad = QtGui.QRadialGradient(QtCore.QPointF(side / 2, side / 2), radius * ratio)
+    for at, color in stops:
+        grad.setColorAt(at, color)
+    p = QtGui.QPainter(pixmap)
+    p.setRenderHint(QtGui.QPainter.Antialiasing)
+    p.setPen(QtCore.Qt.NoPen)
+    p.setBrush(grad)
+    p.drawEllipse(QtCore.QPointF(side / 2, side / 2), radius * ratio, radius * ratio)
+    p.end()
+    pixmap.setDevicePixelRatio(ratio)
+    return pixmap
+
+
+class OrbRenderer:
+    """Draws the orb; glow and core come from pixmaps cached per colour and size step.
+
+    Sprites are blitted unscaled (a scaled, filtered blit costs as much as the
+    gradient fill it replaces), so the radius snaps to GLOW_STEP / CORE_STEP.
+    They are built on first use, which spreads the cost over the first pulse.
+    """
+
+    def __init__(self, color, core=340.0, halo_pad=30.0):
+        self.color = QtGui.QColor(color)
+        self.r = core / 2.0
+        self.halo_pad = halo_pad
+        self.ratio = 1.0
+        self._sprites = {}  # (layer, step) -> pixmap
+
+    def set_color(self, color):
+        if QtGui.QColor(color) != self.color:
+            self.color = QtGui.QColor(color)
+            self._sprites.clear()
+
+    def _stops(self, layer):
+        """Gradient stops at full brightness; paint() fades the sprites with opacity."""
+        c = self.color
+        if layer == "glow":
+            return [
+                (0.0, QtGui.QColor(c.red(), c.green(), c.blue(), 120)),
+                (0.6, QtGui.QColor(60, 140, 220, 60)),
+                (1.0, QtGui.QColor(0, 0, 0, 0)),
+            ]
+        return [
+            (0.0, QtGui.QColor(220, 245, 255, 200)),
+            (0.55, QtGui.QColor(c.red(), c.green(), c.blue(), 200)),
+            (1.0, QtGui.QColor(0, 0, 0, 0)),
+        ]
+
+    def _blit(self, p, layer, cx, cy, radius, opacity):
+        step = GLOW_STEP if layer == "glow" else CORE_STEP
+        key = (layer, round(radius / step))
+        pixmap = self._sprites.get(key)
+        if pixmap is None:
+            pixmap = self._sprites[key] = _sprite(key[1] * step, self._stops(layer), self.ratio)
+        half = pixmap.width() / (2 * self.ratio)
+        p.setOpacity(opacity)
+        p.drawPixmap(QtCore.QPoint(round(cx - half), round(cy - half)), pixmap)
+
+    def paint(self, p, cx, cy, phase, saturn_angle, ratio=1.0):
+        if ratio != self.ratio:
+            self.ratio = ratio
+            self._sprites.clear()
+        p.setRenderHint(QtGui.QPainter.Antialiasing)
+
+        t = (math.sin(phase) + 1.0) / 2.0
+        eased = t * t * (3 - 2 * t)
+        core_r = self.r * (1.0 + CORE_PULSE * eased)
+        halo_r = self.r * (1.0 + HALO_PULSE * (0.5 + 0.5 * math.sin(phase * 0.9))) + self.halo_pad
+
+        ring_color = QtGui.QColor(self.color)
+        ring_color.setAlpha(max(20, int(80 + 40 * math.sin(phase * 1.1))))
+        pen = QtGui.QPen(ring_color, 4, QtCore.Qt.SolidLine)
+        pen.setCosmetic(True)
+        p.setPen(pen)
+        p.setBrush(QtCore.Qt.NoBrush)
+        p.drawEllipse(QtCore.QPointF(cx, cy), halo_r, halo_r)
+
+        self._blit(p, "glow", cx, cy, halo_r * GLOW_SPREAD, 0.5 + 0.5 * eased)
+        self._blit(p, "core", cx, cy, core_r, 0.75 + 0.25 * eased)
+        p.setOpacity(1.0)
+
+        shimmer_r = core_r * 0.22
+        p.setPen(QtCore.Qt.NoPen)
+        p.setBrush(QtGui.QColor(255, 255, 255, int(190 + 40 * math.sin(phase * 2.8))))
+        p.drawEllipse(QtCore.QPointF(cx, cy), shimmer_r, shimmer_r)
+
+        p.save()
+        p.translate(cx, cy)
+        p.rotate(saturn_angle)
+        ring_w = core_r * 1.4
+        ring_h = core_r * 0.35
+        ring_pen = QtGui.QPen(QtGui.QColor(255, 255, 255, 40), 2)
+        ring_pen.setCosmetic(True)
+        p.setPen(ring_pen)
+        p.setBrush(QtCore.Qt.NoBrush)
+        p.drawEllipse(QtCore.QRectF(-ring_w, -ring_h / 2.0, ring_w * 2.0, ring_h))
+        p.restore()
+
+
+class AuraCore(QtWidgets.QLabel):
+    def __init__(self, size=(800, 800), core=340.0, halo_pad=30.0, interval_ms=16):
+        super().__init__()
+        self.setFixedSize(*size)
+        self.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
+
+        self.base_color = QtGui.QColor(100, 220, 255)
+        self.renderer = OrbRenderer(self.base_color, core=core, halo_pad=halo_pad)
+        self.phase = 0.0
+        self.speed = 0.045
+        self.saturn_angle = 0.0
+        self.animation = AnimationScheduler.instance().register(self.animate_pulse, interval_ms, owner=self)
+
+    def animate_pulse(self, steps=1.0):
+        self.phase += self.speed * steps
+        self.saturn_angle = (self.saturn_angle + 0.45 * steps) % 360
+        self.update()
+
+    @metrics.timed("paint_orb")
+    def paintEvent(self, e):
+        p = QtGui.QPainter(self)
+        self.renderer.paint(p, self.width() / 2.0, self.height() / 2.0, self.phase, self.saturn_angle,
+                            self.devicePixelRatioF())
+        p.end()
+
+    def pulse_react(self, color: QtGui.QColor):
+        self.base_color = color
+        self.renderer.set_color(color)
+        self.phase += 0.6
+
+
+class PulseOrb(QtWidgets.QLabel):
+    def __init__(self, size=(420, 420), orb=320.0, color=(100, 220, 255), interval_ms=30):
+        super().__init__()
+        self.setFixedSize(*size)
+        self.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
+
+        self.orb = orb
+        self._color = QtGui.QColor(*color)
+        self._opacity = 180
+        self._scale = 1.0
+        self.phase = 0.0
+        self.speed = 0.04
+        self.animation = AnimationScheduler.instance().register(self.animate_pulse, interval_ms, owner=self)
+
+    def animate_pulse(self, steps=1.0):
+        self.phase += self.speed * steps
+        self._scale = 1.0 + 0.12 * math.sin(self.phase)
+        self._opacity = 130 + 110 * (1 + math.sin(self.phase)) / 2
+        self.update()
+
+    @metrics.timed("paint_orb")
+    def paintEvent(self, e):
+        p = QtGui.QPainter(self)
+        p.setRenderHint(QtGui.QPainter.Antialiasing)
+        cx = self.width() / 2
+        cy = self.height() / 2
+        p.translate(cx, cy)
+        p.scale(self._scale, self._scale)
+
+        # brighter as it grows, dimmer as it shrinks
+        brightness = min(1.8, max(0.6, 1.0 + (self._scale - 1.0) * 2.5))
+        c = QtGui.QColor(*(min(int(v * brightness), 255) for v in self._color.getRgb()[:3]))
+        r = self.orb / 2
+        grad = QtGui.QRadialGradient(QtCore.QPointF(0, 0), r)
+        grad.setColorAt(0.0, QtGui.QColor(c.red(), c.green(), c.blue(), int(self._opacity)))
+        grad.setColorAt(0.5, QtGui.QColor(c.red(), c.green(), c.blue(), 180))
+        grad.setColorAt(0.8, QtGui.QColor(c.red(), c.green(), c.blue(), 80))
+        grad.setColorAt(1.0, QtGui.QColor(0, 0, 0, 0))
+        p.setBrush(grad)
+        p.setPen(QtCore.Qt.NoPen)
+        p.drawEllipse(QtCore.QPointF(0, 0), r, r)
+        p.end()
+
+    def pulse_react(self, color: QtGui.QColor):
+        self._color = QtGui.QColor(color)
+        anim = QtCore.QPropertyAnimation(self, b"geometry", self)
+        anim.setDuration(600)
+        start_rect = self.geometry()
+        anim.setEasingCurve(QtCore.QEasingCurve.OutCubic)
+        anim.setStartValue(start_rect)
+        anim.setEndValue(start_rect.adjusted(-25, -25, 25, 25))
+        anim.finished.connect(lambda: self.reset_pulse(start_rect))
+        anim.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
+
+    def reset_pulse(self, rect):
+        anim = QtCore.QPropertyAnimation(self, b"geometry", self)
+        anim.setDuration(800)
+        anim.setEasingCurve(QtCore.QEasingCurve.InOutCubic)
+        anim.setStartValue(self.geometry())
+        anim.setEndValue(rect)
+        anim.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
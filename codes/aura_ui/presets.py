@@ -0,0 +1,203 @@
+"""
+Window configurations for the AURA launchers.
+
+AuraConfig holds every knob of the AURA window (defaults are the t3 layout);
+each launcher is one subclass overriding what differs. PRESETS maps the
+launcher names to them (python -m aura_ui <name>, bench/bench_ui.py).
+"""
+from PyQt5.QtCore import Qt
+
+from .button import GLOW_STYLE, VIOLET_STYLE
+from .starfield import CLASSIC, DEEP
+
+EXIT_STYLE = """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 rgba(120,0,60,220), stop:1 rgba(200,0,100,255));
+    border: 2px solid rgba(255,120,120,0.6);
+    border-radius: 12px;
+    color: rgb(255,230,230);
+    font-size: 18px;
+    font-weight: 700;
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 rgba(150,0,80,240), stop:1 rgba(255,80,80,255));
+}
+"""
+
+BIG_EXIT_STYLE = """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 rgba(100,0,60,220), stop:1 rgba(200,0,100,255));
+    border: 2px solid rgba(255,120,120,0.6);
+    border-radius: 14px;
+    color: rgb(255,230,230);
+    font-size: 22px;
+    font-weight: 700;
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 rgba(150,0,80,240), stop:1 rgba(255,80,80,255));
+}
+"""
+
+BLUE_TITLE = """
+    color: #87BFFF;
+    letter-spacing: 8px;
+"""
+
+STATUS_STYLE = """
+    font-size: 20px;
+    font-weight: 600;
+    color: rgba(180,220,255,0.9);
+    letter-spacing: 1px;
+"""
+
+BIG_STATUS_STYLE = """
+    font-size: 28px;
+    font-weight: 600;
+    color: rgba(150,200,255,0.8);
+    letter-spacing: 2px;
+"""
+
+
+class AuraConfig:
+    WINDOW_TITLE = "AURA — Interface"
+    WINDOW_SIZE = (1280, 800)  # before showMaximized()
+
+    # animation rates; the scheduler drops to IDLE_FPS/BUSY_FPS on its own
+    FPS = 60
+    IDLE_FPS = 10
+    BUSY_FPS = 20
+
+    STAR_COUNT = 1505
+    STAR_STYLE = DEEP
+    STAR_INTERVAL_MS = 60
+
+    ORB = "sprites"            # "sprites": AuraCore, "pulse": PulseOrb
+    ORB_SIZE = (800, 800)      # widget size
+    ORB_DIAMETER = 340.0       # the core (sprites) / the whole orb (pulse)
+    ORB_HALO_PAD = 30.0        # sprites only
+    ORB_COLOR = (100, 220, 255)  # pulse only; AuraCore starts in the same cyan
+    ORB_INTERVAL_MS = 16
+    ORB_ALIGN = Qt.AlignLeft | Qt.AlignTop
+    ORB_POSITION = None        # (x, y) on the overlay instead of beside the buttons
+
+    MARGINS = (28, 18, 28, 18)
+    SPACING = 16
+    ALIGN = Qt.AlignTop | Qt.AlignHCenter
+    CONTROLS_ALIGN = Qt.AlignTop | Qt.AlignHCenter
+    CONTROLS_MARGINS = (220, 0, 0, 0)
+    CONTROLS_SPACING = 40
+    ORB_GAP = 240              # between the orb and the button column
+
+    TITLE = "AURA"
+    TITLE_FONT = "Centauri"    # codes/Centauri/Centauri.ttf, else Segoe UI
+    TITLE_SIZE = 72
+    TITLE_STYLE = BLUE_TITLE
+    STATUS_STYLE = STATUS_STYLE
+
+    # (action, label): start, train, manage, listen
+    BUTTONS = (("start", "Recog"), ("train", "Train"), ("manage", "Data"), ("listen", "Ask"))
+    BUTTON_HEIGHT = 50
+    BUTTON_MIN_WIDTH = 100
+    BUTTON_SPACING = 18
+    BUTTON_STYLE = GLOW_STYLE
+
+    EXIT_LABEL = None          # floating bottom-right exit button, None for none
+    EXIT_SIZE = (120, 44)
+    EXIT_MARGIN = 28
+    EXIT_STYLE = EXIT_STYLE
+
+
+class T3(AuraConfig):
+    pass
+
+
+class T6(AuraConfig):
+    STAR_COUNT = 2005
+    ORB_SIZE = (900, 800)
+    ORB_DIAMETER = 450.0
+    ORB_HALO_PAD = 100.0
+    ORB_POSITION = (210, 30)
+    MARGINS = (28, -120, 28, 18)
+    CONTROLS_MARGINS = (1100, 150, 0, 0)
+    TITLE_SIZE = 90
+    TITLE_STYLE = BLUE_TITLE.replace("8px", "30px")
+
+
+class Test2(AuraConfig):
+    STAR_COUNT = 2505
+    CONTROLS_ALIGN = Qt.AlignHCenter
+    CONTROLS_MARGINS = (160, 0, 80, 20)
+    ORB_ALIGN = Qt.AlignLeft | Qt.AlignVCenter
+    EXIT_LABEL = "Exit"
+
+
+class MG(AuraConfig):
+    WINDOW_SIZE = (1024, 600)
+    STAR_COUNT = 145
+    STAR_STYLE = CLASSIC
+    STAR_INTERVAL_MS = 100
+    ORB = "pulse"
+    ORB_SIZE = (420, 420)
+    ORB_DIAMETER = 320.0
+    ORB_INTERVAL_MS = 30
+    ORB_ALIGN = Qt.AlignLeft | Qt.AlignVCenter
+    MARGINS = (32, 32, 32, 32)
+    SPACING = 20
+    ALIGN = Qt.AlignCenter
+    CONTROLS_ALIGN = Qt.AlignHCenter
+    CONTROLS_MARGINS = (220, 0, 60, 40)
+    CONTROLS_SPACING = 100
+    ORB_GAP = 300
+    TITLE_SIZE = 110
+    TITLE_STYLE = """
+    color: #1C6EDC;
+    letter-spacing: 10px;
+"""
+    STATUS_STYLE = BIG_STATUS_STYLE
+    BUTTONS = (("start", "Start recognition"), ("train", "Train data"), ("manage", "Manage dataset"),
+               ("listen", "Listen"))
+    BUTTON_HEIGHT = 70
+    BUTTON_MIN_WIDTH = 300
+    BUTTON_SPACING = 25
+    EXIT_LABEL = "Exit"
+    EXIT_SIZE = (120, 45)
+    EXIT_MARGIN = 40
+    EXIT_STYLE = BIG_EXIT_STYLE
+
+
+class Mohit(MG):
+    ORB_SIZE = (320, 320)
+    ORB_COLOR = (38, 103, 255)
+    CONTROLS_MARGINS = (220, 40, 60, 40)
+    TITLE_STYLE = """
+    color: #A020F0;
+    letter-spacing: 10px;
+"""
+    BUTTON_STYLE = VIOLET_STYLE
+
+
+class Aarav(Mohit):
+    WINDOW_SIZE = (1280, 800)
+    ORB_SIZE = (540, 540)
+    ORB_DIAMETER = 540.0
+    TITLE_FONT = "Segoe UI"
+    BUTTONS = (("start", "🧠  Start recognition"), ("train", "⚙️  Train data"),
+               ("manage", "📁  Manage dataset"), ("listen", "🎧  Listen"))
+    BUTTON_HEIGHT = 110
+    BUTTON_MIN_WIDTH = 500
+    EXIT_LABEL = "⏻  Exit"
+    EXIT_SIZE = (160, 60)
+
+
+PRESETS = {
+    "t3": T3,
+    "t6": T6,
+    "test2": Test2,
+    "mg": MG,
+    "mohit_gui": Mohit,
+    "aarav_gui": Aarav,
+}
@@ -0,0 +1,217 @@
+"""
+One clock for the AURA GUI animations.
+
+Every animated widget used to own a QTimer (the orb at 16 ms, the star
+background at 60/100 ms) that ran forever, minimised or not, and at full rate
+while face recognition or speech synthesis needed the CPU. Widgets now
+register a callback with the shared AnimationScheduler instead; one timer
+ticks at the rate for the current mode and calls each widget at its own
+interval:
+
+    active   ACTIVE_MS  someone used the window recently
+    idle     IDLE_MS    no mouse/keyboard input for IDLE_AFTER_S
+    busy     BUSY_MS    a service job is running (set_busy) or other
+                        processes keep the CPU over BUSY_LOAD
+    paused   -          no watched window is visible/exposed
+
+Callbacks get `steps`, the number of nominal intervals that passed, so an
+animation keeps its speed in wall time when the rate drops:
+
+    animations = AnimationScheduler.instance()
+    animations.register(self.animate_pulse, 16, owner=self)   # animate_pulse(steps)
+    animations.watch(main_window)
+"""
+import os
+import time
+
+from PyQt5 import QtCore, QtWidgets
+
+ACTIVE_MS = 16
+BUSY_MS = 50
+IDLE_MS = 100
+IDLE_AFTER_S = 60.0
+PROBE_MS = 1000
+BUSY_LOAD = 0.6   # throttle above this share of all cores used by other processes...
+CALM_LOAD = 0.4   # ...and go back to full rate below this one
+MAX_STEPS = 4.0   # don't jump further than this after a stall
+
+INPUT_EVENTS = {
+    QtCore.QEvent.MouseButtonPress, QtCore.QEvent.MouseMove, QtCore.QEvent.KeyPress,
+    QtCore.QEvent.Wheel, QtCore.QEvent.TouchBegin,
+}
+WINDOW_EVENTS = {QtCore.QEvent.Show, QtCore.QEvent.Hide, QtCore.QEvent.WindowStateChange}
+
+
+class CpuProbe:
+    """CPU share (0..1 of all cores) used by other processes since the last sample.
+
+    Reads /proc/stat (Linux, the Pi); elsewhere uses psutil if it is installed.
+    sample() returns None when neither is available.
+    """
+
+    def __init__(self):
+        self.cores = os.cpu_count() or 1
+        self.last = self._read()
+
+    def _read(self):
+        busy = total = None
+        try:
+            with open("/proc/stat") as f:
+                fields = [int(v) for v in f.readline().split()[1:]]
+            idle = fields[3] + fields[4]  # idle + iowait
+            total = sum(fields[:8]) / os.sysconf("SC_CLK_TCK")
+            busy = total - idle / os.sysconf("SC_CLK_TCK")
+        except (OSError, ValueError, IndexError, AttributeError):
+            try:
+                import psutil
+            except ImportError:
+                return None
+            t = psutil.cpu_times()
+            total = sum(t)
+            busy = total - t.idle
+        return busy, total, time.process_time()
+
+    def sample(self):
+        now = self._read()
+        if now is None or self.last is None:
+            return None
+        busy, total, own = (a - b for a, b in zip(now, self.last))
+        self.last = now
+        if total <= 0:
+            return None
+        return max(0.0, (busy - own) / total)
+
+
+class AnimationScheduler(QtCore.QObject):
+    mode_changed = QtCore.pyqtSignal(str, int)  # mode, tick interval in ms (0 while paused)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """The scheduler shared by every widget in this process (needs a QApplication)."""
+        if cls._instance is None:
+            cls._instance = cls(parent=QtWidgets.QApplication.instance())
+        return cls._instance
+
+    def __init__(self, active_ms=ACTIVE_MS, busy_ms=BUSY_MS, idle_ms=IDLE_MS, idle_after=IDLE_AFTER_S,
+                 probe=None, parent=None):
+        super().__init__(parent)
+        self.rates = {"active": active_ms, "busy": busy_ms, "idle": idle_ms}
+        self.idle_after = idle_after
+        self.probe = probe if probe is not None else CpuProbe()
+        self.clients = []  # [callback, interval ms, ms since last call]
+        self.windows = []
+        self.busy_reasons = set()
+        self.cpu_busy = False
+        self.last_input = time.monotonic()
+        self.last_tick = None
+        self.mode = None
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        self.probe_timer = QtCore.QTimer(self)
+        self.probe_timer.timeout.connect(self.check)
+        self.probe_timer.start(PROBE_MS)
+
+    def set_rates(self, active_ms=ACTIVE_MS, busy_ms=BUSY_MS, idle_ms=IDLE_MS):
+        self.rates = {"active": active_ms, "busy": busy_ms, "idle": idle_ms}
+        if self.mode in self.rates:
+            self.timer.start(self.rates[self.mode])
+
+    def register(self, callback, interval_ms, owner=None):
+        """Call callback(steps) about every interval_ms; dropped when owner is destroyed."""
+        client = [callback, interval_ms, 0.0]
+        self.clients.append(client)
+        if owner is not None:
+            owner.destroyed.connect(lambda: self.unregister(client))
+        self.update_mode()
+        return client
+
+    def unregister(self, client):
+        if client in self.clients:
+            self.clients.remove(client)
+            self.update_mode()
+
+    def watch(self, window):
+        """Pause while this window is hidden/minimised; count input anywhere in the app as activity."""
+        self.windows.append(window)
+        window.installEventFilter(self)
+        window.destroyed.connect(lambda: self.windows.remove(window) if window in self.windows else None)
+        app = QtWidgets.QApplication.instance()
+        if len(self.windows) == 1 and app is not None:
+            app.installEventFilter(self)
+        self.update_mode()
+
+    def set_busy(self, reason, busy=True):
+        """Mark a CPU-heavy job (recognition, enrolment, TTS) as running or finished."""
+        if busy:
+            self.busy_reasons.add(reason)
+        else:
+            self.busy_reasons.discard(reason)
+        self.update_mode()
+
+    def eventFilter(self, obj, event):
+        kind = event.type()
+        if kind in INPUT_EVENTS:
+            self.last_input = time.monotonic()
+            if self.mode == "idle":
+                self.update_mode()
+        elif kind in WINDOW_EVENTS and obj in self.windows:
+            QtCore.QTimer.singleShot(0, self.update_mode)
+        return False
+
+    def _exposed(self, window):
+        if not window.isVisible() or window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        return handle is None or handle.isExposed()
+
+    def current_mode(self):
+        if not self.clients:
+            return "paused"
+        if self.windows and not any(self._exposed(w) for w in self.windows):
+            return "paused"
+        if self.busy_reasons or self.cpu_busy:
+            return "busy"
+        if time.monotonic() - self.last_input > self.idle_after:
+            return "idle"
+        return "active"
+
+    def update_mode(self):
+        mode = self.current_mode()
+        if mode == self.mode:
+            return
+        self.mode = mode
+        if mode == "paused":
+            self.timer.stop()
+            self.mode_changed.emit(mode, 0)
+            return
+        if not self.timer.isActive():
+            self.last_tick = time.monotonic()  # don't count the paused time as animation time
+        self.timer.start(self.rates[mode])
+        self.mode_changed.emit(mode, self.rates[mode])
+
+    def check(self):
+        """Slow timer: CPU load, idleness and exposure (covered windows send no events)."""
+        load = self.probe.sample()
+        if load is not None:
+            if self.cpu_busy and load < CALM_LOAD:
+                self.cpu_busy = False
+            elif not self.cpu_busy and load > BUSY_LOAD:
+                self.cpu_busy = True
+        self.update_mode()
+
+    def tick(self):
+        now = time.monotonic()
+        elapsed = (now - self.last_tick) * 1000
+        self.last_tick = now
+        for client in list(self.clients):
+            callback, interval, waited = client
+            waited += elapsed
+            # a tick may land a little early; 2 ms of slack keeps 16 ms clients at every tick
+            if waited >= interval - 2:
+                client[2] = 0.0
+                callback(min(waited / interval, MAX_STEPS))
+            else:
+                client[2] = waited
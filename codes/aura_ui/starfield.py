@@ -0,0 +1,167 @@
+"""
+Twinkling star background for the AURA launchers.
+
+The old SpaceBackground kept every star as a Python list and, on every tick,
+looped over all of them twice: once to advance the phase and once in
+paintEvent to call math.sin, build a QColor and drawEllipse per star. With
+1500-2500 stars that was most of a Pi core spent on the background.
+
+Here the star attributes live in NumPy arrays and one tick is a handful of
+array operations. Brightness is quantised to LEVELS grey levels and stars are
+drawn with one drawPoints() call per (level, size) bucket, so a frame costs a
+few dozen painter calls whatever the star count. The backdrop (fill + nebula
+gradient) is rendered once per widget size into a pixmap.
+
+    background = SpaceBackground(star_count=2005)           # t3/t6/test2 look
+    background = SpaceBackground(145, interval_ms=100, style=CLASSIC)   # mg, aarav, mohit
+"""
+import time
+
+import numpy as np
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from metrics import metrics
+
+from .scheduler import AnimationScheduler
+
+FIELD = (1920, 1080)  # star coordinates are drawn from this and wrapped to the widget size
+LEVELS = 16           # grey levels per frame (one drawPoints call each, per star size)
+
+# deep-blue space with a violet corner (t3, t6, test2)
+DEEP = {
+    "background": (2, 6, 18),
+    "nebula": ((10, 6, 20, 0), (40, 10, 70, 40)),
+    "nebula_from": 0.2,
+    "brightness": (160, 255),
+    "amplitude": 60,
+    "floor": 80,
+    "sizes": (1, 1, 2),  # more small stars than big
+    "drift": (0.06, 0.01),  # phase advance per tick: base + random jitter
+}
+
+# black space, single-pixel stars, no drift (mg, aarav_gui, mohit_gui)
+CLASSIC = {
+    "background": (0, 0, 0),
+    "nebula": ((0, 0, 0, 0), (100, 0, 160, 40)),
+    "nebula_from": 0.5,
+    "brightness": (180, 255),
+    "amplitude": 50,
+    "floor": 100,
+    "sizes": (1,),
+    "drift": (0.0, 0.0),
+}
+
+
+class Starfield:
+    """Star attributes as arrays; brightness for every star in one vectorised pass."""
+
+    def __init__(self, count, brightness=(160, 255), amplitude=60, floor=80, sizes=(1, 1, 2),
+                 drift=(0.06, 0.01), field=FIELD, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.count = count
+        self.x = self.rng.uniform(0, field[0], count)
+        self.y = self.rng.uniform(0, field[1], count)
+        self.base = self.rng.integers(brightness[0], brightness[1] + 1, count).astype(np.float32)
+        self.phase = self.rng.uniform(0, 2 * np.pi, count).astype(np.float32)
+        self.size = self.rng.choice(np.asarray(sizes, np.int32), count)
+        self.amplitude = amplitude
+        self.floor = floor
+        self.drift = drift
+        self.size_values = np.unique(self.size)
+        self.size_index = np.searchsorted(self.size_values, self.size)
+
+    @classmethod
+    def from_style(cls, count, style, seed=None):
+        keys = ("brightness", "amplitude", "floor", "sizes", "drift")
+        return cls(count, seed=seed, **{k: style[k] for k in keys})
+
+    def advance(self, steps=1.0):
+        """Twinkle ticks: every star's phase moves on by a slightly different amount."""
+        step, jitter = self.drift
+        if step or jitter:
+            self.phase += (step + self.rng.random(self.count, np.float32) * jitter) * steps
+
+    def brightness(self, t):
+        b = self.base + self.amplitude * np.sin(np.float32(t * 0.8) + self.phase)
+        return np.clip(b, self.floor, 255, out=b)
+
+    def buckets(self, t, levels=LEVELS):
+        """Stars sorted into (grey level, size) buckets for this frame.
+
+        Returns (order, groups): `order` indexes the stars bucket by bucket and
+        `groups` is a list of (grey, size, start, count) slices into it.
+        """
+        lo = self.floor
+        level = ((self.brightness(t) - lo) * (levels / (256 - lo))).astype(np.int32)
+        np.minimum(level, levels - 1, out=level)
+        key = level * len(self.size_values) + self.size_index
+        order = np.argsort(key, kind="stable")
+        counts = np.bincount(key, minlength=levels * len(self.size_values))
+        groups, start = [], 0
+        for k in np.flatnonzero(counts):
+            lvl, s = divmod(int(k), len(self.size_values))
+            grey = int(lo + (lvl + 0.5) * (256 - lo) / levels)
+            groups.append((min(grey, 255), int(self.size_values[s]), start, int(counts[k])))
+            start += int(counts[k])
+        return order, groups
+
+
+class SpaceBackground(QtWidgets.QWidget):
+    def __init__(self, star_count=1505, interval_ms=60, style=DEEP, parent=None):
+        super().__init__(parent)
+        self.star_count = star_count
+        self.style = style
+        self.stars = Starfield.from_style(star_count, style)
+        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent)  # the backdrop covers every pixel
+        self._backdrop = None
+        self._points = None   # QPolygonF holding wrapped positions, written through a NumPy view
+        self._xy = None
+        self._wrapped = None  # positions wrapped to the current widget size
+        self._size = None
+        self.animation = AnimationScheduler.instance().register(self.update_twinkle, interval_ms, owner=self)
+
+    def update_twinkle(self, steps=1.0):
+        self.stars.advance(steps)
+        self.update()
+
+    def _layout(self, w, h):
+        """Backdrop pixmap and wrapped star positions for a new widget size."""
+        self._size = (w, h)
+        self._backdrop = QtGui.QPixmap(w, h)
+        p = QtGui.QPainter(self._backdrop)
+        p.fillRect(0, 0, w, h, QtGui.QColor(*self.style["background"]))
+        grad = QtGui.QLinearGradient(w * self.style["nebula_from"], 0, w, h)
+        grad.setColorAt(0.0, QtGui.QColor(*self.style["nebula"][0]))
+        grad.setColorAt(1.0, QtGui.QColor(*self.style["nebula"][1]))
+        p.fillRect(0, 0, w, h, grad)
+        p.end()
+
+        s = self.stars
+        half = s.size / 2.0  # old code drew a size x size ellipse from the star's corner
+        self._wrapped = np.column_stack([
+            np.floor(s.x) % max(1, w) + half,
+            np.floor(s.y) % max(1, h) + half,
+        ])
+        self._points = QtGui.QPolygonF(s.count)
+        ptr = self._points.data()
+        ptr.setsize(s.count * 2 * 8)
+        self._xy = np.frombuffer(ptr, np.float64).reshape(s.count, 2)
+
+    @metrics.timed("paint_stars")
+    def paintEvent(self, event):
+        w, h = self.width(), self.height()
+        if self._size != (w, h):
+            self._layout(w, h)
+        order, groups = self.stars.buckets(time.time())
+        np.take(self._wrapped, order, axis=0, out=self._xy)
+
+        p = QtGui.QPainter(self)
+        p.drawPixmap(0, 0, self._backdrop)
+        pen = QtGui.QPen()
+        pen.setCapStyle(QtCore.Qt.SquareCap)
+        for grey, size, start, count in groups:
+            pen.setColor(QtGui.QColor(grey, grey, grey))
+            pen.setWidth(size)
+            p.setPen(pen)
+            p.drawPoints(self._points.mid(start, count))
+        p.end()
@@ -0,0 +1,308 @@
+"""
+The AURA main window, built from an AuraConfig (presets.py).
+
+One window for every launcher: star background, title, orb, the button
+column and an optional floating exit button, laid out from the config. The
+buttons drive the resident services (services/) and the camera view shows
+the recognizer's frames.
+
+    from aura_ui import presets, run
+    run(presets.T6)
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from services import ServiceManager
+from services.manager import AUTOSTART
+from services.qt import JobWatcher
+
+from .button import GlowButton
+from .camera_view import CameraView
+from .jobs import EnrollJob, JobRunner, PrerenderJob, RetrainJob
+from .orb import AuraCore, PulseOrb
+from .presets import AuraConfig
+from .scheduler import AnimationScheduler
+from .starfield import SpaceBackground
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+
+# button action -> AuraMain slot
+ACTIONS = {
+    "start": "start_recognition",
+    "train": "train_data",
+    "manage": "manage_dataset",
+    "listen": "run_queries",
+}
+
+
+def title_font(family):
+    """The title font family; "Centauri" is loaded from codes/Centauri when present."""
+    if family != "Centauri":
+        return family
+    font_path = CODES_DIR / "Centauri" / "Centauri.ttf"
+    if font_path.exists():
+        font_id = QtGui.QFontDatabase.addApplicationFont(str(font_path))
+        if font_id != -1:
+            return QtGui.QFontDatabase.applicationFontFamilies(font_id)[0]
+    return "Segoe UI"
+
+
+class AuraMain(QtWidgets.QMainWindow):
+    def __init__(self, config=AuraConfig):
+        super().__init__()
+        self.config = config
+        self.setWindowTitle(config.WINDOW_TITLE)
+        self.resize(*config.WINDOW_SIZE)
+
+        # all animations run off one clock: slower when idle or busy, stopped when hidden
+        self.animations = AnimationScheduler.instance()
+        self.animations.set_rates(1000 // config.FPS, 1000 // config.BUSY_FPS, 1000 // config.IDLE_FPS)
+
+        self.background = SpaceBackground(config.STAR_COUNT, interval_ms=config.STAR_INTERVAL_MS,
+                                           style=config.STAR_STYLE)
+        self.setCentralWidget(self.background)
+
+        self.overlay = QtWidgets.QWidget(self.background)
+        self.overlay.setGeometry(self.background.rect())
+        self.overlay.raise_()
+
+        layout = QtWidgets.QVBoxLayout(self.overlay)
+        layout.setContentsMargins(*config.MARGINS)
+        layout.setSpacing(config.SPACING)
+        layout.setAlignment(config.ALIGN)
+
+        layout.addWidget(self.header_widget(), alignment=QtCore.Qt.AlignHCenter)
+
+        self.aura_core = self.orb_widget()
+        if config.ORB_POSITION is not None:
+            self.aura_core.setParent(self.overlay)
+            self.aura_core.move(*config.ORB_POSITION)
+        layout.addWidget(self.center_controls(), alignment=config.CONTROLS_ALIGN)
+
+        self.status_label = QtWidgets.QLabel("")
+        self.status_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.status_label.setStyleSheet(config.STATUS_STYLE)
+        layout.addWidget(self.status_label, alignment=QtCore.Qt.AlignHCenter)
+
+        self.exit_container = self.exit_widget()
+        self.background.installEventFilter(self)
+
+        # recognizer/enroller/voice are resident services, started once here (services/)
+        self.services = ServiceManager()
+        self.services.ensure_running()
+        self.job_watcher = JobWatcher(self.services, parent=self)  # recognition, until stopped
+        self.jobs = JobRunner(parent=self)  # enroll/retrain/reindex/prerender on the thread pool
+        self.jobs.progress.connect(self.on_job_progress)
+        self.animations.watch(self)
+        self.job_watcher.busy.connect(lambda busy: self.animations.set_busy("recognition", busy))
+        self.jobs.busy.connect(lambda busy: self.animations.set_busy("jobs", busy))
+        app = QtWidgets.QApplication.instance()
+        app.aboutToQuit.connect(self.jobs.cancel_all)
+        app.aboutToQuit.connect(self.services.shutdown)
+        if AUTOSTART:
+            # the first conversation's welcome and prompts play without waiting for TTS
+            self.jobs.submit(PrerenderJob(self.services))
+        self.camera_view = CameraView(parent=self.overlay)
+        self.camera_view.hide()
+        self.showMaximized()
+
+    def eventFilter(self, s, e):
+        if e.type() == QtCore.QEvent.Resize:
+            self.overlay.setGeometry(self.background.rect())
+            if self.exit_container is not None:
+                self.exit_container.setGeometry(self.overlay.rect())
+        return super().eventFilter(s, e)
+
+    def header_widget(self):
+        w = QtWidgets.QWidget()
+        h = QtWidgets.QHBoxLayout(w)
+        title = QtWidgets.QLabel(self.config.TITLE)
+        title.setFont(QtGui.QFont(title_font(self.config.TITLE_FONT), self.config.TITLE_SIZE, QtGui.QFont.Bold))
+        title.setStyleSheet(self.config.TITLE_STYLE)
+        title.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+        h.addWidget(title)
+        h.addStretch()
+        return w
+
+    def orb_widget(self):
+        config = self.config
+        if config.ORB == "pulse":
+            return PulseOrb(size=config.ORB_SIZE, orb=config.ORB_DIAMETER, color=config.ORB_COLOR,
+                            interval_ms=config.ORB_INTERVAL_MS)
+        return AuraCore(size=config.ORB_SIZE, core=config.ORB_DIAMETER, halo_pad=config.ORB_HALO_PAD,
+                        interval_ms=config.ORB_INTERVAL_MS)
+
+    def center_controls(self):
+        config = self.config
+        container = QtWidgets.QWidget()
+        layout = QtWidgets.QHBoxLayout(container)
+        layout.setSpacing(config.CONTROLS_SPACING)
+        layout.setContentsMargins(*config.CONTROLS_MARGINS)
+
+        if config.ORB_POSITION is None:
+            layout.addWidget(self.aura_core, alignment=config.ORB_ALIGN)
+            layout.addSpacing(config.ORB_GAP)
+
+        btn_col = QtWidgets.QVBoxLayout()
+        btn_col.setSpacing(config.BUTTON_SPACING)
+        btn_col.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        for action, label in config.BUTTONS:
+            button = GlowButton(label, height=config.BUTTON_HEIGHT, min_width=config.BUTTON_MIN_WIDTH,
+                                style=config.BUTTON_STYLE)
+            button.clicked.connect(getattr(self, ACTIONS[action]))
+            setattr(self, f"btn_{action}", button)
+            btn_col.addWidget(button)
+        layout.addLayout(btn_col, stretch=0)
+        return container
+
+    def exit_widget(self):
+        """Floating exit button anchored to the bottom-right corner of the overlay."""
+        config = self.config
+        if config.EXIT_LABEL is None:
+            return None
+        self.btn_exit = GlowButton(config.EXIT_LABEL, style=config.EXIT_STYLE)
+        self.btn_exit.setFixedSize(*config.EXIT_SIZE)
+        self.btn_exit.clicked.connect(self.exit_app)
+
+        container = QtWidgets.QWidget(self.overlay)
+        exit_layout = QtWidgets.QHBoxLayout(container)
+        exit_layout.setContentsMargins(0, 0, config.EXIT_MARGIN, config.EXIT_MARGIN)
+        exit_layout.addStretch()
+        exit_layout.addWidget(self.btn_exit, alignment=QtCore.Qt.AlignRight | QtCore.Qt.AlignBottom)
+        container.setGeometry(self.overlay.rect())
+        container.raise_()
+        return container
+
+    def start_recognition(self):
+        if self.camera_view.isVisible():
+            self.stop_recognition()
+            return
+        try:
+            self.aura_core.pulse_react(QtGui.QColor(38, 103, 255))
+            self.status_label.setText("Recognizing...")
+            job = self.services.call("recognizer", "start", view="shared")["job"]
+            self.job_watcher.watch("recognizer", job, self.recognition_done)
+            self.show_camera()
+            QtCore.QTimer.singleShot(3000, lambda: self.status_label.clear())
+        except Exception as e:
+            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to start recognition:\n{e}")
+            print("Error while starting recognition:", e)
+
+    def show_camera(self):
+        """Live recognizer frames (shared memory) over the centre of the window."""
+        r = self.overlay.rect()
+        w, h = int(r.width() * 0.6), int(r.height() * 0.6)
+        self.camera_view.setGeometry((r.width() - w) // 2, (r.height() - h) // 2, w, h)
+        self.camera_view.start()
+        self.camera_view.show()
+        self.camera_view.raise_()
+        self.btn_start_text = self.btn_start.text()
+        self.btn_start.setText("Stop")
+
+    def hide_camera(self):
+        if self.camera_view.isVisible():
+            self.camera_view.stop()
+            self.camera_view.hide()
+            self.btn_start.setText(self.btn_start_text)
+
+    def stop_recognition(self):
+        try:
+            self.services.call("recognizer", "stop")
+        except Exception as e:
+            print("Error while stopping recognition:", e)
+        self.hide_camera()
+
+    def recognition_done(self, status):
+        self.hide_camera()
+        if status.get("state") != "idle":
+            self.status_label.setText(f"Recognition stopped: {status.get('message', '')}")
+            QtCore.QTimer.singleShot(3000, lambda: self.status_label.clear())
+
+    def train_data(self):
+        if self.jobs.running("enroll"):
+            reply = QtWidgets.QMessageBox.question(self, "Registration", "Stop the registration in progress?",
+                                                   QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
+            if reply == QtWidgets.QMessageBox.Yes:
+                self.status_label.setText("Stopping registration...")
+                self.jobs.cancel("enroll")
+            return
+        person_name, ok = QtWidgets.QInputDialog.getText(self, "Enter Name", "Enter the person's name for training:")
+        if ok and person_name.strip():
+            name = person_name.strip()
+            self.aura_core.pulse_react(QtGui.QColor(255, 220, 60))
+            self.status_label.setText(f"Registering {name}...")
+            self.jobs.submit(EnrollJob(self.services, name), lambda status: self.training_done(name, status))
+
+    def training_done(self, name, status):
+        state = status.get("state")
+        if state == "done":
+            self.aura_core.pulse_react(QtGui.QColor(80, 255, 120))
+            self.status_label.setText(f"{name} Registration complete! Training...")
+            # the enroller has started the retrain; this follows it (same task, not a second one)
+            self.jobs.submit(RetrainJob(self.services), self.retrain_done)
+            return
+        if state == "cancelled":
+            self.status_label.setText(f"{name} Registration stopped: {status.get('message', '')}")
+        else:
+            self.aura_core.pulse_react(QtGui.QColor(255, 70, 70))
+            self.status_label.setText(f"{name} Registration failed: {status.get('message', '')}")
+        QtCore.QTimer.singleShot(3000, lambda: self.status_label.clear())
+
+    def retrain_done(self, status):
+        if status.get("state") == "done":
+            self.status_label.setText(f"Training complete: {status.get('message', '')}")
+        else:
+            self.status_label.setText(f"Training failed: {status.get('message', '')}")
+        QtCore.QTimer.singleShot(3000, lambda: self.status_label.clear())
+
+    def on_job_progress(self, name, pct, message):
+        if name == "prerender":
+            return  # background warm-up, nothing to show
+        self.status_label.setText(f"{message} {pct}%" if pct >= 0 else message)
+
+    def run_queries(self):
+        try:
+            self.aura_core.pulse_react(QtGui.QColor(0, 255, 255))
+            self.status_label.setText("Listening...")
+            self.services.call("voice", "start")
+            QtCore.QTimer.singleShot(3000, lambda: self.status_label.clear())
+        except Exception as e:
+            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to start the voice assistant:\n{e}")
+            print("Error while starting the voice assistant:", e)
+
+    def manage_dataset(self):
+        self.status_label.setText("Opening dataset folder...")
+        self.aura_core.pulse_react(QtGui.QColor(180, 100, 255))
+        data_path = str(CODES_DIR / "data")
+        os.makedirs(data_path, exist_ok=True)
+        if sys.platform.startswith("win"):
+            os.startfile(data_path)
+        elif sys.platform.startswith("darwin"):
+            subprocess.Popen(["open", data_path])
+        else:
+            subprocess.Popen(["xdg-open", data_path])
+        QtCore.QTimer.singleShot(1500, lambda: self.status_label.clear())
+
+    def exit_app(self):
+        self.status_label.setText("Exiting...")
+        self.aura_core.pulse_react(QtGui.QColor(255, 70, 70))
+        reply = QtWidgets.QMessageBox.question(self, "Exit", "Exit AURA Interface?",
+                                               QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
+        if reply == QtWidgets.QMessageBox.Yes:
+            QtWidgets.QApplication.quit()
+        else:
+            self.status_label.clear()
+
+
+def run(config=AuraConfig):
+    """Start the Qt application with an AURA window for `config`; returns the exit code."""
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
+    app = QtWidgets.QApplication(sys.argv)
+    w = AuraMain(config)
+    w.show()
+    return app.exec_()
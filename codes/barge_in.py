@@ -0,0 +1,160 @@
+"""
+Barge-in support for conversation mode: keep the microphone open while the
+assistant is speaking, and stop (or duck) the answer when the visitor talks.
+
+BargeInMonitor runs a voice activity detector on the mic stream during
+playback. Once speech is confirmed it sets `triggered` (the player watches
+that event and stops) and keeps recording, including a short pre-roll from
+before the trigger, until the visitor pauses. wait_for_utterance() then
+saves the capture as the next turn's WAV, so nothing said is lost.
+
+There is no echo cancellation: the detector compares mic energy against an
+adaptive floor that includes the speaker bleed, so it works best with the
+mic pointed at the visitor and away from the speaker.
+"""
+import collections
+import threading
+import wave
+from typing import Callable, Optional
+
+import numpy as np
+import sounddevice as sd
+
+from audio_devices import devices
+
+FRAME_MS = 30
+
+
+class VoiceActivityDetector:
+    """Energy gate over an adaptive noise/echo floor, plus webrtcvad if it is installed."""
+
+    def __init__(self, samplerate: int, sensitivity: float = 3.0, min_rms: float = 300.0, floor_alpha: float = 0.05):
+        self.samplerate = samplerate
+        self.sensitivity = sensitivity
+        self.min_rms = min_rms
+        self.floor_alpha = floor_alpha
+        self.floor = None
+        try:
+            import webrtcvad
+            self.webrtc = webrtcvad.Vad(2)
+        except ImportError:
+            self.webrtc = None
+
+    def is_speech(self, frame: np.ndarray) -> bool:
+        rms = float(np.sqrt(np.mean(frame.astype(np.float32) ** 2)))
+        if self.floor is None:
+            self.floor = rms
+            return False
+
+        loud = rms > max(self.min_rms, self.floor * self.sensitivity)
+        if not loud:
+            # only track the floor on non-speech frames so talking doesn't raise it
+            self.floor += self.floor_alpha * (rms - self.floor)
+            return False
+        if self.webrtc is not None:
+            return self.webrtc.is_speech(frame.tobytes(), self.samplerate)
+        return True
+
+
+class BargeInMonitor:
+    def __init__(
+        self,
+        device: Optional[int],
+        samplerate: int = 16000,
+        sensitivity: float = 3.0,
+        trigger_ms: int = 240,
+        tentative_ms: int = 90,
+        end_silence_ms: int = 800,
+        preroll_ms: int = 450,
+        max_seconds: float = 8,
+        on_speech: Optional[Callable[[bool], None]] = None,
+    ):
+        self.device = device
+        self.samplerate = samplerate
+        self.frame_len = samplerate * FRAME_MS // 1000
+        self.vad = VoiceActivityDetector(samplerate, sensitivity)
+        self.trigger_frames = max(1, trigger_ms // FRAME_MS)
+        self.tentative_frames = max(1, tentative_ms // FRAME_MS)
+        self.end_frames = max(1, end_silence_ms // FRAME_MS)
+        self.max_frames = int(max_seconds * 1000 / FRAME_MS)
+        self.on_speech = on_speech
+
+        self.preroll = collections.deque(maxlen=max(1, preroll_ms // FRAME_MS))
+        self.frames = []
+        self.speech_run = 0
+        self.silence_run = 0
+        self.tentative = False
+
+        self.triggered = threading.Event()  # speech confirmed: stop playback
+        self.finished = threading.Event()   # utterance complete (or capture gave up)
+        self.stream = None
+
+    def start(self):
+        devices.stream_opened()  # keeps a hotplug re-init of PortAudio away from this stream
+        try:
+            self.stream = sd.InputStream(
+                device=self.device,
+                samplerate=self.samplerate,
+                channels=1,
+                dtype='int16',
+                blocksize=self.frame_len,
+                callback=self._callback,
+                finished_callback=self.finished.set,
+            )
+            self.stream.start()
+        except Exception:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+            devices.stream_closed()
+            raise
+        return self
+
+    def _notify(self, active: bool):
+        if self.tentative != active and self.on_speech is not None:
+            self.on_speech(active)
+        self.tentative = active
+
+    def _callback(self, indata, frames, time_info, status):
+        frame = indata[:, 0].copy()
+        speech = self.vad.is_speech(frame)
+
+        if not self.triggered.is_set():
+            self.preroll.append(frame)
+            self.speech_run = self.speech_run + 1 if speech else 0
+            self._notify(self.speech_run >= self.tentative_frames)
+            if self.speech_run >= self.trigger_frames:
+                self.frames = list(self.preroll)
+                self.triggered.set()
+            return
+
+        self.frames.append(frame)
+        self.silence_run = 0 if speech else self.silence_run + 1
+        if self.silence_run >= self.end_frames or len(self.frames) >= self.max_frames:
+            raise sd.CallbackStop
+
+    def stop(self):
+        """Close the mic stream (safe to call more than once)."""
+        if self.stream is not None:
+            try:
+                self.stream.stop()
+                self.stream.close()
+            except Exception:
+                pass
+            self.stream = None
+            devices.stream_closed()
+        self._notify(False)
+
+    def wait_for_utterance(self, filename: str) -> Optional[str]:
+        """Block until the visitor stops talking, then save the capture as a 16-bit mono WAV."""
+        self.finished.wait(timeout=self.max_frames * FRAME_MS / 1000 + 1)
+        self.stop()
+        if not self.frames:
+            return None
+        audio = np.concatenate(self.frames)
+        with wave.open(filename, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.samplerate)
+            wav.writeframes(audio.astype(np.int16).tobytes())
+        return filename
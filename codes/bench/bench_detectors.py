@@ -0,0 +1,162 @@
+"""
+Face detector backends (vision/detectors.py) compared on recorded clips:
+accuracy against speed.
+
+Every backend sees the same frames (up to -n per clip, read once up front so
+decoding is left out) and is timed on detect() alone. Accuracy is measured
+against a reference, by default the SSD, the detector the rest of the pipeline
+was tuned with: a box counts as found when it overlaps a reference box by
+IoU >= --iou (0.5), each reference box matched at most once.
+
+    fps        frames per second of detect() alone
+    ms p95     95th percentile per-frame time
+    faces      boxes per frame
+    precision  boxes that match a reference box
+    recall     reference boxes that were found
+
+    python bench/bench_detectors.py clip1.mp4 clip2.mp4
+    python bench/bench_detectors.py clip.mp4 --backends yunet haar --reference yunet
+    python bench/bench_detectors.py clip.mp4 --json detectors.json
+
+Backends whose model file is missing from assets/ are skipped with a note.
+Exits non-zero if no backend could run or a clip gave no frames.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CODES_DIR))
+
+from vision import DETECTION_CONFIDENCE, DETECTORS, load_detector  # noqa: E402
+
+
+def read_clips(paths, frames, width=None):
+    """Up to `frames` frames of every clip, optionally resized to `width`."""
+    clips = {}
+    for path in paths:
+        cap = cv2.VideoCapture(str(path))
+        images = []
+        while len(images) < frames:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            if width and frame.shape[1] != width:
+                frame = cv2.resize(frame, (width, round(frame.shape[0] * width / frame.shape[1])))
+            images.append(frame)
+        cap.release()
+        clips[str(path)] = images
+    return clips
+
+
+def iou(a, b):
+    ix = min(a[2], b[2]) - max(a[0], b[0])
+    iy = min(a[3], b[3]) - max(a[1], b[1])
+    if ix <= 0 or iy <= 0:
+        return 0.0
+    inter = ix * iy
+    return inter / ((a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter)
+
+
+def match(found, reference, threshold):
+    """Number of found boxes that overlap a still-unmatched reference box by IoU >= threshold."""
+    unmatched = list(reference)
+    hits = 0
+    for box in found:  # highest score first
+        best = max(unmatched, key=lambda ref: iou(box, ref), default=None)
+        if best is not None and iou(box, best) >= threshold:
+            unmatched.remove(best)
+            hits += 1
+    return hits
+
+
+def run(detector, frames, confidence):
+    """(per-frame boxes, per-frame ms) of detector over frames, after one warm-up call."""
+    detector.detect(frames[0], confidence)
+    boxes, times = [], []
+    for frame in frames:
+        t = time.perf_counter()
+        found = detector.detect(frame, confidence)
+        times.append((time.perf_counter() - t) * 1000)
+        boxes.append([box[:4] for box in found])
+    return boxes, times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("clips", nargs="+", help="recorded video files")
+    parser.add_argument("--backends", nargs="+", default=list(DETECTORS), choices=list(DETECTORS))
+    parser.add_argument("--reference", default="ssd", choices=list(DETECTORS), help="backend the others are scored against")
+    parser.add_argument("-n", "--frames", type=int, default=300, help="frames per clip")
+    parser.add_argument("--width", type=int, help="resize frames to this width first (e.g. the camera's 640)")
+    parser.add_argument("--confidence", type=float, default=DETECTION_CONFIDENCE)
+    parser.add_argument("--iou", type=float, default=0.5)
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    clips = read_clips(args.clips, args.frames, args.width)
+    empty = [path for path, frames in clips.items() if not frames]
+    for path in empty:
+        print(f"❌ No frames read from {path}")
+    frames = [frame for images in clips.values() for frame in images]
+    if empty or not frames:
+        return 1
+
+    backends = list(dict.fromkeys([args.reference, *args.backends]))
+    outputs = {}
+    for name in backends:
+        try:
+            detector = load_detector(name)
+        except (FileNotFoundError, cv2.error) as exc:
+            print(f"⚠️ Skipping {name}: {exc}")
+            continue
+        outputs[name] = run(detector, frames, args.confidence)
+    if not outputs:
+        print("\n❌ No detector could be loaded")
+        return 1
+
+    reference = outputs.get(args.reference)
+    if reference is None:
+        print(f"⚠️ No {args.reference} reference: accuracy columns left empty")
+    total_ref = sum(len(boxes) for boxes in reference[0]) if reference else 0
+
+    print(f"\n{len(frames)} frames from {len(clips)} clip(s), {frames[0].shape[1]}x{frames[0].shape[0]}, "
+          f"reference {args.reference}, IoU >= {args.iou}")
+    print(f"{'backend':<8} {'fps':>8} {'ms p95':>8} {'faces':>7} {'precision':>10} {'recall':>8}")
+    results = {}
+    for name, (boxes, times) in outputs.items():
+        found = sum(len(frame_boxes) for frame_boxes in boxes)
+        row = {
+            "fps": 1000 * len(times) / sum(times),
+            "ms_p95": float(np.percentile(times, 95)),
+            "faces_per_frame": found / len(frames),
+            "precision": None,
+            "recall": None,
+        }
+        if reference:
+            hits = sum(match(mine, ref, args.iou) for mine, ref in zip(boxes, reference[0]))
+            row["precision"] = hits / found if found else None
+            row["recall"] = hits / total_ref if total_ref else None
+        results[name] = row
+        precision = f"{row['precision']:.2f}" if row["precision"] is not None else "-"
+        recall = f"{row['recall']:.2f}" if row["recall"] is not None else "-"
+        print(f"{name:<8} {row['fps']:>8.1f} {row['ms_p95']:>8.2f} {row['faces_per_frame']:>7.2f} "
+              f"{precision:>10} {recall:>8}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            "clips": list(clips), "frames": len(frames), "reference": args.reference,
+            "iou": args.iou, "confidence": args.confidence, "results": results,
+        }, indent=2))
+        print(f"\nSaved {args.json}")
+    print("\n✅ Detector comparison passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
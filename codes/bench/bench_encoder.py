@@ -0,0 +1,150 @@
+"""
+Encoder benchmark: torch SentenceTransformer vs int8 ONNX (onnx_encoder.py).
+
+Each backend runs in its own child process so import time and RSS are not
+polluted by the other one. The parent then checks parity on the FAQ set:
+
+    python bench/bench_encoder.py                # both backends + parity
+    python bench/bench_encoder.py --backend onnx # one backend only
+
+Exits non-zero when parity fails, so it doubles as the regression check.
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CODES_DIR))
+
+# Paraphrases of the FAQ keys, each tagged with the FAQ question it should hit
+PARAPHRASES = [
+    ("who's the principal of this school", "who is the principal"),
+    ("which teacher takes science", "who teaches science"),
+    ("how do i get to class 8a", "where is class 8a"),
+    ("what time does school start and end", "what is the school timing"),
+    ("where can i find the library", "where is the library"),
+    ("who is our maths teacher", "who teaches math"),
+    ("how many classes does the school have", "how many classrooms are there"),
+    ("where's the principal's office", "where is the principal office"),
+]
+
+MIN_COSINE = 0.98  # per-sentence agreement between torch and int8 embeddings
+
+
+def load_faq_questions():
+    """FAQ questions straight from the knowledge file (importing queries.py would load Vosk)."""
+    from knowledge import KB_FILE
+    return list(json.loads(KB_FILE.read_text(encoding="utf-8"))["faq"].keys())
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def run_child(backend, repeats):
+    """Measure one backend in this process and print a JSON report."""
+    t0 = time.perf_counter()
+    if backend == "onnx":
+        from onnx_encoder import OnnxEncoder
+        import_s = time.perf_counter() - t0
+        t1 = time.perf_counter()
+        encoder = OnnxEncoder()
+    else:
+        from sentence_transformers import SentenceTransformer
+        import_s = time.perf_counter() - t0
+        t1 = time.perf_counter()
+        encoder = SentenceTransformer("all-MiniLM-L6-v2")
+    load_s = time.perf_counter() - t1
+
+    questions = load_faq_questions()
+    queries = [q for q, _ in PARAPHRASES]
+    faq_emb = np.asarray(encoder.encode(questions, normalize_embeddings=True))
+    query_emb = np.asarray(encoder.encode(queries, normalize_embeddings=True))
+
+    latencies = []
+    for _ in range(repeats):
+        for q in queries:
+            t = time.perf_counter()
+            encoder.encode(q, normalize_embeddings=True)
+            latencies.append((time.perf_counter() - t) * 1000.0)
+
+    print(json.dumps({
+        "backend": backend,
+        "import_s": import_s,
+        "load_s": load_s,
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+        "peak_rss_mb": peak_rss_mb(),
+        "faq_emb": faq_emb.tolist(),
+        "query_emb": query_emb.tolist(),
+    }))
+
+
+def spawn(backend, repeats):
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", "--backend", backend, "--repeats", str(repeats)],
+        cwd=str(CODES_DIR), capture_output=True, text=True,
+    )
+    if out.returncode != 0:
+        print(out.stderr)
+        raise RuntimeError(f"{backend} benchmark failed")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def check_parity(ref, cand):
+    """True when embeddings agree and every paraphrase maps to the same FAQ entry."""
+    questions = load_faq_questions()
+    ok = True
+
+    ref_faq, cand_faq = np.array(ref["faq_emb"]), np.array(cand["faq_emb"])
+    cos = (ref_faq * cand_faq).sum(axis=1)
+    print(f"FAQ embedding cosine: min {cos.min():.4f}, mean {cos.mean():.4f}")
+    if cos.min() < MIN_COSINE:
+        print(f"  FAIL: below {MIN_COSINE}")
+        ok = False
+
+    for i, (query, expected) in enumerate(PARAPHRASES):
+        ref_hit = questions[int(np.argmax(ref_faq @ np.array(ref["query_emb"][i])))]
+        cand_hit = questions[int(np.argmax(cand_faq @ np.array(cand["query_emb"][i])))]
+        mark = "ok" if ref_hit == cand_hit else "MISMATCH"
+        if ref_hit != cand_hit:
+            ok = False
+        print(f"  [{mark}] {query!r}: torch={ref_hit!r} onnx={cand_hit!r} (expected {expected!r})")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["torch", "onnx"], help="benchmark one backend only")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.backend, args.repeats)
+        return 0
+
+    backends = [args.backend] if args.backend else ["torch", "onnx"]
+    reports = {b: spawn(b, args.repeats) for b in backends}
+
+    print(f"\n{'backend':<8} {'import s':>9} {'load s':>8} {'p50 ms':>8} {'p95 ms':>8} {'RSS MB':>8}")
+    for b, r in reports.items():
+        print(f"{b:<8} {r['import_s']:>9.2f} {r['load_s']:>8.2f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['peak_rss_mb']:>8.0f}")
+
+    if len(reports) == 2:
+        print("\nParity (torch vs onnx int8):")
+        if not check_parity(reports["torch"], reports["onnx"]):
+            print("\n❌ Parity check failed")
+            return 1
+        print("\n✅ Parity check passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
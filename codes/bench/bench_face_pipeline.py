@@ -0,0 +1,364 @@
+"""
+Headless benchmark for the face pipeline: no camera, no display, no model needed.
+
+Frames come from a recorded video (--video, looped) or from a synthetic scene
+of moving textured "faces", one texture per person. They run through the same
+vision/ functions recognise.py and the recognizer service use:
+
+    capture    read the next frame
+    detect     SSD blob + forward + box decoding (detect_faces)
+    crop       grayscale/equalize/resize per face (face_crop)
+    predict    LBPH or k-NN per face (FaceDatabase.predict)
+    annotate   boxes and labels (annotate)
+    sink       NullSink (the display is left out)
+
+Without assets/res10_300x300_ssd_iter_140000.caffemodel (or with
+--fake-detector) the net is a stand-in that returns the synthetic scene's true
+boxes (a centred box for videos), so detect then measures the blob and
+decoding work around the forward pass. Training (FaceDatabase.load) and
+enrollment capture (capture_faces, 300 faces) are timed too.
+
+    python bench/bench_face_pipeline.py                       # synthetic, 640x480, 3 faces
+    python bench/bench_face_pipeline.py --video clip.mp4 -n 500
+    python bench/bench_face_pipeline.py --json before.json    # save for later
+    python bench/bench_face_pipeline.py --compare before.json # fail on a >10% slower frame
+
+Reports per-stage latency percentiles (ms), FPS and RSS. Exits non-zero when
+--compare finds the p50 frame time regressed by more than --max-regression.
+"""
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CODES_DIR))
+
+from vision import (  # noqa: E402
+    FACE_SIZE, FaceBatch, FaceDatabase, NullSink, annotate, capture_faces, detect_faces, face_crop, save_faces,
+)
+from vision.batch import WORKERS  # noqa: E402
+from vision.dataset import MODEL_FILE  # noqa: E402
+from vision.detectors import load_detector  # noqa: E402
+
+STAGES = ["capture", "detect", "crop", "predict", "annotate", "sink"]
+PERCENTILES = (50, 95, 99)
+
+
+class SyntheticCapture:
+    """cv2.VideoCapture look-alike: a noisy backdrop with `faces` textured ellipses drifting around."""
+
+    def __init__(self, size=(640, 480), faces=3, people=3, frames=None, seed=0):
+        self.w, self.h = size
+        self.frames = frames
+        self.count = 0
+        rng = np.random.default_rng(seed)
+        self.background = rng.integers(20, 90, (self.h, self.w, 3), dtype=np.uint8)
+        self.textures = [face_texture(p) for p in range(people)]
+        side = min(self.w, self.h) // 4
+        self.faces = [
+            {
+                "person": i % people,
+                "side": side,
+                "pos": rng.uniform((0, 0), (self.w - side, self.h - side)),
+                "vel": rng.uniform(-4, 4, 2),
+            }
+            for i in range(faces)
+        ]
+        self.size = size
+        self.boxes = []  # ground truth of the last frame, (x1, y1, x2, y2)
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        if self.frames is not None and self.count >= self.frames:
+            return False, None
+        self.count += 1
+        frame = self.background.copy()
+        self.boxes = []
+        for face in self.faces:
+            face["pos"] += face["vel"]
+            for axis, limit in ((0, self.w), (1, self.h)):
+                if not 0 <= face["pos"][axis] <= limit - face["side"]:
+                    face["vel"][axis] *= -1
+                    face["pos"][axis] = np.clip(face["pos"][axis], 0, limit - face["side"])
+            x, y = face["pos"].astype(int)
+            side = face["side"]
+            patch = cv2.resize(self.textures[face["person"]], (side, side))
+            frame[y:y + side, x:x + side] = patch[:, :, None]
+            self.boxes.append((x, y, x + side, y + side))
+        return True, frame
+
+    def release(self):
+        pass
+
+
+class VideoLoop:
+    """A video file, restarted at the end, for `frames` frames (None: forever)."""
+
+    def __init__(self, path, frames):
+        self.path = str(path)
+        self.frames = frames
+        self.count = 0
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            raise SystemExit(f"Cannot open {self.path}")
+        self.size = None
+        self.boxes = []
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        if self.frames is not None and self.count >= self.frames:
+            return False, None
+        ret, frame = self.cap.read()
+        if not ret:
+            self.cap.release()
+            self.cap = cv2.VideoCapture(self.path)
+            ret, frame = self.cap.read()
+        self.count += 1
+        h, w = frame.shape[:2]
+        self.size = (w, h)
+        self.boxes = [(w // 3, h // 3, 2 * w // 3, 2 * h // 3)]
+        return ret, frame
+
+    def release(self):
+        self.cap.release()
+
+
+class FakeNet:
+    """
+    Stands in for the SSD: returns the capture's true boxes in the net's
+    (1, 1, N, 7) output layout, normalized to the frame so any resize before
+    detection (capture_faces detects on 320x240) still lines up.
+    """
+
+    def __init__(self, capture):
+        self.capture = capture
+
+    def setInput(self, blob):
+        self.blob = blob
+
+    def forward(self):
+        out = np.zeros((1, 1, max(1, len(self.capture.boxes)), 7), np.float32)
+        w, h = self.capture.size
+        for i, (x1, y1, x2, y2) in enumerate(self.capture.boxes):
+            out[0, 0, i] = (0, 1, 0.99, x1 / w, y1 / h, x2 / w, y2 / h)
+        return out
+
+
+def face_texture(person, size=128):
+    """A fixed grayscale pattern per person, distinct enough for LBPH to tell apart."""
+    rng = np.random.default_rng(1000 + person)
+    tex = cv2.resize(rng.integers(0, 255, (16, 16), dtype=np.uint8), (size, size), interpolation=cv2.INTER_NEAREST)
+    mask = np.zeros((size, size), np.uint8)
+    cv2.ellipse(mask, (size // 2, size // 2), (size // 2 - 4, size // 2 - 1), 0, 0, 360, 255, -1)
+    return np.where(mask > 0, tex, 40).astype(np.uint8)
+
+
+def synthetic_dataset(path, people, faces, seed=0):
+    """data/<person>.npy files of noisy crops of each person's texture."""
+    rng = np.random.default_rng(seed)
+    for p in range(people):
+        base = cv2.resize(face_texture(p), FACE_SIZE).astype(np.int16)
+        crops = np.clip(base + rng.integers(-12, 12, (faces, *base.shape)), 0, 255).astype(np.uint8)
+        save_faces(f"person{p}", crops, path)
+
+
+def percentiles(samples_ms):
+    if not samples_ms:
+        return {f"p{q}": 0.0 for q in PERCENTILES}
+    values = np.percentile(np.asarray(samples_ms), PERCENTILES)
+    return {f"p{q}": float(v) for q, v in zip(PERCENTILES, values)}
+
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize() / 2**20
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def run_pipeline(net, faces, capture, sink, warmup, per_face=False):
+    """
+    Time every stage of every frame; returns ({stage: [ms]}, [frame ms], frames, faces, wall s).
+    Crops and predictions go through one FaceBatch/predict_batch per frame like
+    RecognitionPipeline, or face by face (face_crop + predict) with per_face.
+    """
+    batch = FaceBatch()
+    pool = ThreadPoolExecutor(WORKERS) if WORKERS > 1 else None
+    batch_map = pool.map if pool is not None else map
+    timings = {stage: [] for stage in STAGES}
+    totals = []
+    frames = found = 0
+    wall = None
+    while True:
+        t0 = time.perf_counter()
+        ret, frame = capture.read()
+        if not ret:
+            break
+        t1 = time.perf_counter()
+        boxes = detect_faces(net, frame)
+        t2 = time.perf_counter()
+        if per_face:
+            crops = [(face_crop(frame, box), box) for box in boxes]
+            t3 = time.perf_counter()
+            names = [(faces.predict(face), box) for face, box in crops if face is not None]
+        else:
+            crops = batch.fill(frame, boxes)
+            t3 = time.perf_counter()
+            names = list(zip(faces.predict_batch(crops, map=batch_map), batch.boxes)) if len(crops) else []
+        t4 = time.perf_counter()
+        for name, box in names:
+            annotate(frame, name, box)
+        t5 = time.perf_counter()
+        sink.show(frame)
+        t6 = time.perf_counter()
+
+        frames += 1
+        if frames <= warmup:
+            continue
+        if wall is None:
+            wall = t0
+        found += len(names)
+        for stage, a, b in zip(STAGES, (t0, t1, t2, t3, t4, t5), (t1, t2, t3, t4, t5, t6)):
+            timings[stage].append((b - a) * 1000)
+        totals.append((t6 - t0) * 1000)
+    if pool is not None:
+        pool.shutdown()
+    return timings, totals, frames - warmup, found, time.perf_counter() - (wall or time.perf_counter())
+
+
+def make_capture(args, frames, faces=None):
+    if args.video:
+        return VideoLoop(args.video, frames)
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    return SyntheticCapture(size, faces=args.faces if faces is None else faces, people=args.people, frames=frames)
+
+
+def make_net(args, capture):
+    if not args.fake_detector and MODEL_FILE.exists():
+        return load_detector()
+    return FakeNet(capture)
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=str(CODES_DIR),
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="replay this file instead of the synthetic scene")
+    parser.add_argument("--size", default="640x480", help="synthetic frame size WxH")
+    parser.add_argument("--faces", type=int, default=3, help="faces per synthetic frame")
+    parser.add_argument("--people", type=int, default=3, help="registered people in the synthetic dataset")
+    parser.add_argument("--train-faces", type=int, default=300, help="faces per person in the dataset")
+    parser.add_argument("-n", "--frames", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--recognizer", choices=["lbph", "knn", "both"], default="both")
+    parser.add_argument("--per-face", action="store_true", help="crop and predict face by face instead of as a batch")
+    parser.add_argument("--fake-detector", action="store_true", help="don't load the SSD model even if present")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="results JSON from an earlier run to compare against")
+    parser.add_argument("--max-regression", type=float, default=10.0, help="%% slower p50 frame time that fails")
+    args = parser.parse_args()
+
+    results = {
+        "commit": git_commit(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "host": {"python": platform.python_version(), "opencv": cv2.__version__, "machine": platform.machine()},
+        "config": {k: v for k, v in vars(args).items() if k not in ("json", "compare")},
+        "detector": None,
+        "pipelines": {},
+    }
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        synthetic_dataset(data_dir, args.people, args.train_faces)
+        kinds = ["lbph", "knn"] if args.recognizer == "both" else [args.recognizer]
+
+        print(f"{'recognizer':<10} {'train s':>8}  {'stage':<9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        for kind in kinds:
+            faces = FaceDatabase(data_dir, use_lbph=kind == "lbph")
+            t = time.perf_counter()
+            faces.load(verbose=False)
+            train_s = time.perf_counter() - t
+
+            capture = make_capture(args, args.frames + args.warmup)
+            net = make_net(args, capture)
+            results["detector"] = "fake" if isinstance(net, FakeNet) else "ssd"
+            timings, totals, frames, found, wall = run_pipeline(net, faces, capture, NullSink(), args.warmup, args.per_face)
+            stages = {stage: percentiles(ms) for stage, ms in timings.items()}
+            stages["frame"] = percentiles(totals)
+            results["pipelines"][kind] = {
+                "train_s": train_s,
+                "frames": frames,
+                "faces": found,
+                "fps": frames / wall if wall else 0.0,
+                "stages": stages,
+            }
+            for i, stage in enumerate(STAGES + ["frame"]):
+                lead = f"{kind:<10} {train_s:>8.2f}" if i == 0 else " " * 19
+                p = stages[stage]
+                print(f"{lead}  {stage:<9} {p['p50']:>8.2f} {p['p95']:>8.2f} {p['p99']:>8.2f}")
+            print(f"{'':<19}  {frames} frames, {found} faces, {frames / wall:.0f} fps\n")
+
+        # enrollment: the detector every 5th frame, until 300 crops of one face
+        capture = make_capture(args, None, faces=1)
+        net = make_net(args, capture)
+        t = time.perf_counter()
+        captured = capture_faces(net, capture, NullSink())
+        enroll_s = time.perf_counter() - t
+        results["enroll"] = {"faces": len(captured), "seconds": enroll_s, "frames": capture.count}
+        print(f"enroll     {len(captured)} faces from {capture.count} frames in {enroll_s:.2f}s")
+
+    results["rss_mb"] = rss_mb()
+    results["peak_rss_mb"] = peak_rss_mb()
+    print(f"detector   {results['detector']}")
+    print(f"rss        {results['rss_mb']:.0f} MB (peak {results['peak_rss_mb']:.0f} MB)")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"saved      {args.json}")
+
+    if args.compare:
+        before = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        ok = True
+        print(f"\ncompared with {before.get('commit') or args.compare}:")
+        for kind, now in results["pipelines"].items():
+            old = before.get("pipelines", {}).get(kind)
+            if old is None:
+                continue
+            was, is_ = old["stages"]["frame"]["p50"], now["stages"]["frame"]["p50"]
+            change = 100 * (is_ - was) / was if was else 0.0
+            print(f"  {kind:<8} frame p50 {was:.2f} -> {is_:.2f} ms ({change:+.1f}%), "
+                  f"fps {old['fps']:.0f} -> {now['fps']:.0f}")
+            if change > args.max_regression:
+                print(f"  FAIL: {kind} frame time up more than {args.max_regression}%")
+                ok = False
+        if not ok:
+            print("\n❌ Face pipeline check failed")
+            return 1
+    print("\n✅ Face pipeline check passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Per-hover CPU cost of the GlowButton animation.
+
+Shows a button offscreen and plays one hover (enter animation, then leave
+animation) at 60 fps, handling the events each frame posts (polish, layout,
+paint), for the old button (stylesheet re-generated every animation step) and
+the new one (aura_ui/button.py, stylesheet set once, scale done in paintEvent).
+Reports the process CPU time per hover and per frame. Both pay the same for
+the drop-shadow blur, which is most of what remains for the new button.
+
+    python bench/bench_glow_button.py
+    python bench/bench_glow_button.py -n 50
+
+Exits non-zero when the new button costs more CPU per hover than the old one.
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CODES_DIR))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtGui, QtWidgets  # noqa: E402
+
+from aura_ui.button import HOVER_MS, GlowButton  # noqa: E402
+
+FRAME_MS = 16
+
+
+class LegacyGlowButton(QtWidgets.QPushButton):
+    """The stylesheet-per-step button as it was in t3.py/t6.py/test2.py/mg.py, kept for comparison."""
+
+    def __init__(self, text, parent=None):
+        super().__init__(text, parent)
+        self.setFixedHeight(50)
+        self.setMinimumWidth(100)
+        self.shadow = QtWidgets.QGraphicsDropShadowEffect(self)
+        self.shadow.setOffset(0, 0)
+        self.shadow.setBlurRadius(0)
+        self.shadow.setColor(QtGui.QColor(170, 0, 255, 160))
+        self.setGraphicsEffect(self.shadow)
+        self._scale = 1.0
+        self.anim_group = QtCore.QParallelAnimationGroup(self)
+        self.blur_anim = QtCore.QPropertyAnimation(self.shadow, b"blurRadius")
+        self.scale_anim = QtCore.QPropertyAnimation(self, b"_scale_prop")
+        for anim in (self.blur_anim, self.scale_anim):
+            anim.setDuration(220)
+            anim.setEasingCurve(QtCore.QEasingCurve.OutCubic)
+        self.anim_group.addAnimation(self.blur_anim)
+        self.anim_group.addAnimation(self.scale_anim)
+        self.setStyleSheet(self.base_stylesheet())
+
+    def get_scale(self):
+        return self._scale
+
+    def set_scale(self, v):
+        self._scale = v
+        self.setStyleSheet(self.base_stylesheet(scale=v))
+
+    _scale_prop = QtCore.pyqtProperty(float, fget=get_scale, fset=set_scale)
+
+    def base_stylesheet(self, scale=1.0):
+        return f"""
+        QPushButton {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(10, 40, 90, 220),
+            stop:1 rgba(25, 90, 160, 240));
+        border: 2px solid rgba(30,150,255,0.35);
+        border-radius: 18px;
+        padding: 10px 18px;
+        color: rgb(235,245,255);
+        font-size: 24px;
+        font-weight: 600;
+        letter-spacing: 0.6px;
+        text-align: center;
+        transform: scale({scale});
+        }}
+        QPushButton:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(20, 70, 140, 240),
+            stop:1 rgba(70, 150, 255, 255));
+        border: 2px solid rgba(80,200,255,0.70);
+        }}
+        QPushButton:pressed {{
+        transform: scale({max(0.98, scale - 0.02)});
+        }}
+        """
+
+
+def play(button, blur, scale):
+    """Step one hover animation frame by frame, handling the events each step posts."""
+    button.blur_anim.setStartValue(button.shadow.blurRadius())
+    button.blur_anim.setEndValue(blur)
+    button.scale_anim.setStartValue(button._scale)
+    button.scale_anim.setEndValue(scale)
+    button.anim_group.start()
+    button.anim_group.pause()  # we step it ourselves
+    frames = 0
+    for t in list(range(0, HOVER_MS, FRAME_MS)) + [HOVER_MS]:
+        button.anim_group.setCurrentTime(t)
+        QtWidgets.QApplication.processEvents()
+        frames += 1
+    button.anim_group.stop()
+    return frames
+
+
+def measure(cls, hovers):
+    window = QtWidgets.QWidget()
+    layout = QtWidgets.QVBoxLayout(window)
+    button = cls("Recog")
+    layout.addWidget(button)
+    window.resize(300, 120)
+    window.show()
+    QtWidgets.QApplication.processEvents()
+    play(button, 36, 1.03)  # warm-up
+    play(button, 0, 1.0)
+    frames = 0
+    cpu = time.process_time()
+    for _ in range(hovers):
+        frames += play(button, 36, 1.03)
+        frames += play(button, 0, 1.0)
+    cpu = (time.process_time() - cpu) * 1000
+    window.close()
+    return cpu / hovers, cpu / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--hovers", type=int, default=20)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv[:1])  # noqa: F841
+    results = {}
+    print(f"{'button':<8} {'cpu ms/hover':>13} {'cpu ms/frame':>13}")
+    for label, cls in (("legacy", LegacyGlowButton), ("new", GlowButton)):
+        results[label] = measure(cls, args.hovers)
+        print(f"{label:<8} {results[label][0]:>13.2f} {results[label][1]:>13.3f}")
+
+    if results["new"][0] >= results["legacy"][0]:
+        print("\n❌ GlowButton check failed: not cheaper per hover")
+        return 1
+    print("\n✅ GlowButton check passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Intent matcher regression corpus + benchmark.
+
+Runs every query in intent_corpus.json through knowledge.IntentMatcher
+and compares the result with the expected intents, then times it against the
+old substring-based compare_to_facts() logic:
+
+    python bench/bench_intents.py
+
+Exits non-zero if any corpus entry regresses.
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CODES_DIR))
+
+from knowledge import IntentMatcher, KB_FILE
+
+CORPUS_FILE = Path(__file__).resolve().parent / "intent_corpus.json"
+
+
+def legacy_match(text):
+    """The original six any(word in text ...) substring loops, kept as the baseline."""
+    hits = []
+    if any(word in text for word in ["principal", "head", "headmaster", "director"]):
+        hits.append("principal")
+    if any(word in text for word in ["school", "institution", "academy"]) and "name" in text:
+        hits.append("school_name")
+    if any(word in text for word in ["location", "where", "place", "city", "located"]):
+        hits.append("location")
+    if any(word in text for word in ["motto", "slogan", "tagline"]):
+        hits.append("motto")
+    if any(word in text for word in ["established", "founded", "started", "when"]):
+        hits.append("established")
+    if any(word in text for word in ["grade", "class", "level"]):
+        hits.append("grades")
+    return hits
+
+
+def time_per_query(fn, queries, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for q in queries:
+            fn(q)
+    return (time.perf_counter() - start) / (rounds * len(queries)) * 1e6
+
+
+def main(rounds=2000):
+    config = json.loads(KB_FILE.read_text(encoding="utf-8"))
+    matcher = IntentMatcher(config["facts"], config["intents"])
+    corpus = json.loads(CORPUS_FILE.read_text(encoding="utf-8"))
+
+    failures = 0
+    legacy_wrong = 0
+    for case in corpus:
+        got = matcher.match_names(case["query"])
+        if got != case["intents"]:
+            failures += 1
+            print(f"❌ {case['query']!r}: expected {case['intents']}, got {got}")
+        if legacy_match(case["query"].lower()) != case["intents"]:
+            legacy_wrong += 1
+
+    print(f"Corpus: {len(corpus) - failures}/{len(corpus)} correct "
+          f"(substring matcher: {len(corpus) - legacy_wrong}/{len(corpus)})")
+
+    queries = [c["query"].lower() for c in corpus]
+    legacy_us = time_per_query(legacy_match, queries, rounds)
+    compiled_us = time_per_query(matcher.match, queries, rounds)
+    print(f"substring loops: {legacy_us:.2f} us/query")
+    print(f"compiled index:  {compiled_us:.2f} us/query")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
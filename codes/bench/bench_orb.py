@@ -0,0 +1,185 @@
+"""
+Paint-time benchmark for the AURA orb: per-frame gradients vs cached sprites.
+
+Renders the old AuraCore (three radial gradients built and filled every frame)
+and the sprite-based one (aura_ui/orb.py) offscreen, one animation step per
+frame, and reports the paint time per frame and the share of one core that
+costs at the 16 ms animation tick. Also reports how far the sprite orb's
+pixels drift from the old one (mean absolute difference, 0-255), so a change
+in the look shows up next to the speed-up.
+
+    python bench/bench_orb.py                 # t3/test2 (800x800) and t6 (900x800) orbs
+    python bench/bench_orb.py -n 500
+
+Exits non-zero when the sprite orb is not faster than the old one.
+"""
+import argparse
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CODES_DIR))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+from PyQt5 import QtCore, QtGui, QtWidgets  # noqa: E402
+
+from aura_ui.orb import AuraCore  # noqa: E402
+
+INTERVAL_MS = 16
+
+# launcher -> (widget size, core diameter, halo pad)
+ORBS = {
+    "t3": ((800, 800), 340.0, 30.0),
+    "t6": ((900, 800), 450.0, 100.0),
+}
+
+
+class LegacyAuraCore(QtWidgets.QLabel):
+    """The gradient-per-frame orb as it was in t3.py/t6.py/test2.py, kept for comparison."""
+
+    def __init__(self, size=(800, 800), core=340.0, halo_pad=30.0):
+        super().__init__()
+        self.setFixedSize(*size)
+        self.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
+        self.base_color = QtGui.QColor(100, 220, 255)
+        self.true_core = core
+        self.halo_pad = halo_pad
+        self.phase = 0.0
+        self.speed = 0.045
+        self.saturn_angle = 0.0
+
+    def animate_pulse(self):
+        self.phase += self.speed
+        self.saturn_angle = (self.saturn_angle + 0.45) % 360
+        self.update()
+
+    def paintEvent(self, e):
+        p = QtGui.QPainter(self)
+        p.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.SmoothPixmapTransform)
+        p.fillRect(self.rect(), QtCore.Qt.transparent)
+        cx = self.width() / 2.0
+        cy = self.height() / 2.0
+        r = self.true_core / 2.0
+        t = (math.sin(self.phase) + 1.0) / 2.0
+        eased = t * t * (3 - 2 * t)
+        core_r = r * (1.0 + 0.14 * eased)
+        halo_r = r * (1.0 + 0.26 * (0.5 + 0.5 * math.sin(self.phase * 0.9))) + self.halo_pad
+
+        ring_color = QtGui.QColor(self.base_color)
+        ring_color.setAlpha(max(20, int(80 + 40 * math.sin(self.phase * 1.1))))
+        pen = QtGui.QPen(ring_color, 4, QtCore.Qt.SolidLine)
+        pen.setCosmetic(True)
+        p.setPen(pen)
+        p.setBrush(QtCore.Qt.NoBrush)
+        p.drawEllipse(QtCore.QRectF(cx - halo_r, cy - halo_r, halo_r * 2.0, halo_r * 2.0))
+
+        glow_grad = QtGui.QRadialGradient(QtCore.QPointF(cx, cy), halo_r * 1.1)
+        gc = QtGui.QColor(self.base_color)
+        gc.setAlpha(int(120 * (0.5 + 0.5 * eased)))
+        glow_grad.setColorAt(0.0, gc)
+        glow_grad.setColorAt(0.6, QtGui.QColor(60, 140, 220, int(60 * (0.6 + 0.4 * eased))))
+        glow_grad.setColorAt(1.0, QtGui.QColor(0, 0, 0, 0))
+        p.setPen(QtCore.Qt.NoPen)
+        p.setBrush(glow_grad)
+        p.drawEllipse(QtCore.QRectF(cx - halo_r * 1.1, cy - halo_r * 1.1, halo_r * 2.2, halo_r * 2.2))
+
+        core_grad = QtGui.QRadialGradient(QtCore.QPointF(cx, cy), core_r)
+        c = self.base_color
+        core_grad.setColorAt(0.0, QtGui.QColor(220, 245, 255, int(200 * (0.8 + 0.2 * eased))))
+        core_grad.setColorAt(0.55, QtGui.QColor(c.red(), c.green(), c.blue(), int(200 * (0.7 + 0.3 * eased))))
+        core_grad.setColorAt(1.0, QtGui.QColor(0, 0, 0, 0))
+        p.setBrush(core_grad)
+        p.drawEllipse(QtCore.QRectF(cx - core_r, cy - core_r, core_r * 2.0, core_r * 2.0))
+
+        shimmer_r = core_r * 0.22
+        p.setBrush(QtGui.QColor(255, 255, 255, int(190 + 40 * math.sin(self.phase * 2.8))))
+        p.setPen(QtCore.Qt.NoPen)
+        p.drawEllipse(QtCore.QRectF(cx - shimmer_r, cy - shimmer_r, shimmer_r * 2.0, shimmer_r * 2.0))
+
+        p.save()
+        p.translate(cx, cy)
+        p.rotate(self.saturn_angle)
+        ring_w = core_r * 1.4
+        ring_h = core_r * 0.35
+        ring_pen = QtGui.QPen(QtGui.QColor(255, 255, 255, 40), 2)
+        ring_pen.setCosmetic(True)
+        p.setPen(ring_pen)
+        p.setBrush(QtCore.Qt.NoBrush)
+        p.drawEllipse(QtCore.QRectF(-ring_w, -ring_h / 2.0, ring_w * 2.0, ring_h))
+        p.restore()
+
+
+def new_image(widget):
+    image = QtGui.QImage(widget.width(), widget.height(), QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.transparent)
+    return image
+
+
+def pixels(image):
+    ptr = image.constBits()
+    ptr.setsize(image.sizeInBytes())
+    return np.frombuffer(ptr, np.uint8).astype(np.int16)
+
+
+def measure(widget, frames):
+    """Animate and paint `frames` times onto a cleared transparent image; returns ms per frame."""
+    image = new_image(widget)
+    widget.render(image)  # warm-up: first paint builds the sprites
+    elapsed = 0.0
+    for _ in range(frames):
+        widget.animate_pulse()
+        image.fill(QtCore.Qt.transparent)  # what Qt does for a translucent widget
+        start = time.perf_counter()
+        widget.render(image)
+        elapsed += time.perf_counter() - start
+    return elapsed * 1000 / frames
+
+
+def drift(old, new, samples=12):
+    """Mean absolute pixel difference between the two orbs over a pulse cycle."""
+    diffs = []
+    for i in range(samples):
+        for w in (old, new):
+            w.phase = 2 * math.pi * i / samples
+            w.saturn_angle = 0.0
+        a, b = new_image(old), new_image(new)
+        old.render(a)
+        new.render(b)
+        diffs.append(np.abs(pixels(a) - pixels(b)).mean())
+    return float(np.mean(diffs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("orbs", nargs="*", choices=[[]] + list(ORBS), help="default: all")
+    parser.add_argument("-n", "--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv[:1])  # noqa: F841
+    ok = True
+    print(f"{'orb':<6} {'engine':<8} {'paint ms':>10} {'cpu %':>8} {'pixel diff':>11}")
+    for name in args.orbs or list(ORBS):
+        size, core, pad = ORBS[name]
+        old = LegacyAuraCore(size, core, pad)
+        new = AuraCore(size, core, pad)
+        old_ms, new_ms = measure(old, args.frames), measure(new, args.frames)
+        diff = drift(old, new)
+        print(f"{name:<6} {'legacy':<8} {old_ms:>10.2f} {100 * old_ms / INTERVAL_MS:>7.1f}%")
+        print(f"{name:<6} {'sprites':<8} {new_ms:>10.2f} {100 * new_ms / INTERVAL_MS:>7.1f}% {diff:>11.2f}")
+        if new_ms >= old_ms:
+            print("  FAIL: sprites are not faster")
+            ok = False
+
+    if not ok:
+        print("\n❌ Orb check failed")
+        return 1
+    print("\n✅ Orb check passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Per-frame cost of getting a frame into the detector and its boxes back out.
+
+Compares the old detect path with vision/preprocess.py on the same frames:
+
+    legacy     cv2.resize + cv2.dnn.blobFromImage (both allocate), a Python loop
+               over every SSD candidate scaling its box with a new array
+    buffered   FramePreprocessor: resize into its own buffer, blob mean-subtracted
+               in place; vision/postprocess.py: one masked numpy pass over the
+               candidates, small boxes dropped, NMS
+    enroll     the same for enrollment, which used to resize to 320x240 first
+
+The forward pass itself is left out (a stand-in returns SSD-shaped output:
+the synthetic scene's faces, --duplicates shifted copies of each as the SSD
+gives for one face, plus low-score rows up to --candidates, as the res10
+model always returns 200). Reports per frame:
+
+    ms         wall time
+    boxes      faces handed on to recognition (legacy keeps the duplicates)
+    KB peak    temporary memory the frame needed on top of what was live
+               before it (tracemalloc peak; numpy and OpenCV outputs count)
+    blocks     memory blocks still allocated afterwards that weren't before
+
+    python bench/bench_preprocess.py
+    python bench/bench_preprocess.py --size 1280x720 -n 500
+
+Exits non-zero if the buffered path needs more temporary memory than legacy or
+doesn't return exactly one box per face. The time is reported, not gated: at
+about 1 ms a frame both paths are within run-to-run noise of each other.
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CODES_DIR))
+
+from bench_face_pipeline import FakeNet, SyntheticCapture  # noqa: E402
+from vision import FramePreprocessor, detect_faces  # noqa: E402
+
+
+class DenseFakeNet(FakeNet):
+    """FakeNet padded to `candidates` rows of low-score noise, like the real SSD output."""
+
+    def __init__(self, capture, candidates=200, duplicates=1, seed=0):
+        super().__init__(capture)
+        self.duplicates = duplicates
+        rng = np.random.default_rng(seed)
+        self.noise = np.zeros((candidates, 7), np.float32)
+        self.noise[:, 2] = rng.uniform(0.0, 0.3, candidates)
+        corners = rng.uniform(0, 0.8, (candidates, 2))
+        self.noise[:, 3:5] = corners
+        self.noise[:, 5:7] = corners + rng.uniform(0.05, 0.2, (candidates, 2))
+
+    def forward(self):
+        out = self.noise.copy()[None, None]
+        faces = super().forward()[0, 0]
+        for copy in range(self.duplicates + 1):
+            rows = out[0, 0, copy * len(faces):(copy + 1) * len(faces)]
+            rows[:] = faces
+            rows[:, 2] -= 0.02 * copy
+            rows[:, 3:7] += 0.01 * copy
+        return out
+
+
+def legacy_detect(net, frame, confidence=0.6):
+    """detect_faces() as it was: a fresh resize and blob, and a loop over every candidate."""
+    h, w = frame.shape[:2]
+    blob = cv2.dnn.blobFromImage(cv2.resize(frame, (300, 300)), 1.0, (300, 300), (104.0, 177.0, 123.0))
+    net.setInput(blob)
+    detections = net.forward()
+    boxes = []
+    for i in range(detections.shape[2]):
+        score = float(detections[0, 0, i, 2])
+        if score > confidence:
+            box = detections[0, 0, i, 3:7] * np.array([w, h, w, h])
+            x1, y1, x2, y2 = box.astype("int")
+            x1, y1 = max(0, x1), max(0, y1)
+            x2, y2 = min(w - 1, x2), min(h - 1, y2)
+            boxes.append((x1, y1, x2, y2, score))
+    return boxes
+
+
+def legacy_enroll_detect(net, frame):
+    """capture_faces() as it was: detect on a 320x240 copy, scale the boxes back."""
+    small = cv2.resize(frame, (320, 240))
+    sx, sy = frame.shape[1] / 320, frame.shape[0] / 240
+    return [(int(x1 * sx), int(y1 * sy), int(x2 * sx), int(y2 * sy))
+            for x1, y1, x2, y2, _ in legacy_detect(net, small)]
+
+
+def measure(fn, frames):
+    """(ms, boxes, peak KB, leftover blocks) per frame of fn(frame) over frames (after one warm-up call)."""
+    boxes = len(fn(frames[0]))
+    t = time.perf_counter()
+    for frame in frames:
+        fn(frame)
+    ms = (time.perf_counter() - t) * 1000 / len(frames)
+
+    peaks, blocks = [], []
+    tracemalloc.start()
+    for frame in frames:
+        before = tracemalloc.get_traced_memory()[0]
+        count = len(tracemalloc.take_snapshot().traces) if frame is frames[0] else None
+        tracemalloc.reset_peak()
+        fn(frame)
+        peaks.append((tracemalloc.get_traced_memory()[1] - before) / 1024)
+        if count is not None:
+            blocks.append(len(tracemalloc.take_snapshot().traces) - count)
+    tracemalloc.stop()
+    return ms, boxes, float(np.median(peaks)), blocks[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", default="640x480", help="frame size WxH")
+    parser.add_argument("--faces", type=int, default=3)
+    parser.add_argument("--candidates", type=int, default=200, help="SSD output rows per frame")
+    parser.add_argument("--duplicates", type=int, default=1, help="extra overlapping detections per face")
+    parser.add_argument("-n", "--frames", type=int, default=200)
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+
+    capture = SyntheticCapture(size, faces=args.faces)
+    net = DenseFakeNet(capture, args.candidates, args.duplicates)
+    frames = [capture.read()[1] for _ in range(args.frames)]  # the stand-in keeps the last frame's faces
+    pre = FramePreprocessor()
+
+    paths = {
+        "legacy": lambda frame: legacy_detect(net, frame),
+        "buffered": lambda frame: detect_faces(net, frame, preprocessor=pre),
+        "enroll legacy": lambda frame: legacy_enroll_detect(net, frame),
+        "enroll": lambda frame: detect_faces(net, frame, preprocessor=pre),
+    }
+
+    results = {}
+    print(f"{'path':<14} {'ms':>8} {'boxes':>6} {'KB peak':>9} {'blocks':>7}   ({args.size}, {args.candidates} candidates)")
+    for name, fn in paths.items():
+        results[name] = measure(fn, frames)
+        ms, boxes, kb, blocks = results[name]
+        print(f"{name:<14} {ms:>8.3f} {boxes:>6} {kb:>9.1f} {blocks:>7}")
+
+    ok = all(results[new][2] <= results[old][2] and results[new][1] == args.faces
+             for new, old in (("buffered", "legacy"), ("enroll", "enroll legacy")))
+    if not ok:
+        print("\n❌ Preprocessing check failed")
+        return 1
+    print("\n✅ Preprocessing check passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Region-of-interest detection (vision/roi.py) against full-frame passes.
+
+A synthetic greeting spot: visitors appear small at the back of the frame
+(about 20 px), walk up until their face is --max-side px, stay a while and
+leave, a new one every --every frames. The detector is a stand-in with the
+SSD's two limits:
+
+    cost      --ssd-ms for a 300x300 input, scaled with the input's area
+              (a 160 px crop costs about a quarter)
+    size      faces under --min-px in the detector input are missed, so a
+              full frame squashed to 300x300 loses the distant ones
+
+Reports per mode:
+
+    ms         detection time per frame
+    passes     full-frame / crop passes
+    recall     visible faces found (IoU >= 0.5)
+    precision  boxes that are faces
+    noticed    frames from a visitor appearing until first detected
+
+    python bench/bench_roi.py
+    python bench/bench_roi.py --size 1280x720 --ssd-ms 60 -n 600
+
+Exits non-zero if the ROI mode is slower or finds fewer faces than full-frame.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CODES_DIR))
+
+from bench_face_pipeline import face_texture  # noqa: E402
+from vision import DETECTION_CONFIDENCE, SSD_SIZE, Detector, RoiScheduler, detect_faces  # noqa: E402
+from vision.roi import iou  # noqa: E402
+
+
+class ApproachScene:
+    """Visitors walking up to the camera: each face grows from 20 px to max_side, then stays and leaves."""
+
+    def __init__(self, size=(640, 480), every=60, approach=45, stay=40, max_side=140, seed=0):
+        self.w, self.h = size
+        self.every, self.approach, self.stay, self.max_side = every, approach, stay, max_side
+        self.rng = np.random.default_rng(seed)
+        self.background = self.rng.integers(20, 90, (self.h, self.w, 3), dtype=np.uint8)
+        self.visitors = []
+        self.count = 0
+        self.boxes = []  # (visitor, (x1, y1, x2, y2)) of the last frame
+
+    def read(self):
+        if self.count % self.every == 0:
+            # they come in around the spot the robot faces: the middle third of the frame
+            self.visitors.append({
+                "id": len(self.visitors), "start": self.count, "person": len(self.visitors) % 3,
+                "x": self.rng.uniform(self.w / 3, 2 * self.w / 3), "y": self.rng.uniform(self.h / 3, self.h / 2),
+            })
+        frame = self.background.copy()
+        self.boxes = []
+        for visitor in self.visitors:
+            age = self.count - visitor["start"]
+            if age >= self.approach + self.stay:
+                continue
+            side = int(20 + (self.max_side - 20) * min(1.0, age / self.approach))
+            x = int(np.clip(visitor["x"] - side / 2, 0, self.w - side))
+            y = int(np.clip(visitor["y"] - side / 2, 0, self.h - side))
+            frame[y:y + side, x:x + side] = cv2.resize(face_texture(visitor["person"]), (side, side))[:, :, None]
+            self.boxes.append((visitor["id"], (x, y, x + side, y + side)))
+        self.count += 1
+        return True, frame
+
+
+class FakeSSD(Detector):
+    """Finds the scene's faces that are big enough in its input, at a cost that grows with the input area."""
+
+    name = "fake"
+
+    def __init__(self, scene, ssd_ms, min_px, scheduler=None):
+        self.scene = scene
+        self.ssd_ms = ssd_ms
+        self.min_px = min_px
+        self.scheduler = scheduler
+
+    def detect(self, image, confidence):
+        if image.base is None:  # the whole frame: squashed to 300x300
+            x0 = y0 = 0
+            size = SSD_SIZE
+        else:  # a crop, a view into the frame: find where it starts
+            offset = image.__array_interface__["data"][0] - image.base.__array_interface__["data"][0]
+            y0, rest = divmod(offset, image.base.strides[0])
+            x0 = rest // image.base.strides[1]
+            size = self.scheduler.input_size(image.shape)
+        h, w = image.shape[:2]
+        cv2.resize(image, size)
+        time.sleep(self.ssd_ms * size[0] * size[1] / (SSD_SIZE[0] * SSD_SIZE[1]) / 1000)
+
+        sx, sy = size[0] / w, size[1] / h
+        found = []
+        for _, (x1, y1, x2, y2) in self.scene.boxes:
+            cx1, cy1, cx2, cy2 = max(x1 - x0, 0), max(y1 - y0, 0), min(x2 - x0, w), min(y2 - y0, h)
+            if cx2 <= cx1 or cy2 <= cy1 or (cx2 - cx1) * (cy2 - cy1) < 0.8 * (x2 - x1) * (y2 - y1):
+                continue
+            if min((cx2 - cx1) * sx, (cy2 - cy1) * sy) >= self.min_px:
+                found.append((cx1, cy1, cx2, cy2, 0.95))
+        return found
+
+
+def run(mode, args, size):
+    scene = ApproachScene(size, args.every, max_side=args.max_side)
+    scheduler = RoiScheduler() if mode == "roi" else None
+    net = FakeSSD(scene, args.ssd_ms, args.min_px, scheduler)
+    times, hits, truths, found = [], 0, 0, 0
+    noticed = {}
+    for _ in range(args.frames):
+        _, frame = scene.read()
+        t = time.perf_counter()
+        if scheduler is not None:
+            boxes = scheduler.detect(net, frame, DETECTION_CONFIDENCE)
+        else:
+            boxes = detect_faces(net, frame, DETECTION_CONFIDENCE)
+        times.append((time.perf_counter() - t) * 1000)
+
+        found += len(boxes)
+        truths += len(scene.boxes)
+        unmatched = [box[:4] for box in boxes]
+        for visitor, truth in scene.boxes:
+            best = max(unmatched, key=lambda box: iou(truth, box), default=None)
+            if best is not None and iou(truth, best) >= 0.5:
+                unmatched.remove(best)
+                hits += 1
+                noticed.setdefault(visitor, scene.count - 1 - scene.visitors[visitor]["start"])
+
+    passes = f"{scheduler.full_passes}/{scheduler.roi_passes}" if scheduler else f"{args.frames}/0"
+    return {
+        "ms": float(np.mean(times)),
+        "passes": passes,
+        "recall": hits / truths if truths else 0.0,
+        "precision": hits / found if found else 0.0,
+        "noticed": float(np.mean(list(noticed.values()))) if noticed else float("nan"),
+        "missed": len(scene.visitors) - len(noticed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", default="640x480", help="frame size WxH")
+    parser.add_argument("-n", "--frames", type=int, default=300)
+    parser.add_argument("--every", type=int, default=60, help="frames between visitors")
+    parser.add_argument("--max-side", type=int, default=140, help="face size when the visitor arrives (px)")
+    parser.add_argument("--ssd-ms", type=float, default=20.0, help="cost of a 300x300 forward pass")
+    parser.add_argument("--min-px", type=int, default=20, help="smallest face the detector finds, in input pixels")
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+
+    results = {}
+    print(f"{'mode':<6} {'ms':>8} {'passes':>9} {'recall':>7} {'precision':>10} {'noticed':>8} {'missed':>7}"
+          f"   ({args.size}, {args.frames} frames)")
+    for mode in ("full", "roi"):
+        r = results[mode] = run(mode, args, size)
+        print(f"{mode:<6} {r['ms']:>8.2f} {r['passes']:>9} {r['recall']:>7.2f} {r['precision']:>10.2f} "
+              f"{r['noticed']:>8.1f} {r['missed']:>7}")
+
+    full, roi = results["full"], results["roi"]
+    if roi["ms"] > full["ms"] or roi["recall"] < full["recall"]:
+        print("\n❌ ROI detection check failed")
+        return 1
+    print(f"\n✅ ROI detection check passed ({full['ms'] / roi['ms']:.1f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
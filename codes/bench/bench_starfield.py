@@ -0,0 +1,118 @@
+"""
+FPS / CPU benchmark for the star background.
+
+Renders the old per-star SpaceBackground and the NumPy starfield (aura_ui/starfield.py)
+offscreen at a kiosk resolution and reports, per frame (one tick + one paint):
+
+    frame ms   wall time
+    cpu ms     process CPU time
+    max fps    1000 / frame ms
+    cpu %      share of one core the background costs at its timer rate
+
+    python bench/bench_starfield.py                      # 1505/2005/2505 stars, 1920x1080
+    python bench/bench_starfield.py --stars 145 --size 1280x720 -n 300
+
+Exits non-zero when the new starfield costs more than --max-cpu percent of a
+core at the 60 ms timer rate.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CODES_DIR))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtGui, QtWidgets  # noqa: E402
+
+from aura_ui.starfield import SpaceBackground  # noqa: E402
+
+INTERVAL_MS = 60
+
+
+class LegacySpaceBackground(QtWidgets.QWidget):
+    """The per-star background as it was in t3.py/t6.py/test2.py, kept for comparison."""
+
+    def __init__(self, star_count=1505, parent=None):
+        super().__init__(parent)
+        self.stars = []
+        for _ in range(star_count):
+            x = random.uniform(0, 1920)
+            y = random.uniform(0, 1080)
+            base_brightness = random.randint(160, 255)
+            phase = random.random() * math.pi * 2
+            size = random.choice([1, 1, 2])
+            self.stars.append([x, y, base_brightness, phase, size])
+
+    def update_twinkle(self):
+        for s in self.stars:
+            s[3] += 0.06 + random.random() * 0.01
+        self.update()
+
+    def paintEvent(self, event):
+        p = QtGui.QPainter(self)
+        p.setRenderHint(QtGui.QPainter.Antialiasing)
+        p.fillRect(self.rect(), QtGui.QColor(2, 6, 18))
+        grad = QtGui.QLinearGradient(self.width() * 0.2, 0, self.width(), self.height())
+        grad.setColorAt(0.0, QtGui.QColor(10, 6, 20, 0))
+        grad.setColorAt(1.0, QtGui.QColor(40, 10, 70, 40))
+        p.fillRect(self.rect(), grad)
+        for x, y, base_brightness, phase, size in self.stars:
+            sx = int(x) % max(1, self.width())
+            sy = int(y) % max(1, self.height())
+            brightness = base_brightness + int(60 * math.sin(time.time() * 0.8 + phase))
+            brightness = max(80, min(255, brightness))
+            p.setPen(QtCore.Qt.NoPen)
+            p.setBrush(QtGui.QColor(brightness, brightness, brightness))
+            p.drawEllipse(sx, sy, size, size)
+
+
+def measure(widget, frames, size):
+    """Tick + paint `frames` times into an offscreen image; returns (wall ms, cpu ms) per frame."""
+    widget.resize(*size)
+    image = QtGui.QImage(size[0], size[1], QtGui.QImage.Format_RGB32)
+    widget.render(image)  # warm-up: first paint builds caches
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(frames):
+        widget.update_twinkle()
+        widget.render(image)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return wall * 1000 / frames, cpu * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stars", type=int, nargs="+", default=[1505, 2005, 2505])
+    parser.add_argument("--size", default="1920x1080", help="widget size WxH")
+    parser.add_argument("-n", "--frames", type=int, default=100)
+    parser.add_argument("--max-cpu", type=float, default=25.0, help="fail above this %% of a core at 60 ms ticks")
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+
+    app = QtWidgets.QApplication(sys.argv[:1])  # noqa: F841
+    ok = True
+    print(f"{'stars':>6} {'engine':<8} {'frame ms':>10} {'cpu ms':>10} {'max fps':>10} {'cpu %':>8}")
+    for count in args.stars:
+        for label, cls in (("legacy", LegacySpaceBackground), ("numpy", SpaceBackground)):
+            widget = cls(count)
+            frame_ms, cpu_ms = measure(widget, args.frames, size)
+            load = 100 * cpu_ms / INTERVAL_MS
+            print(f"{count:>6} {label:<8} {frame_ms:>10.2f} {cpu_ms:>10.2f} {1000 / frame_ms:>10.0f} {load:>7.1f}%")
+            if label == "numpy" and load > args.max_cpu:
+                print(f"  FAIL: over {args.max_cpu}% of a core")
+                ok = False
+            widget.deleteLater()
+
+    if not ok:
+        print("\n❌ Starfield check failed")
+        return 1
+    print("\n✅ Starfield check passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+Startup benchmark for the GUI launchers: time-to-first-paint and time-to-ready.
+
+Each launcher starts in a fresh interpreter (cold imports, like a kiosk boot).
+Times are measured from just before the child process is spawned:
+
+    import       launcher module imported (Qt + whatever it imports at top level)
+    first paint  the main window receives its first paint event
+    ready        the speech/NLP stack has loaded (launchers with a StackLoader);
+                 the same as first paint for launchers without one
+
+    python bench/bench_startup.py                      # every launcher, offscreen
+    python bench/bench_startup.py main_with_audio -n 5
+    python bench/bench_startup.py --platform xcb       # real display on the kiosk
+
+Exits non-zero when a launcher imports the heavy stack at module top again, or
+when first paint exceeds --max-first-paint.
+"""
+import argparse
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CODES_DIR))
+
+# launcher module -> main window class
+LAUNCHERS = {
+    "main_with_audio": "BotGUI",
+    "mg": "AuraMain",
+    "t3": "AuraMain",
+    "t6": "AuraMain",
+    "aarav_gui": "AuraMain",
+    "mohit_gui": "AuraMain",
+}
+
+# must not be imported before the window is up
+HEAVY_MODULES = ["torch", "sentence_transformers", "onnxruntime", "vosk", "rapidfuzz", "sounddevice", "queries"]
+
+
+def run_child(launcher, t0, platform, timeout):
+    """Start one launcher, wait for first paint (and the stack), print a JSON report."""
+    module = importlib.import_module(launcher)
+    report = {
+        "launcher": launcher,
+        "import_s": time.monotonic() - t0,
+        "heavy_at_import": [m for m in HEAVY_MODULES if m in sys.modules],
+    }
+    os.environ["QT_QPA_PLATFORM"] = platform  # main_with_audio.py forces xcb at import
+
+    from PyQt5 import QtCore, QtWidgets
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+
+    class FirstPaint(QtCore.QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QtCore.QEvent.Paint and "first_paint_s" not in report:
+                report["first_paint_s"] = time.monotonic() - t0
+                if loader is None:
+                    report["ready_s"] = report["first_paint_s"]
+                    QtCore.QTimer.singleShot(0, app.quit)
+            return False
+
+    paint_filter = FirstPaint()
+    app.installEventFilter(paint_filter)
+
+    cls = getattr(module, LAUNCHERS[launcher])
+    window = cls(module.Config) if hasattr(module, "Config") else cls()  # aura_ui launchers pass their preset
+    window.show()
+    loader = getattr(window, "stack_loader", None)
+    if loader is not None:
+        def on_loaded(_):
+            report["ready_s"] = time.monotonic() - t0
+            report["stack_steps"] = loader.timings
+            app.quit()
+
+        def on_failed(error):
+            report["error"] = error
+            app.quit()
+
+        loader.loaded.connect(on_loaded)
+        loader.failed.connect(on_failed)
+
+    QtCore.QTimer.singleShot(int(timeout * 1000), app.quit)
+    app.exec_()
+    if loader is not None:
+        loader.wait(1000)
+    print(json.dumps(report))
+
+
+def spawn(launcher, platform, timeout):
+    env = dict(os.environ, QT_QPA_PLATFORM=platform, AURA_SERVICES="0")  # no resident services
+    t0 = time.monotonic()
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", launcher, "--t0", repr(t0), "--platform", platform,
+         "--timeout", str(timeout)],
+        cwd=str(CODES_DIR), capture_output=True, text=True, env=env,
+    )
+    lines = [line for line in out.stdout.strip().splitlines() if line.startswith("{")]
+    if out.returncode != 0 or not lines:
+        print(out.stderr[-2000:])
+        raise RuntimeError(f"{launcher} failed to start")
+    return json.loads(lines[-1])
+
+
+def median_of(reports, key):
+    values = [r[key] for r in reports if key in r]
+    return statistics.median(values) if values else None
+
+
+def fmt(seconds):
+    return f"{seconds:>10.2f}" if seconds is not None else f"{'-':>10}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("launchers", nargs="*", choices=[[]] + list(LAUNCHERS), help="default: all")
+    parser.add_argument("-n", "--runs", type=int, default=3, help="cold starts per launcher (median is reported)")
+    parser.add_argument("--platform", default="offscreen", help="Qt platform plugin (offscreen, xcb, eglfs)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds to wait for the stack to load")
+    parser.add_argument("--max-first-paint", type=float, default=3.0, help="fail above this many seconds")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--t0", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.t0, args.platform, args.timeout)
+        return 0
+
+    ok = True
+    print(f"{'launcher':<16} {'import s':>10} {'paint s':>10} {'ready s':>10}")
+    for launcher in args.launchers or list(LAUNCHERS):
+        reports = [spawn(launcher, args.platform, args.timeout) for _ in range(args.runs)]
+        first_paint = median_of(reports, "first_paint_s")
+        print(f"{launcher:<16} {fmt(median_of(reports, 'import_s'))} {fmt(first_paint)} {fmt(median_of(reports, 'ready_s'))}")
+
+        heavy = sorted({m for r in reports for m in r["heavy_at_import"]})
+        if heavy:
+            print(f"  FAIL: imports {', '.join(heavy)} before the window is up")
+            ok = False
+        if first_paint is None or first_paint > args.max_first_paint:
+            print(f"  FAIL: first paint over {args.max_first_paint}s")
+            ok = False
+        for error in {r["error"] for r in reports if "error" in r}:
+            print(f"  stack failed to load: {error}")
+        steps = reports[-1].get("stack_steps")
+        if steps:
+            print("  " + " ".join(f"{name}={s:.2f}s" for name, s in steps.items()))
+
+    if not ok:
+        print("\n❌ Startup check failed")
+        return 1
+    print("\n✅ Startup check passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
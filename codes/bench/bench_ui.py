@@ -0,0 +1,87 @@
+"""
+Render benchmark for the whole AURA window, one row per preset.
+
+Builds the aura_ui window for each preset (aura_ui/presets.py) offscreen at a
+kiosk resolution, without starting the resident services, and renders it
+frame by frame: every animation steps once (stars, orb), then the full window
+is painted into a pixmap. Reports per frame:
+
+    frame ms   wall time
+    cpu ms     process CPU time
+    max fps    1000 / frame ms
+    cpu %      share of one core at the preset's FPS (a full repaint every tick,
+               so an upper bound: Qt only repaints what changed)
+
+    python bench/bench_ui.py                       # every preset, 1920x1080
+    python bench/bench_ui.py t6 mg --size 1280x720 -n 300
+
+Exits non-zero when a preset cannot keep up with its own FPS (cpu % over
+--max-cpu).
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CODES_DIR))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["AURA_SERVICES"] = "0"  # the window only, no recognizer/enroller/voice
+
+from PyQt5 import QtCore, QtGui, QtWidgets  # noqa: E402
+
+from aura_ui import PRESETS, AuraMain  # noqa: E402
+
+
+def measure(config, frames, size):
+    """Step the animations and render the window `frames` times; returns (wall ms, cpu ms) per frame."""
+    window = AuraMain(config)
+    window.showNormal()
+    window.resize(*size)
+    QtWidgets.QApplication.processEvents()  # layout, polish
+    pixmap = QtGui.QPixmap(*size)  # widgets with a graphics effect (the glowing buttons) skip QImage targets
+    window.render(pixmap)  # warm-up: first paint builds caches and sprites
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(frames):
+        window.background.update_twinkle(1.0)
+        window.aura_core.animate_pulse(1.0)
+        window.render(pixmap)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    window.close()
+    window.deleteLater()
+    QtWidgets.QApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    return wall * 1000 / frames, cpu * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("presets", nargs="*", choices=[[]] + list(PRESETS), help="default: all")
+    parser.add_argument("--size", default="1920x1080", help="window size WxH")
+    parser.add_argument("-n", "--frames", type=int, default=100)
+    parser.add_argument("--max-cpu", type=float, default=100.0, help="fail above this %% of a core at the preset FPS")
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+
+    app = QtWidgets.QApplication(sys.argv[:1])  # noqa: F841
+    ok = True
+    print(f"{'preset':<10} {'stars':>6} {'orb':<8} {'fps':>4} {'frame ms':>10} {'cpu ms':>10} {'max fps':>10} {'cpu %':>8}")
+    for name in args.presets or list(PRESETS):
+        config = PRESETS[name]
+        frame_ms, cpu_ms = measure(config, args.frames, size)
+        load = cpu_ms * config.FPS / 10
+        print(f"{name:<10} {config.STAR_COUNT:>6} {config.ORB:<8} {config.FPS:>4} {frame_ms:>10.2f} {cpu_ms:>10.2f} "
+              f"{1000 / frame_ms:>10.0f} {load:>7.1f}%")
+        if load > args.max_cpu:
+            print(f"  FAIL: over {args.max_cpu}% of a core at {config.FPS} fps")
+            ok = False
+
+    if not ok:
+        print("\n❌ UI render check failed")
+        return 1
+    print("\n✅ UI render check passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,395 @@
+"""
+End-to-end latency benchmark for a voice turn: no mic, no speaker, no cloud.
+
+Prerecorded utterances (../audioSamples/*.wav, or --utterance) go through the
+assistant's own turn code, record -> STT -> match -> TTS -> playback, with
+the hardware and the services swapped for local stand-ins:
+
+    sounddevice   sd.rec() "records" the next utterance (resampled, padded with silence)
+    assemblyai    a Transcriber that "hears" the utterance's text (queries_api.py)
+    vosk          a KaldiRecognizer that does the same (queries.py)
+    piper         a voice that returns silent WAV of the answer's spoken length
+    pyttsx3       an engine that does the same, then plays it (queries.py)
+    playback      a null sink instead of aplay
+
+The sample WAVs have no transcripts, so each one is "heard" as one of the
+knowledge base's FAQ questions in turn. --stt-ms / --tts-ms add a fixed
+service latency (AssemblyAI is then polled the way the real one is), and
+--audio-speed 1 makes recording and playback take their real length (the
+default 0 skips the waiting, so the numbers are the assistant's own work).
+
+    python bench/bench_voice_turn.py                             # queries_api.py, 20 turns
+    python bench/bench_voice_turn.py --script queries -n 10
+    python bench/bench_voice_turn.py --stt-ms 800 --tts-ms 150   # cloud-like STT, Pi-like TTS
+    python bench/bench_voice_turn.py --utterance hi.wav="where is the library"
+    python bench/bench_voice_turn.py --json before.json          # save for later
+    python bench/bench_voice_turn.py --compare before.json       # fail on a >10% slower answer
+
+Reports per-stage latency percentiles (ms) and the turn latency:
+
+    answer     end of the recording -> first audio at the sink (STT + match + TTS)
+    turn       the whole turn, recording and playback included
+
+Exits non-zero when --compare finds the p50 answer latency regressed by more
+than --max-regression.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+import wave
+from pathlib import Path
+
+import numpy as np
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+SAMPLES_DIR = CODES_DIR.parent / "audioSamples"
+sys.path.insert(0, str(CODES_DIR))
+
+SAMPLE_RATE = 16000
+WORDS_PER_SECOND = 2.5  # speaking rate of the stand-in voice
+STAGES = {
+    "queries_api": ("record", "transcribe", "match", "tts_first_audio", "speak"),
+    "queries": ("listen", "match", "speak"),
+}
+
+
+def read_wav(path, samplerate=SAMPLE_RATE):
+    """Mono int16 samples of a WAV file at samplerate."""
+    with wave.open(str(path), "rb") as f:
+        rate, channels, width = f.getframerate(), f.getnchannels(), f.getsampwidth()
+        data = f.readframes(f.getnframes())
+    if width != 2:
+        raise ValueError(f"{path}: only 16-bit WAV is supported")
+    samples = np.frombuffer(data, dtype=np.int16).reshape(-1, channels).mean(axis=1)
+    if rate != samplerate:
+        positions = np.arange(int(len(samples) * samplerate / rate)) * rate / samplerate
+        samples = np.interp(positions, np.arange(len(samples)), samples)
+    return samples.astype(np.int16)
+
+
+def silent_wav(seconds, samplerate=22050):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(samplerate)
+        f.writeframes(bytes(2 * int(seconds * samplerate)))
+    return buffer.getvalue()
+
+
+def wav_seconds(wav_data):
+    with wave.open(io.BytesIO(wav_data), "rb") as f:
+        return f.getnframes() / f.getframerate()
+
+
+class Harness:
+    """Shared state of the stand-ins: the utterance being "spoken" and the delays."""
+
+    def __init__(self, utterances, stt_ms=0.0, tts_ms=0.0, audio_speed=0.0):
+        self.utterances = utterances  # [(name, samples, text)]
+        self.stt_s = stt_ms / 1000
+        self.tts_s = tts_ms / 1000
+        self.audio_speed = audio_speed
+        self.current = None
+        self.recorded_at = None     # perf_counter() when the turn's recording ended
+        self.first_audio_at = None  # ... and when its first audio reached the sink
+
+    def next_utterance(self, turn):
+        self.current = self.utterances[turn % len(self.utterances)]
+        self.recorded_at = self.first_audio_at = None
+        return self.current
+
+    def answer_ms(self):
+        return (self.first_audio_at - self.recorded_at) * 1000
+
+    def wait_audio(self, seconds, stop_event=None):
+        if self.audio_speed > 0:
+            (stop_event or threading.Event()).wait(seconds * self.audio_speed)
+
+    # ----- sounddevice -----
+    def rec(self, frames, samplerate=SAMPLE_RATE, channels=1, dtype="int16", device=None):
+        _, samples, _ = self.current
+        recording = np.zeros((frames, channels), dtype=dtype)
+        n = min(frames, len(samples))
+        recording[:n, 0] = samples[:n]
+        self.wait_audio(frames / samplerate)  # sd.rec() + sd.wait() block for the whole window
+        self.recorded_at = time.perf_counter()
+        return recording
+
+    # ----- TTS -----
+    def synthesize(self, text):
+        time.sleep(self.tts_s)
+        return silent_wav(max(len(text.split()), 1) / WORDS_PER_SECOND)
+
+    def play(self, wav_data, stop_event=None):
+        """The null audio sink."""
+        if self.first_audio_at is None:
+            self.first_audio_at = time.perf_counter()
+        self.wait_audio(wav_seconds(wav_data), stop_event)
+
+    # ----- fake modules -----
+    def modules(self):
+        harness = self
+
+        sounddevice = types.ModuleType("sounddevice")
+        sounddevice.PortAudioError = type("PortAudioError", (Exception,), {})
+        sounddevice.rec = self.rec
+        sounddevice.wait = lambda: None
+        sounddevice.query_devices = lambda *args, **kwargs: [
+            {"name": "Bench USB mic", "max_input_channels": 1, "max_output_channels": 0,
+             "default_samplerate": float(SAMPLE_RATE)},
+            {"name": "Bench null sink", "max_input_channels": 0, "max_output_channels": 2,
+             "default_samplerate": 22050.0},
+        ]
+        sounddevice._initialize = sounddevice._terminate = lambda: None
+
+        class Transcript:
+            def __init__(self, text, ready_at):
+                self.id = id(self)
+                self.text = text
+                self.error = None
+                self.ready_at = ready_at
+
+            @property
+            def status(self):
+                return "completed" if time.perf_counter() >= self.ready_at else "processing"
+
+        transcripts = {}
+
+        class Transcriber:
+            def transcribe(self, filename):
+                transcript = Transcript(harness.current[2], time.perf_counter() + harness.stt_s)
+                transcripts[transcript.id] = transcript
+                return transcript
+
+        assemblyai = types.ModuleType("assemblyai")
+        assemblyai.settings = types.SimpleNamespace(api_key=None)
+        assemblyai.Transcriber = Transcriber
+        assemblyai.Transcript = types.SimpleNamespace(get_by_id=transcripts.__getitem__)
+
+        class KaldiRecognizer:
+            def __init__(self, model, samplerate):
+                pass
+
+            def AcceptWaveform(self, data):
+                time.sleep(harness.stt_s)
+                return True
+
+            def Result(self):
+                return json.dumps({"text": harness.current[2]})
+
+        vosk = types.ModuleType("vosk")
+        vosk.Model = lambda path: None
+        vosk.KaldiRecognizer = KaldiRecognizer
+
+        class PiperVoice:
+            @classmethod
+            def load(cls, path):
+                return cls()
+
+            def synthesize(self, text, length_scale=1.0):
+                return harness.synthesize(text)
+
+        piper = types.ModuleType("piper")
+        piper.PiperVoice = PiperVoice
+
+        class Engine:
+            def __init__(self):
+                self.queue = []
+
+            def setProperty(self, name, value):
+                pass
+
+            def getProperty(self, name):
+                return []
+
+            def say(self, text):
+                self.queue.append(text)
+
+            def runAndWait(self):
+                for text in self.queue:
+                    harness.play(harness.synthesize(text))
+                self.queue = []
+
+            def stop(self):
+                pass
+
+        pyttsx3 = types.ModuleType("pyttsx3")
+        pyttsx3.Engine = Engine
+        pyttsx3.init = lambda *args, **kwargs: Engine()
+
+        return {"sounddevice": sounddevice, "assemblyai": assemblyai, "vosk": vosk, "piper": piper,
+                "pyttsx3": pyttsx3}
+
+
+def load_utterances(specs, kb_file):
+    """[(name, samples, text)] from --utterance wav=text specs, or the samples heard as FAQ questions."""
+    if specs:
+        pairs = [spec.split("=", 1) for spec in specs]
+    else:
+        questions = list(json.loads(Path(kb_file).read_text(encoding="utf-8"))["faq"])
+        wavs = sorted(SAMPLES_DIR.glob("*.wav"))
+        if not wavs:
+            raise SystemExit(f"No WAV files in {SAMPLES_DIR}, pass --utterance file.wav=text")
+        pairs = [(str(wav), questions[i % len(questions)]) for i, wav in enumerate(wavs)]
+    return [(Path(path).name, read_wav(path), text) for path, text in pairs]
+
+
+def import_assistant(script, harness, workdir):
+    """Import queries_api.py / queries.py against the stand-ins, writing its files into workdir."""
+    sys.modules.update(harness.modules())
+    os.chdir(workdir)  # voice_assistant.log, the turn recordings
+    assistant = __import__(script)
+    assistant.kb.stop_watching()
+    if script == "queries_api":
+        assistant.play_speech = harness.play
+        assistant.Config.BARGE_IN = False  # barge-in needs a live input stream
+        assistant.Config.RETRY_DELAY = 0.05  # transcript polling interval; the real 2 s would dominate
+    return assistant
+
+
+async def api_turns(assistant, harness, turns, warmup):
+    from conversation import ConversationEngine
+
+    engine = ConversationEngine(assistant)
+    results = []
+    try:
+        for turn in range(warmup + turns):
+            harness.next_utterance(turn)
+            _, should_continue = await engine.run_turn(turn + 1)
+            if not should_continue:
+                raise RuntimeError(f"turn {turn + 1} ended the conversation: {engine.last_timings}")
+            if turn >= warmup:
+                timings = dict(engine.last_timings)
+                timings["answer"] = harness.answer_ms()
+                timings["turn"] = timings.pop("total")
+                results.append(timings)
+    finally:
+        engine.executor.shutdown(wait=True)
+    return results
+
+
+def script_turns(assistant, harness, turns, warmup):
+    """queries.py has no engine: listen() -> get_answer() -> speak(), timed here."""
+    results = []
+    for turn in range(warmup + turns):
+        harness.next_utterance(turn)
+        timings = {}
+        start = time.perf_counter()
+        text = assistant.listen()
+        timings["listen"] = (time.perf_counter() - start) * 1000
+        t = time.perf_counter()
+        answer = assistant.get_answer(text)
+        timings["match"] = (time.perf_counter() - t) * 1000
+        t = time.perf_counter()
+        assistant.speak(answer)
+        timings["speak"] = (time.perf_counter() - t) * 1000
+        timings["turn"] = (time.perf_counter() - start) * 1000
+        timings["answer"] = harness.answer_ms()
+        if turn >= warmup:
+            results.append(timings)
+    return results
+
+
+def percentiles(samples_ms):
+    if not samples_ms:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0}
+    p50, p95, p99 = np.percentile(samples_ms, [50, 95, 99])
+    return {"p50": float(p50), "p95": float(p95), "p99": float(p99), "mean": float(np.mean(samples_ms))}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=CODES_DIR, capture_output=True,
+                              text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--script", choices=list(STAGES), default="queries_api")
+    parser.add_argument("--utterance", action="append", metavar="WAV=TEXT",
+                        help="utterance and what it says (repeatable); default: ../audioSamples")
+    parser.add_argument("-n", "--turns", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--stt-ms", type=float, default=0.0, help="simulated transcription latency")
+    parser.add_argument("--tts-ms", type=float, default=0.0, help="simulated synthesis latency per sentence")
+    parser.add_argument("--audio-speed", type=float, default=0.0,
+                        help="recording/playback time as a fraction of real time (0: no waiting)")
+    parser.add_argument("--verbose", action="store_true", help="show the assistant's own output")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="results JSON from an earlier run to compare against")
+    parser.add_argument("--max-regression", type=float, default=10.0, help="%% slower p50 answer latency that fails")
+    args = parser.parse_args()
+    json_path = Path(args.json).resolve() if args.json else None
+    compare_path = Path(args.compare).resolve() if args.compare else None
+
+    from knowledge import KB_FILE
+
+    utterances = load_utterances(args.utterance, KB_FILE)
+    harness = Harness(utterances, args.stt_ms, args.tts_ms, args.audio_speed)
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory(prefix="bench_voice_") as workdir:
+        quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        with quiet:
+            assistant = import_assistant(args.script, harness, workdir)
+            if args.script == "queries_api":
+                results = asyncio.run(api_turns(assistant, harness, args.turns, args.warmup))
+            else:
+                results = script_turns(assistant, harness, args.turns, args.warmup)
+        os.chdir(CODES_DIR)
+
+    stages = STAGES[args.script] + ("answer", "turn")
+    summary = {stage: percentiles([timings[stage] for timings in results]) for stage in stages}
+    print(f"script     {args.script}.py, {len(utterances)} utterances, {args.turns} turns "
+          f"(stt {args.stt_ms:.0f} ms, tts {args.tts_ms:.0f} ms, audio x{args.audio_speed:g})")
+    print(f"\n{'stage':<16} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'mean ms':>9}")
+    for stage in stages:
+        row = summary[stage]
+        print(f"{stage:<16} {row['p50']:>9.2f} {row['p95']:>9.2f} {row['p99']:>9.2f} {row['mean']:>9.2f}")
+
+    results = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("json", "compare", "verbose")},
+        "stages": summary,
+        "turns": results,
+    }
+    if json_path:
+        json_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nsaved      {json_path}")
+
+    if compare_path:
+        before = json.loads(compare_path.read_text(encoding="utf-8"))
+        print(f"\ncompared with {before.get('commit') or args.compare}:")
+        for stage in stages:
+            if stage not in before["stages"]:
+                continue
+            old, new = before["stages"][stage]["p50"], summary[stage]["p50"]
+            change = (new - old) / old * 100 if old else 0.0
+            print(f"  {stage:<14} p50 {old:>9.2f} -> {new:>9.2f} ms ({change:+.1f}%)")
+        old, new = before["stages"]["answer"]["p50"], summary["answer"]["p50"]
+        if old and (new - old) / old * 100 > args.max_regression:
+            print(f"\n❌ Answer latency regressed more than {args.max_regression}%")
+            return 1
+
+    print("\n✅ Voice turn benchmark passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
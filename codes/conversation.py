@@ -0,0 +1,344 @@
+"""
+Pipelined conversation engine for the voice assistants (queries_api.py, queries_api2.py).
+
+Each turn still runs record -> transcribe -> match -> speak, but the blocking
+stages run in worker threads under asyncio so they can overlap:
+  - the fixed prompts (errors, retry question, goodbye) are synthesized in the
+    background while the first recording is running, so they play instantly
+  - the turn's recording is deleted while the answer is being synthesized
+  - answers are synthesized sentence by sentence; sentence N+1 is synthesized
+    while sentence N is playing
+  - the microphone is armed for the next turn as soon as playback finishes,
+    there are no fixed sleeps between stages
+  - with Config.BARGE_IN the mic stays open while speaking (barge_in.py);
+    if the visitor talks, playback stops and what they said becomes the
+    next turn's recording
+
+The assistant module passed in must provide: Config, logger, kb,
+record_audio(), transcribe_audio(), compare_to_facts(), should_exit(),
+synthesize_speech(text) -> bytes, play_speech(bytes, stop_event=None),
+speak(text), cleanup_files(), get_conversation_filename(). duck_speech(bool)
+is optional and enables BARGE_IN_ACTION = "duck".
+
+Setting stop_event (e.g. from the voice service) ends the conversation at the
+next turn boundary.
+"""
+import asyncio
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from log_pipeline import set_turn
+from metrics import metrics
+
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+YES_WORDS = ["yes", "yeah", "yep", "sure", "okay", "continue"]
+NO_WORDS = ["no", "nope", "exit", "stop", "quit"]
+
+PROMPTS = {
+    "record_failed": "Failed to record audio. Please check your microphone.",
+    "transcribe_failed": "Could not transcribe audio. Please try speaking more clearly.",
+    "too_many_errors": "Too many errors occurred. Ending conversation.",
+    "retry": "Would you like to try again? Say yes to continue or no to exit.",
+    "retry_yes": "Great! Let's try again.",
+    "retry_no": "Okay, ending conversation. Goodbye!",
+    "retry_default": "I'll assume you want to try again.",
+    "error": "An error occurred. Let's try again.",
+    "interrupted": "Conversation interrupted. Goodbye!",
+}
+
+
+def fixed_prompts(assistant) -> list:
+    """Every prompt the engine may speak that doesn't depend on the visitor (pre-rendered)."""
+    return list(PROMPTS.values()) + [f"Thank you for using {assistant.kb.facts['school name']} Voice Assistant. Goodbye!"]
+
+
+def format_timings(timings: dict) -> str:
+    return " ".join(f"{stage}={ms:.0f}ms" for stage, ms in timings.items())
+
+
+class ConversationEngine:
+    def __init__(self, assistant, stop_event=None, speech_cache=None):
+        self.a = assistant
+        self.config = assistant.Config
+        self.logger = assistant.logger
+        self.stop_event = stop_event or threading.Event()
+        self.speech_cache = {} if speech_cache is None else speech_cache  # text -> synthesized audio for the fixed prompts
+        self.barge_in = None  # monitor still capturing the utterance that interrupted us
+        self.last_timings = {}  # stage -> ms of the last finished turn (bench/bench_voice_turn.py)
+        self.executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="conversation")
+
+    # ----- helpers -----
+    async def call(self, fn, *args, **kwargs):
+        """Run a blocking stage in the worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(fn, *args, **kwargs))
+
+    def goodbye_prompt(self):
+        return fixed_prompts(self.a)[-1]
+
+    async def prerender_prompts(self):
+        for text in fixed_prompts(self.a):
+            if text in self.speech_cache:
+                continue
+            try:
+                self.speech_cache[text] = await self.call(self.a.synthesize_speech, text)
+            except Exception as e:
+                self.logger.warning(f"Could not pre-render prompt '{text}': {e}")
+
+    def start_barge_in(self):
+        """Open the mic for barge-in detection, or return None when disabled/unavailable."""
+        if not getattr(self.config, "BARGE_IN", False):
+            return None
+        on_speech = None
+        if getattr(self.config, "BARGE_IN_ACTION", "stop") == "duck" and hasattr(self.a, "duck_speech"):
+            on_speech = self.a.duck_speech
+        try:
+            from audio_devices import devices
+            from barge_in import BargeInMonitor
+            return BargeInMonitor(
+                device=devices.input_device(self.config.MIC_DEVICE_NAME),
+                samplerate=self.config.SAMPLE_RATE,
+                sensitivity=self.config.BARGE_IN_SENSITIVITY,
+                max_seconds=self.config.DEFAULT_DURATION,
+                on_speech=on_speech,
+            ).start()
+        except Exception as e:
+            self.logger.warning(f"Barge-in unavailable: {e}")
+            return None
+
+    async def say(self, text: str, timings: dict = None, interruptible: bool = True):
+        """
+        Speak text, overlapping synthesis of the next sentence with playback of the current one.
+        Returns True if the visitor barged in (the rest of the answer is dropped).
+        """
+        if not text:
+            return False
+        if self.barge_in is not None:
+            return True  # the visitor is already talking over us, don't start another prompt
+        print(f"\n🔊 Speaking: {text}")
+        start = time.perf_counter()
+        monitor = self.start_barge_in() if interruptible else None
+        play = self.a.play_speech if monitor is None else partial(self.a.play_speech, stop_event=monitor.triggered)
+
+        cached = self.speech_cache.get(text)
+        sentences = [cached] if cached is not None else [s for s in SENTENCE_SPLIT.split(text) if s]
+        queue = asyncio.Queue(maxsize=2)
+
+        async def produce():
+            try:
+                for item in sentences:
+                    audio = item if cached is not None else await self.call(self.a.synthesize_speech, item)
+                    await queue.put(audio)
+            except asyncio.CancelledError:
+                raise  # nobody is reading any more: no end marker (put() could block on a full queue)
+            except Exception:
+                await queue.put(None)  # wake the reader; it re-raises via `await producer`
+                raise
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        first = True
+        barged_in = False
+        played = 0  # sentences played in full
+        try:
+            while True:
+                audio = await queue.get()
+                if audio is None:
+                    break
+                if first and timings is not None:
+                    timings["tts_first_audio"] = (time.perf_counter() - start) * 1000
+                first = False
+                await self.call(play, audio)
+                played += 1
+                if monitor is not None and monitor.triggered.is_set():
+                    barged_in = True
+                    break
+            if barged_in:
+                producer.cancel()
+            else:
+                await producer
+        except Exception as e:
+            producer.cancel()
+            rest = " ".join(sentences[played:]) if cached is None else (text if not played else "")
+            self.logger.error(f"Pipelined speech failed after {played} sentence(s) ({e}), falling back to speak()")
+            if rest:
+                await self.call(self.a.speak, rest)
+        finally:
+            if monitor is not None and not barged_in:
+                monitor.stop()
+
+        if barged_in:
+            self.logger.info("Barge-in: visitor started talking, playback stopped")
+            self.barge_in = monitor
+        if timings is not None:
+            timings["speak"] = (time.perf_counter() - start) * 1000
+        return barged_in
+
+    async def record_and_transcribe(self, filename, timings, duration=None):
+        kwargs = {"filename": filename}
+        if duration is not None:
+            kwargs["duration"] = duration
+
+        t = time.perf_counter()
+        if self.barge_in is not None:
+            # the visitor interrupted the last answer; finish that capture instead of re-recording
+            monitor, self.barge_in = self.barge_in, None
+            self.logger.info("Using the barge-in capture as this turn's recording")
+            recorded_file = await self.call(monitor.wait_for_utterance, filename)
+        else:
+            recorded_file = await self.call(self.a.record_audio, **kwargs)
+        timings["record"] = (time.perf_counter() - t) * 1000
+        if recorded_file is None:
+            return None, "record_failed"
+
+        t = time.perf_counter()
+        text = await self.call(self.a.transcribe_audio, recorded_file)
+        timings["transcribe"] = (time.perf_counter() - t) * 1000
+        if text is None:
+            return None, "transcribe_failed"
+        return text, None
+
+    # ----- one turn -----
+    async def run_turn(self, turn: int):
+        """Returns (transcribed_text, should_continue)."""
+        timings = {}
+        turn_start = time.perf_counter()
+        set_turn(turn)
+        audio_file = self.a.get_conversation_filename(turn)
+        cleanup = None
+        try:
+            user_text, error = await self.record_and_transcribe(audio_file, timings)
+
+            # the recording is no longer needed, delete it while we answer
+            cleanup = asyncio.create_task(self.call(self.a.cleanup_files, audio_file))
+
+            if user_text is None:
+                print(f"\n❌ {PROMPTS[error]}")
+                await self.say(PROMPTS[error])
+                return None, False
+
+            print(f"\n🗣️ You said: {user_text}")
+            if self.a.should_exit(user_text):
+                self.logger.info("User requested to exit conversation")
+                return user_text, False
+
+            t = time.perf_counter()
+            response = self.a.compare_to_facts(user_text)
+            timings["match"] = (time.perf_counter() - t) * 1000
+            print(f"\n🤖 Bot: {response}")
+
+            await self.say(response, timings)
+            return user_text, True
+        finally:
+            if cleanup is not None:
+                await cleanup
+            else:
+                self.a.cleanup_files(audio_file)
+            timings["total"] = (time.perf_counter() - turn_start) * 1000
+            self.last_timings = timings
+            for stage, ms in timings.items():
+                metrics.observe(f"turn_{stage}", ms)
+            self.logger.info(f"Turn {turn} timings: {format_timings(timings)}", extra={"timings": timings})
+            set_turn(None)
+
+    async def ask_to_retry(self, turn: int):
+        """Ask whether to keep going. Returns True to continue, False to end."""
+        print(f"\n🤖 {PROMPTS['retry']}")
+        await self.say(PROMPTS["retry"])
+
+        # the mic arms the moment the question has finished playing
+        print("\n⏳ Waiting for your response...")
+        response_file = self.a.get_conversation_filename(turn + 1000)
+        try:
+            response_text, _ = await self.record_and_transcribe(response_file, {}, duration=5)
+        finally:
+            self.a.cleanup_files(response_file)
+
+        if response_text:
+            print(f"🗣️ You said: {response_text}")
+            words = response_text.lower()
+            if any(word in words for word in NO_WORDS):
+                print(f"\n👋 {PROMPTS['retry_no']}")
+                await self.say(PROMPTS["retry_no"], interruptible=False)
+                return False
+            if any(word in words for word in YES_WORDS):
+                print(f"\n✅ {PROMPTS['retry_yes']}")
+                await self.say(PROMPTS["retry_yes"])
+                return True
+
+        print(f"\n🤖 {PROMPTS['retry_default']}")
+        await self.say(PROMPTS["retry_default"])
+        return True
+
+    # ----- conversation loop -----
+    async def run(self) -> int:
+        print("\n" + "=" * 50)
+        print("💬 CONVERSATION MODE ACTIVE")
+        print("=" * 50)
+        print(f"Say one of these words to exit: {', '.join(self.config.EXIT_KEYWORDS)}")
+        print("=" * 50 + "\n")
+
+        prerender = asyncio.create_task(self.prerender_prompts())
+        consecutive_errors = 0
+        turn = 0
+
+        try:
+            while not self.stop_event.is_set():
+                turn += 1
+                print(f"\n{'='*50}")
+                print(f"🔄 Turn {turn}")
+                print(f"{'='*50}")
+
+                try:
+                    user_text, should_continue = await self.run_turn(turn)
+                except Exception as e:
+                    self.logger.error(f"Error in conversation turn {turn}: {e}", exc_info=True)
+                    consecutive_errors += 1
+                    if consecutive_errors >= self.config.MAX_CONSECUTIVE_ERRORS:
+                        print(f"\n❌ {PROMPTS['too_many_errors']}")
+                        await self.say(PROMPTS["too_many_errors"], interruptible=False)
+                        return 1
+                    print(f"\n⚠️ {PROMPTS['error']}")
+                    await self.say(PROMPTS["error"])
+                    continue
+
+                if user_text is None:
+                    consecutive_errors += 1
+                    self.logger.warning(f"Consecutive errors: {consecutive_errors}/{self.config.MAX_CONSECUTIVE_ERRORS}")
+                    if consecutive_errors >= self.config.MAX_CONSECUTIVE_ERRORS:
+                        print(f"\n❌ {PROMPTS['too_many_errors']}")
+                        await self.say(PROMPTS["too_many_errors"], interruptible=False)
+                        return 1
+                    if not await self.ask_to_retry(turn):
+                        return 0
+                    continue
+
+                consecutive_errors = 0
+                if not should_continue:
+                    goodbye_msg = self.goodbye_prompt()
+                    print(f"\n👋 {goodbye_msg}")
+                    await self.say(goodbye_msg, interruptible=False)
+                    self.logger.info(f"Conversation ended after {turn} turns")
+                    return 0
+            self.logger.info(f"Conversation stopped after {turn} turns")
+            return 0
+        finally:
+            prerender.cancel()
+            if self.barge_in is not None:
+                self.barge_in.stop()
+
+    def run_blocking(self) -> int:
+        """Entry point for the synchronous scripts."""
+        try:
+            return asyncio.run(self.run())
+        except KeyboardInterrupt:
+            print("\n\n⚠️ Interrupted by user")
+            self.logger.info("User interrupted conversation")
+            self.a.speak(PROMPTS["interrupted"])
+            return 0
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,3 @@
+from .base import KnowledgeBase, KB_FILE, clean
+from .intents import IntentMatcher
+from .embeddings import EmbeddingIndex, load_encoder, ENCODER_BACKEND
@@ -0,0 +1,196 @@
+"""
+KnowledgeBase: one school knowledge file, one lookup engine for every front end.
+
+Lookup order:
+  1. FAQ by sentence embedding (when embeddings are enabled)
+  2. fact intents by keyword (knowledge/intents.py)
+  3. FAQ by fuzzy string match (when fuzzy matching is enabled)
+  4. the "unknown" message
+With facts_first=False (queries.py, as before the facts were shared) steps 2
+and 3 swap, so a fuzzy FAQ match wins over a keyword fact.
+"""
+import json
+import logging
+import os
+import re
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from metrics import metrics
+
+from .intents import IntentMatcher
+from .embeddings import EmbeddingIndex
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+KB_FILE = Path(os.environ.get("AURA_KB_FILE", Path(__file__).resolve().parent / "school_kb.json"))
+_MISSING = object()  # _watch(): the file was missing at the last poll
+
+# Everything a lookup reads, swapped in as one object on reload so readers in
+# other threads never see half-rebuilt indexes.
+Snapshot = namedtuple(
+    "Snapshot",
+    "revision facts matcher faq_questions faq_answers faq_matrix messages",
+)
+
+
+def clean(text):
+    text = text.lower()
+    text = re.sub(r'[^a-z0-9\s]', '', text)
+    return text.strip()
+
+
+class KnowledgeBase:
+    def __init__(self, path=KB_FILE, use_embeddings=True, use_fuzzy=None, encoder=None):
+        self.path = Path(path)
+        self.use_fuzzy = use_embeddings if use_fuzzy is None else use_fuzzy
+        self.embeddings = EmbeddingIndex(encoder) if use_embeddings else None
+
+        self._snapshot = None
+        self._mtime = None
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._watcher = None
+        self._stop_watching = threading.Event()
+
+        self.reload()
+
+    # ----- loading -----
+    def _read(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        if config.get("schema") != SCHEMA_VERSION:
+            raise ValueError(f"{self.path}: unsupported schema {config.get('schema')!r} (expected {SCHEMA_VERSION})")
+        for key in ("facts", "intents", "messages"):
+            if key not in config:
+                raise ValueError(f"{self.path}: missing '{key}'")
+        return config
+
+    def _build(self, config, on_progress=None):
+        faq = config.get("faq", {})
+        questions = list(faq.keys())
+        matrix = None
+        if self.embeddings is not None and questions:
+            matrix = self.embeddings.build(questions, on_progress=on_progress)
+        return Snapshot(
+            revision=config.get("revision", 0),
+            facts=dict(config["facts"]),
+            matcher=IntentMatcher(config["facts"], config["intents"]),
+            faq_questions=questions,
+            faq_answers=list(faq.values()),
+            faq_matrix=matrix,
+            messages=dict(config["messages"]),
+        )
+
+    def reload(self, on_progress=None):
+        """
+        Re-read the file and rebuild the indexes. Raises on a bad file (or from
+        on_progress, see EmbeddingIndex.build); the old snapshot stays live.
+        """
+        with self._lock:
+            mtime = os.stat(self.path).st_mtime_ns
+            snapshot = self._build(self._read(), on_progress)
+            self._snapshot = snapshot
+            self._mtime = mtime
+        logger.info(f"Knowledge base loaded: {self.path.name} revision {snapshot.revision}")
+        for callback in list(self._listeners):
+            try:
+                callback(self)
+            except Exception as e:
+                logger.warning(f"Knowledge base reload listener failed: {e}")
+
+    def on_reload(self, callback):
+        """callback(kb) runs after every successful reload (in the watcher thread)."""
+        self._listeners.append(callback)
+
+    # ----- hot reload -----
+    def start_watching(self, interval=2.0):
+        """Poll the file's mtime in a daemon thread and reload when it changes."""
+        if self._watcher is not None:
+            return
+        self._stop_watching.clear()
+        self._watcher = threading.Thread(target=self._watch, args=(interval,), daemon=True, name="kb-watcher")
+        self._watcher.start()
+
+    def stop_watching(self, timeout=5.0):
+        """Stop the watcher thread and wait for it to finish."""
+        self._stop_watching.set()
+        watcher, self._watcher = self._watcher, None
+        if watcher is not None and watcher is not threading.current_thread():
+            watcher.join(timeout)
+
+    def _watch(self, interval):
+        failed_mtime = None  # the version of the file that last failed to load
+        while not self._stop_watching.wait(interval):
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except OSError as e:
+                if failed_mtime is not _MISSING:
+                    logger.error(f"Knowledge base reload failed: {e}")
+                    failed_mtime = _MISSING
+                continue
+            if mtime in (self._mtime, failed_mtime):
+                continue
+            try:
+                self.reload()
+            except Exception as e:
+                # half-written or invalid file: keep serving the previous snapshot until it changes again
+                failed_mtime = mtime
+                logger.error(f"Knowledge base reload failed: {e}")
+
+    # ----- lookups -----
+    @property
+    def facts(self):
+        return self._snapshot.facts
+
+    @property
+    def revision(self):
+        return self._snapshot.revision
+
+    def message(self, key):
+        return self._snapshot.messages[key]
+
+    def lookup(self, query, semantic_threshold=0.55, fuzzy_threshold=30, facts_first=True):
+        """Return (answer, source) where source is faq/facts/fuzzy/empty/unknown."""
+        with metrics.timer("kb_lookup"):
+            answer, source = self._lookup(query, semantic_threshold, fuzzy_threshold, facts_first)
+        metrics.count(f"kb_{source}")
+        return answer, source
+
+    def _lookup(self, query, semantic_threshold, fuzzy_threshold, facts_first):
+        snap = self._snapshot
+        query_clean = clean(query)
+        if not query_clean:
+            return snap.messages["empty"], "empty"
+
+        if snap.faq_matrix is not None:
+            scores = snap.faq_matrix @ self.embeddings.encode(query)
+            best_idx = int(np.argmax(scores))
+            if float(scores[best_idx]) >= semantic_threshold:
+                return snap.faq_answers[best_idx], "faq"
+
+        steps = (self._facts, self._fuzzy) if facts_first else (self._fuzzy, self._facts)
+        for step in steps:
+            found = step(snap, query_clean, fuzzy_threshold)
+            if found:
+                return found
+
+        return snap.messages["unknown"], "unknown"
+
+    def _facts(self, snap, query_clean, fuzzy_threshold):
+        facts_answer = snap.matcher.answer(query_clean)
+        return (facts_answer, "facts") if facts_answer else None
+
+    def _fuzzy(self, snap, query_clean, fuzzy_threshold):
+        if not self.use_fuzzy or not snap.faq_questions:
+            return None
+        from rapidfuzz import process, fuzz
+        _, fuzzy_score, idx = process.extractOne(query_clean, snap.faq_questions, scorer=fuzz.token_sort_ratio)
+        return (snap.faq_answers[idx], "fuzzy") if fuzzy_score >= fuzzy_threshold else None
+
+    def answer(self, query, **kwargs):
+        return self.lookup(query, **kwargs)[0]
@@ -0,0 +1,60 @@
+"""
+Sentence-embedding index over the FAQ questions.
+
+Embeddings are cached per question text, so a hot reload only encodes the
+questions that were added or edited.
+"""
+import os
+
+import numpy as np
+
+BATCH_SIZE = 32  # questions encoded per call when (re)building
+
+# "torch" (SentenceTransformer) or "onnx" (int8 model from onnx_encoder.py, no torch import)
+ENCODER_BACKEND = os.environ.get("AURA_ENCODER", "torch")
+
+
+def load_encoder(backend=ENCODER_BACKEND):
+    """Both backends expose encode() and return normalized numpy embeddings."""
+    if backend == "onnx":
+        from onnx_encoder import OnnxEncoder
+        return OnnxEncoder()
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer('all-MiniLM-L6-v2')
+
+
+class EmbeddingIndex:
+    def __init__(self, encoder=None, backend=ENCODER_BACKEND):
+        self._encoder = encoder
+        self.backend = backend
+        self._cache = {}
+
+    @property
+    def encoder(self):
+        if self._encoder is None:
+            print(f"Loading language model ({self.backend})...")
+            self._encoder = load_encoder(self.backend)
+        return self._encoder
+
+    def build(self, sentences: list, on_progress=None) -> np.ndarray:
+        """
+        Return an (N, dim) matrix for sentences, encoding only unseen ones.
+        on_progress(encoded, missing, message) after each batch.
+        """
+        missing = [s for s in sentences if s not in self._cache]
+        for start in range(0, len(missing), BATCH_SIZE):
+            batch = missing[start:start + BATCH_SIZE]
+            vectors = np.asarray(self.encoder.encode(batch, normalize_embeddings=True), dtype=np.float32)
+            self._cache.update(zip(batch, vectors))
+            if on_progress is not None:
+                on_progress(start + len(batch), len(missing), f"Encoded {start + len(batch)}/{len(missing)} questions")
+
+        # forget questions that were removed from the file
+        keep = set(sentences)
+        for stale in [s for s in self._cache if s not in keep]:
+            del self._cache[stale]
+
+        return np.vstack([self._cache[s] for s in sentences])
+
+    def encode(self, text: str) -> np.ndarray:
+        return np.asarray(self.encoder.encode(text, normalize_embeddings=True), dtype=np.float32)
@@ -0,0 +1,59 @@
+"""
+Keyword intent matcher.
+
+Every trigger word from the knowledge base is compiled into one
+token -> intents index, so matching a query is a single pass over its tokens
+with whole-word hits only ("when" does not fire on "whenever", "class" does
+not fire on "classroom").
+"""
+import re
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+TRIGGER = 0
+REQUIRE = 1
+
+
+class IntentMatcher:
+    """Matches queries against intents compiled from a facts config."""
+
+    def __init__(self, facts: dict, intents: list):
+        self.facts = facts
+        self.intents = intents
+        self.responses = [intent["response"].format_map(facts) for intent in intents]
+        self._needs_require = 0
+        self.index = {}
+
+        for i, intent in enumerate(intents):
+            bit = 1 << i
+            for word in intent["triggers"]:
+                self._add(word, bit, TRIGGER)
+            if intent.get("requires"):
+                self._needs_require |= bit
+                for word in intent["requires"]:
+                    self._add(word, bit, REQUIRE)
+
+    def _add(self, word, bit, role):
+        masks = self.index.setdefault(word.lower(), [0, 0])
+        masks[role] |= bit
+
+    def match(self, text: str) -> list:
+        """Return indices of matching intents, in config order."""
+        triggered = 0
+        required = 0
+        index = self.index
+        for token in TOKEN_RE.findall(text.lower()):
+            masks = index.get(token)
+            if masks is not None:
+                triggered |= masks[TRIGGER]
+                required |= masks[REQUIRE]
+
+        hits = triggered & (~self._needs_require | required)
+        return [i for i in range(len(self.intents)) if hits >> i & 1]
+
+    def match_names(self, text: str) -> list:
+        return [self.intents[i]["name"] for i in self.match(text)]
+
+    def answer(self, text: str) -> str:
+        """Combined response for every matching intent ("" when nothing matches)."""
+        return " ".join(self.responses[i] for i in self.match(text))
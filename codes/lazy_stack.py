@@ -0,0 +1,81 @@
+"""
+Background loader for the speech/NLP stack behind the GUI launchers.
+
+`import queries` pulls in vosk, sounddevice, pyttsx3 and the knowledge base
+(torch/sentence_transformers or onnxruntime), loads both models and encodes
+the FAQ. Doing that at module top kept the window from appearing for tens of
+seconds on the Pi. Launchers import only Qt, show the window, then start a
+StackLoader; it imports the stack step by step in a QThread and reports
+progress, so the UI can show a progress bar and enable voice/text queries
+once `loaded` fires.
+
+    loader = StackLoader()
+    loader.progress.connect(lambda pct, label: ...)
+    loader.loaded.connect(lambda queries: ...)
+    loader.start()
+
+QueryWorker runs one get_answer() the same way, so a text query (which may
+encode the question with SentenceTransformer) doesn't freeze the window.
+"""
+import importlib
+import time
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+# (module, label shown while it loads); the last module is the one handed to `loaded`
+QUERIES_STEPS = [
+    ("numpy", "Loading numerical libraries"),
+    ("sounddevice", "Opening audio"),
+    ("pyttsx3", "Loading speech synthesis"),
+    ("vosk", "Loading speech recognition"),
+    ("knowledge", "Loading knowledge base"),
+    ("queries", "Loading models"),
+]
+
+
+class StackLoader(QThread):
+    progress = pyqtSignal(int, str)  # percent, label
+    loaded = pyqtSignal(object)      # the last step's module
+    failed = pyqtSignal(str)
+
+    def __init__(self, steps=QUERIES_STEPS, parent=None):
+        super().__init__(parent)
+        self.steps = steps
+        self.module = None
+        self.timings = {}  # module -> seconds, for bench/bench_startup.py
+
+    def is_ready(self):
+        return self.module is not None
+
+    def run(self):
+        module = None
+        try:
+            for i, (name, label) in enumerate(self.steps):
+                self.progress.emit(int(i * 100 / len(self.steps)), label)
+                t = time.perf_counter()
+                module = importlib.import_module(name)
+                self.timings[name] = time.perf_counter() - t
+        except Exception as e:
+            self.failed.emit(f"{label} failed: {e}")
+            return
+        self.module = module
+        self.progress.emit(100, "Ready")
+        self.loaded.emit(module)
+
+
+class QueryWorker(QThread):
+    answered = pyqtSignal(str, str)  # query, answer
+    failed = pyqtSignal(str, str)    # query, error
+
+    def __init__(self, queries, query, parent=None):
+        super().__init__(parent)
+        self.queries = queries
+        self.query = query
+
+    def run(self):
+        try:
+            answer = self.queries.get_answer(self.query)
+        except Exception as e:
+            self.failed.emit(self.query, str(e))
+            return
+        self.answered.emit(self.query, answer)
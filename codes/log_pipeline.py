@@ -0,0 +1,159 @@
+"""
+Non-blocking logging for the voice assistants.
+
+logger.info() only puts the record on a queue; one listener thread formats it
+and writes it out, so a slow SD card never stalls a turn:
+
+    voice_assistant.log     one JSON object per line, rotated at AURA_LOG_MAX_BYTES
+                            (default 1 MB, AURA_LOG_BACKUPS old files kept)
+    stdout                  the usual "time - LEVEL - message" lines, INFO and up
+
+Every record carries the conversation turn it belongs to (set_turn(), called
+by conversation.py) and whatever was passed in extra={"timings": {...}}.
+DEBUG records are high volume (each retry, each cleanup): with
+AURA_LOG_LEVEL=DEBUG, AURA_LOG_DEBUG_SAMPLE=0.05 queues one in twenty of them
+(default 1: all). When the queue is full records are dropped rather than
+waited on, and the count is logged once there is room again.
+
+Usage, once per process, instead of logging.basicConfig():
+
+    from log_pipeline import setup_logging
+    setup_logging("voice_assistant.log")
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+
+MAX_BYTES = int(os.environ.get("AURA_LOG_MAX_BYTES", 1024 * 1024))
+BACKUPS = int(os.environ.get("AURA_LOG_BACKUPS", "3"))
+LEVEL = os.environ.get("AURA_LOG_LEVEL", "INFO").upper()
+DEBUG_SAMPLE = float(os.environ.get("AURA_LOG_DEBUG_SAMPLE", "1"))
+QUEUE_SIZE = 10000
+CONSOLE_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+_turn = None
+_listener = None
+
+
+def set_turn(turn):
+    """Tag the records logged from now on with this conversation turn (None: outside a turn)."""
+    global _turn
+    _turn = turn
+
+
+class ContextFilter(logging.Filter):
+    """Stamps the current turn and drops all but a sample of the DEBUG records."""
+
+    def __init__(self, debug_sample=DEBUG_SAMPLE):
+        super().__init__()
+        self.debug_sample = debug_sample
+
+    def filter(self, record):
+        if record.levelno <= logging.DEBUG and self.debug_sample < 1 and random.random() >= self.debug_sample:
+            return False
+        record.turn = _turn
+        return True
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks: records are dropped (and counted) while the queue is full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # resolve only the message and traceback here (the args may change after the call);
+        # the extras (turn, timings) stay on the record and the listener thread formats it
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            warning = logging.LogRecord(__name__, logging.WARNING, __file__, 0,
+                                        f"Log queue full, dropped {dropped} records", None, None)
+            warning.turn = _turn
+            try:
+                self.queue.put_nowait(warning)
+            except queue.Full:
+                self.dropped += dropped
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "turn": getattr(record, "turn", None),
+            "message": record.getMessage(),
+        }
+        timings = getattr(record, "timings", None)
+        if timings:
+            entry["timings_ms"] = {stage: round(ms, 1) for stage, ms in timings.items()}
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def setup_logging(filename="voice_assistant.log", level=LEVEL, console=True,
+                  max_bytes=MAX_BYTES, backups=BACKUPS, debug_sample=DEBUG_SAMPLE):
+    """Route the root logger through a queue to a rotating JSON file (and stdout). Returns the listener."""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    file_handler = logging.handlers.RotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backups,
+                                                        encoding="utf-8", delay=True)
+    file_handler.setFormatter(JsonFormatter())
+    handlers = [file_handler]
+    if console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        handlers.append(console_handler)
+
+    log_queue = queue.Queue(QUEUE_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter(debug_sample))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """Flush what is queued and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        listener, _listener = _listener, None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
@@ -5,13 +5,15 @@ from pathlib import Path
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit,
     QScrollArea, QFrame, QSpacerItem, QSizePolicy, QGraphicsOpacityEffect,
-    QMessageBox, QInputDialog, QGridLayout
+    QMessageBox, QInputDialog, QGridLayout, QProgressBar
 )
 from PyQt5.QtGui import QPixmap, QFontDatabase
 from PyQt5.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve, QTimer, QCoreApplication
 import os
 import threading
-from queries import listen, get_answer, speak
+from lazy_stack import QueryWorker, StackLoader  # queries (vosk, models, knowledge base) loads in the background
+from services import ServiceManager
+from aura_ui import CameraView
 
 os.environ["QT_QPA_PLATFORM"] = "xcb"
 
@@ -96,8 +98,10 @@ class ClosableWidget(QFrame):
 
 
 class TextInputWidget(QWidget):
-    def __init__(self, parent=None):
+    def __init__(self, stack, parent=None):
         super().__init__(parent)
+        self.stack = stack
+        self.workers = set()  # running QueryWorkers, kept alive until they finish
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setSpacing(10)
         self.main_layout.setContentsMargins(0, 10, 0, 10)
@@ -136,7 +140,22 @@ class TextInputWidget(QWidget):
             parent_widget = parent_widget.parent()
         if parent_widget:
             parent_widget.close_box()
-        self.show_message("Query Sent", f"AURA is processing your request:\n\n{query[:200]}...")
+        if not self.stack.is_ready():
+            self.show_message("AURA", "AURA is still loading, please try again in a moment.")
+            return
+        # answered off the GUI thread; the box pops up when the worker signals back
+        worker = QueryWorker(self.stack.module, query)
+        worker.answered.connect(self.on_answer)
+        worker.failed.connect(self.on_answer_failed)
+        worker.finished.connect(lambda: self.workers.discard(worker))
+        self.workers.add(worker)
+        worker.start()
+
+    def on_answer(self, query, answer):
+        self.show_message("AURA", f"{query[:200]}\n\n{answer}")
+
+    def on_answer_failed(self, query, error):
+        self.show_message("AURA", f"Could not answer:\n\n{query[:200]}\n\n{error}", QMessageBox.Warning)
 
     def show_message(self, title, message, icon=QMessageBox.Information):
         msg_box = QMessageBox()
@@ -147,8 +166,9 @@ class TextInputWidget(QWidget):
 
 
 class FaceRecognitionWidget(QWidget):
-    def __init__(self, parent=None):
+    def __init__(self, services, parent=None):
         super().__init__(parent)
+        self.services = services
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setSpacing(15)
         self.main_layout.setContentsMargins(0, 10, 0, 10)
@@ -175,6 +195,12 @@ class FaceRecognitionWidget(QWidget):
         button_layout.addWidget(self.open_data_btn, 1, 1)
         self.main_layout.addLayout(button_layout)
 
+        # Live recognizer frames, shared memory from the recognizer service
+        self.camera_view = CameraView()
+        self.camera_view.setMinimumHeight(360)
+        self.camera_view.hide()
+        self.main_layout.addWidget(self.camera_view)
+
         self.register_btn.clicked.connect(self.register_face)
         self.recognize_btn.clicked.connect(self.recognize_face)
         self.manage_btn.clicked.connect(self.manage_dataset)
@@ -193,59 +219,44 @@ class FaceRecognitionWidget(QWidget):
         else:
             return Path(__file__).resolve().parent
 
-    def _run_python_script(self, script_path: Path, args=None):
-        base_dir = self._get_app_dir()
-        exe_name = script_path.stem
-
-        binary_name = exe_name + (".exe" if sys.platform.startswith("win") else "")
-        binary_path = base_dir / binary_name
-        py_path = base_dir / (exe_name + ".py")
-
-        paths_to_try = [binary_path, py_path]
-        if getattr(sys, 'frozen', False):
-            try:
-                tmp_dir = Path(sys._MEIPASS)
-                paths_to_try.extend([tmp_dir / binary_name, tmp_dir / (exe_name + ".py")])
-            except Exception:
-                pass
-
-        # Find a valid one
-        target = next((p for p in paths_to_try if p.exists()), None)
-        if not target:
-            self.show_message("File Missing",
-                              f"Cannot find {exe_name} script or binary.\nChecked:\n"
-                              + "\n".join(str(p) for p in paths_to_try),
-                              QMessageBox.Critical)
-            return False
-
-        
-        if target.suffix == ".py":
-            cmd = [sys.executable, str(target)]
-        else:
-            cmd = [str(target)]
-
-        if args:
-            cmd.extend(args)
-
-        try:
-            subprocess.Popen(cmd, close_fds=True)
-            self.show_message("Launching", f"Running {os.path.basename(cmd[0])} ...")
-            return True
-        except Exception as e:
-            self.show_message("Launch Failed", str(e), QMessageBox.Critical)
-            return False
-
     def register_face(self):
         name, ok = QInputDialog.getText(self, "Register New Face", "Enter the name of the person:")
         if ok and name.strip():
-            script = self._get_app_dir() / "train.py"
-            self._run_python_script(script, [name.strip()])
+            try:
+                self.services.call("enroller", "start", name=name.strip())
+                self.show_message("Registering", f"Capturing faces for {name.strip()} ...")
+            except Exception as e:
+                self.show_message("Registration Failed", str(e), QMessageBox.Critical)
         else:
             self.show_message("Cancelled", "Registration cancelled.")
 
     def recognize_face(self):
-        script = self._get_app_dir() / "recognise.py"
-        self._run_python_script(script)
+        if self.camera_view.isVisible():
+            try:
+                self.services.call("recognizer", "stop")
+            except Exception as e:
+                print("Error while stopping recognition:", e)
+            self.camera_view.stop()
+            self.camera_view.hide()
+            self.recognize_btn.setText("Recognize Face (Live)")
+            self._resize_box(320)
+            return
+        try:
+            self.services.call("recognizer", "start", view="shared")
+        except Exception as e:
+            self.show_message("Recognition Failed", str(e), QMessageBox.Critical)
+            return
+        self.camera_view.start()
+        self.camera_view.show()
+        self.recognize_btn.setText("Stop Recognition")
+        self._resize_box(720)
+
+    def _resize_box(self, height):
+        box = self.parent()
+        while box and not isinstance(box, ClosableWidget):
+            box = box.parent()
+        if box:
+            box.show_box(height)
 
     def manage_dataset(self):
         base = self._get_app_dir()
@@ -289,8 +300,9 @@ class FaceRecognitionWidget(QWidget):
 
 
 class DualQueryWidget(QWidget):
-    def __init__(self, parent=None):
+    def __init__(self, stack, parent=None):
         super().__init__(parent)
+        self.stack = stack
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setSpacing(10)
         self.main_layout.setContentsMargins(0, 10, 0, 10)
@@ -328,6 +340,19 @@ class DualQueryWidget(QWidget):
         self.send_button.clicked.connect(self.handle_text_query)
         self.speak_button.clicked.connect(self.handle_voice_query)
 
+        # Queries need the speech/NLP stack; enable them once it has loaded
+        if not self.stack.is_ready():
+            self.set_ready(False)
+            self.stack.loaded.connect(self.on_stack_loaded)
+
+    def set_ready(self, ready):
+        self.send_button.setEnabled(ready)
+        self.speak_button.setEnabled(ready)
+        self.output_box.setPlaceholderText("" if ready else "⏳ AURA is still loading...")
+
+    def on_stack_loaded(self, _):
+        self.set_ready(True)
+
     def handle_text_query(self):
         query = self.text_input.toPlainText().strip()
         if not query:
@@ -342,19 +367,19 @@ class DualQueryWidget(QWidget):
         threading.Thread(target=self.process_voice_query, daemon=True).start()
 
     def process_voice_query(self):
-        query = listen().strip()
+        query = self.stack.module.listen().strip()
         if not query:
             self.output_box.append("❌ No speech detected.")
-            speak("I didn’t catch that. Please try again.")
+            self.stack.module.speak("I didn’t catch that. Please try again.")
             return
         self.output_box.append(f"🗣 You said: {query}")
         self.process_query(query)
 
     def process_query(self, query):
         try:
-            answer = get_answer(query)
+            answer = self.stack.module.get_answer(query)
             self.output_box.append(f"🤖 AURA: {answer}\n")
-            speak(answer)
+            self.stack.module.speak(answer)
         except Exception as e:
             self.output_box.append(f"⚠️ Error: {e}")
 
@@ -365,7 +390,13 @@ class BotGUI(QWidget):
         self.BASE_DIR = Path(QCoreApplication.applicationDirPath()) if getattr(sys, 'frozen', False) else Path(__file__).resolve().parent
         self.assets_dir = self.BASE_DIR / "assets"
         self.font_dir = self.BASE_DIR / "fonts"
+        self.stack_loader = StackLoader(parent=self)
+        # face recognizer/enroller run as resident services, started once here (services/)
+        self.services = ServiceManager(["recognizer", "enroller"])
+        self.services.ensure_running()
+        QApplication.instance().aboutToQuit.connect(self.services.shutdown)
         self.initUI()
+        self.start_stack_loader()
 
     def initUI(self):
         self.load_custom_fonts()
@@ -401,6 +432,17 @@ class BotGUI(QWidget):
         self.aura_label.setObjectName("auraTitleLabel")
         self.aura_label.setAlignment(Qt.AlignCenter)
         header_layout.addWidget(self.aura_label)
+
+        # Loading progress for the speech/NLP stack, hidden once it is ready
+        self.loading_label = QLabel("Starting up...")
+        self.loading_label.setObjectName("loadingLabel")
+        self.loading_label.setAlignment(Qt.AlignCenter)
+        self.loading_bar = QProgressBar()
+        self.loading_bar.setObjectName("loadingBar")
+        self.loading_bar.setTextVisible(False)
+        self.loading_bar.setFixedHeight(8)
+        header_layout.addWidget(self.loading_label)
+        header_layout.addWidget(self.loading_bar)
         main_layout.addLayout(header_layout)
 
         self.interactive_box = ClosableWidget(parent=self.central_widget)
@@ -429,20 +471,39 @@ class BotGUI(QWidget):
         self.setStyleSheet(self.get_stylesheet())
         self.show()
 
+    def start_stack_loader(self):
+        self.stack_loader.progress.connect(self.on_stack_progress)
+        self.stack_loader.loaded.connect(self.on_stack_loaded)
+        self.stack_loader.failed.connect(self.on_stack_failed)
+        # start after the first frame so the window paints before the imports begin
+        QTimer.singleShot(0, self.stack_loader.start)
+
+    def on_stack_progress(self, pct, label):
+        self.loading_bar.setValue(pct)
+        self.loading_label.setText(f"{label}...")
+
+    def on_stack_loaded(self, _):
+        self.loading_label.hide()
+        self.loading_bar.hide()
+
+    def on_stack_failed(self, error):
+        self.loading_bar.hide()
+        self.loading_label.setText(f"⚠️ {error}")
+
     def open_text_input(self):
-        self.input_widget = TextInputWidget(self.interactive_box.content_widget)
+        self.input_widget = TextInputWidget(self.stack_loader, self.interactive_box.content_widget)
         self.interactive_box.set_title("AURA Command Console")
         self.interactive_box.set_content_widget(self.input_widget)
         self.interactive_box.show_box(260)
 
     def open_dual_query(self):
-        self.dual_query_widget = DualQueryWidget(self.interactive_box.content_widget)
+        self.dual_query_widget = DualQueryWidget(self.stack_loader, self.interactive_box.content_widget)
         self.interactive_box.set_title("AURA Voice & Text Query Interface")
         self.interactive_box.set_content_widget(self.dual_query_widget)
         self.interactive_box.show_box(380)
 
     def open_face_recognition(self):
-        self.face_widget = FaceRecognitionWidget(self.interactive_box.content_widget)
+        self.face_widget = FaceRecognitionWidget(self.services, self.interactive_box.content_widget)
         self.interactive_box.set_title("Biometric Data Management")
         self.interactive_box.set_content_widget(self.face_widget)
         self.interactive_box.show_box(320)
@@ -481,6 +542,24 @@ class BotGUI(QWidget):
             background-color: #5d5c80;
             color: #e0e0e0;
         }
+        QPushButton:disabled {
+            background-color: #1a1a2e;
+            color: #555577;
+            border: 1px solid #555577;
+        }
+        #loadingLabel {
+            color: #00ffff;
+            font-size: 14pt;
+        }
+        #loadingBar {
+            border: none;
+            background-color: #1a1a2e;
+            border-radius: 4px;
+        }
+        #loadingBar::chunk {
+            background-color: #8a2be2;
+            border-radius: 4px;
+        }
         #FaceActionButton {
             background-color: #1a1a2e;
             color: #bb86fc;
@@ -0,0 +1,232 @@
+"""
+Hot-path timings for the kiosk: timers, counters and latency histograms.
+
+Off unless AURA_METRICS names an output file; then every process that imports
+this keeps its own numbers and rewrites/appends them every
+AURA_METRICS_INTERVAL seconds (default 10) and at exit:
+
+    AURA_METRICS=/var/tmp/aura-{script}.prom   Prometheus text format, rewritten
+                                               (node_exporter textfile collector)
+    AURA_METRICS=/var/tmp/aura-{script}.jsonl  one JSON snapshot per line, appended
+
+{script} is replaced with the script name (recognise, queries_api, ...).
+
+Usage from any script:
+
+    from metrics import metrics
+
+    with metrics.timer("ssd_forward"):
+        detections = net.forward()
+
+    @metrics.timed("stt")
+    def transcribe_audio(filename): ...
+
+    metrics.count("kb_faq")
+    metrics.observe("turn", total_ms)
+
+Disabled, timer() returns one shared no-op context manager and count()/
+observe() return at the first line, so the calls can stay in the hot paths.
+"""
+import atexit
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+OUTPUT = os.environ.get("AURA_METRICS", "")
+INTERVAL_S = float(os.environ.get("AURA_METRICS_INTERVAL", "10"))
+
+# histogram bucket upper bounds, ms
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def script_name() -> str:
+    return Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else "python"
+
+
+class Histogram:
+    def __init__(self, buckets=BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile (the last bound for +Inf)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= rank:
+                return float(bound)
+        return float(self.buckets[-1])
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class Metrics:
+    def __init__(self, output=OUTPUT, interval=INTERVAL_S):
+        self._lock = threading.Lock()
+        self.counters = {}    # name -> int
+        self.histograms = {}  # name -> Histogram (ms)
+        self.output = None
+        self.interval = interval
+        self._exporter = None
+        self._stop = threading.Event()
+        self.enabled = False
+        if output:
+            self.enable(output)
+
+    # ----- recording -----
+    def timer(self, name):
+        """Context manager that observes its duration in ms under name."""
+        if not self.enabled:
+            return NULL_TIMER
+        return _Timer(self, name)
+
+    def timed(self, name=None):
+        """Decorator form of timer(); name defaults to the function's name."""
+        def decorate(fn):
+            label = name or fn.__name__
+
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.observe(label, (time.perf_counter() - start) * 1000)
+            return wrapper
+        return decorate
+
+    def count(self, name, n=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe(self, name, value_ms):
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(value_ms)
+
+    # ----- export -----
+    def enable(self, output=None):
+        """Start recording; with output, export there in the background (see the module docstring)."""
+        self.enabled = True
+        if output and self._exporter is None:
+            self.output = Path(output.format(script=script_name()))
+            self._exporter = threading.Thread(target=self._export_loop, daemon=True, name="metrics-export")
+            self._exporter.start()
+            atexit.register(self.export)
+
+    def disable(self):
+        self.enabled = False
+        self._stop.set()
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "time": time.time(),
+                "script": script_name(),
+                "pid": os.getpid(),
+                "counters": dict(self.counters),
+                "timings_ms": {
+                    name: {"count": h.count, "sum": round(h.sum, 3), "p50": h.quantile(0.5),
+                           "p95": h.quantile(0.95), "p99": h.quantile(0.99)}
+                    for name, h in self.histograms.items()
+                },
+            }
+
+    def prometheus(self) -> str:
+        """The metrics in Prometheus text exposition format."""
+        script = script_name()
+        lines = []
+        with self._lock:
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE aura_{name}_total counter")
+                lines.append(f'aura_{name}_total{{script="{script}"}} {value}')
+            for name, h in sorted(self.histograms.items()):
+                lines.append(f"# TYPE aura_{name}_ms histogram")
+                cumulative = 0
+                for bound, n in zip(h.buckets + ("+Inf",), h.counts):
+                    cumulative += n
+                    lines.append(f'aura_{name}_ms_bucket{{script="{script}",le="{bound}"}} {cumulative}')
+                lines.append(f'aura_{name}_ms_sum{{script="{script}"}} {h.sum:.3f}')
+                lines.append(f'aura_{name}_ms_count{{script="{script}"}} {h.count}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path=None):
+        """Write the current numbers to path (default: the AURA_METRICS file)."""
+        path = Path(path) if path else self.output
+        if path is None:
+            return
+        try:
+            if path.suffix == ".jsonl":
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(self.snapshot()) + "\n")
+            else:
+                # atomic, so a scraper never reads half a file
+                tmp = path.with_name(path.name + ".tmp")
+                tmp.write_text(self.prometheus(), encoding="utf-8")
+                os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {path}: {e}")
+
+    def _export_loop(self):
+        while not self._stop.wait(self.interval):
+            self.export()
+
+
+# Shared instance
+metrics = Metrics()
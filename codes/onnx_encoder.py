@@ -0,0 +1,132 @@
+"""
+ONNX Runtime backend for the all-MiniLM-L6-v2 sentence encoder.
+
+The export is a one-time step (needs torch + transformers, so run it on a
+laptop or once on the Pi):
+
+    python onnx_encoder.py --export
+
+After that queries.py can run with AURA_ENCODER=onnx and never imports torch.
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+EXPORT_DIR = BASE_DIR / "models" / "minilm-onnx"
+FP32_FILE = "model.onnx"
+INT8_FILE = "model_int8.onnx"
+MAX_SEQ_LENGTH = 256  # same as SentenceTransformer's max_seq_length for this model
+INPUT_NAMES = ["input_ids", "attention_mask", "token_type_ids"]
+
+
+def export_model(export_dir: Path = EXPORT_DIR, opset: int = 14) -> Path:
+    """Export MiniLM to ONNX and write a dynamic int8 quantized copy next to it."""
+    import torch
+    from transformers import AutoTokenizer, AutoModel
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    export_dir = Path(export_dir)
+    export_dir.mkdir(parents=True, exist_ok=True)
+    fp32_path = export_dir / FP32_FILE
+    int8_path = export_dir / INT8_FILE
+
+    print(f"Exporting {MODEL_NAME} to {fp32_path}...")
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
+    model = AutoModel.from_pretrained(MODEL_NAME).eval()
+    dummy = tokenizer(["where is the library"], return_tensors="pt")
+
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in INPUT_NAMES}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(dummy[name] for name in INPUT_NAMES),
+            str(fp32_path),
+            input_names=INPUT_NAMES,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+        )
+
+    print(f"Quantizing to int8: {int8_path}")
+    quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+
+    # tokenizer.json is all the runtime side needs (loaded with `tokenizers`, no torch)
+    tokenizer.save_pretrained(str(export_dir))
+    print("Export complete!")
+    return int8_path
+
+
+class OnnxEncoder:
+    """Drop-in for SentenceTransformer.encode() backed by onnxruntime."""
+
+    def __init__(self, model_dir: Path = EXPORT_DIR, quantized: bool = True, num_threads: int = 0):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_dir = Path(model_dir)
+        model_path = model_dir / (INT8_FILE if quantized else FP32_FILE)
+        if not model_path.exists():
+            raise FileNotFoundError(
+                f"{model_path} not found. Run 'python onnx_encoder.py --export' first."
+            )
+
+        self.tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=MAX_SEQ_LENGTH)
+        self.tokenizer.enable_padding(pad_id=0, pad_token="[PAD]")
+
+        options = ort.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(
+            str(model_path), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+    def encode(self, sentences, batch_size=32, normalize_embeddings=True, convert_to_tensor=False, **kwargs):
+        """
+        Encode one sentence or a list of sentences into float32 embeddings.
+        convert_to_tensor is accepted for compatibility but always returns numpy.
+        """
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+
+        chunks = []
+        for start in range(0, len(sentences), batch_size):
+            encoded = self.tokenizer.encode_batch(sentences[start:start + batch_size])
+            ids = np.array([e.ids for e in encoded], dtype=np.int64)
+            mask = np.array([e.attention_mask for e in encoded], dtype=np.int64)
+            feeds = {"input_ids": ids, "attention_mask": mask}
+            if "token_type_ids" in self.input_names:
+                feeds["token_type_ids"] = np.array([e.type_ids for e in encoded], dtype=np.int64)
+
+            hidden = self.session.run(None, feeds)[0]
+
+            # Mean pooling over real tokens, same as the SentenceTransformer pipeline
+            weights = mask[..., None].astype(np.float32)
+            pooled = (hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None)
+            if normalize_embeddings:
+                pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            chunks.append(pooled.astype(np.float32))
+
+        embeddings = np.vstack(chunks) if chunks else np.zeros((0, 384), dtype=np.float32)
+        return embeddings[0] if single else embeddings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MiniLM ONNX export / smoke test")
+    parser.add_argument("--export", action="store_true", help="export and quantize the model")
+    parser.add_argument("--dir", default=str(EXPORT_DIR), help="export directory")
+    parser.add_argument("text", nargs="*", help="sentence to encode (smoke test)")
+    args = parser.parse_args()
+
+    if args.export:
+        export_model(Path(args.dir))
+    else:
+        encoder = OnnxEncoder(Path(args.dir))
+        text = " ".join(args.text) or "where is the library"
+        print(encoder.encode(text)[:8])
@@ -6,11 +6,17 @@ import time
 import os
 import sys
 import logging
+import threading
 from pathlib import Path
 from typing import Optional, Dict
 import warnings
 import subprocess
 import piper
+from knowledge import KnowledgeBase
+from conversation import ConversationEngine
+from audio_devices import devices
+from log_pipeline import setup_logging
+from metrics import metrics
 
 
 # ====== PIPER TTS SETUP ======
@@ -18,6 +24,35 @@ PIPER_MODEL = "voices/voice.onnx"
 
 piper_tts = piper.PiperVoice.load(PIPER_MODEL)
 
+@metrics.timed("tts")
+def synthesize_speech(text: str) -> bytes:
+    """Synthesize text with Piper, returns WAV bytes."""
+    return piper_tts.synthesize(text=text, length_scale=1.0)
+
+def play_speech(wav_data: bytes, stop_event: Optional[threading.Event] = None):
+    """
+    Play WAV bytes with aplay (best for Raspberry Pi), piped over stdin instead of a temp file.
+    Returns early and kills aplay if stop_event gets set (barge-in).
+    """
+    stop_event = stop_event or threading.Event()
+    player = subprocess.Popen(["aplay", "-q", "-"], stdin=subprocess.PIPE,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        # feed in chunks so a barge-in isn't stuck behind a full pipe
+        for start in range(0, len(wav_data), 16384):
+            if stop_event.is_set():
+                break
+            player.stdin.write(wav_data[start:start + 16384])
+        player.stdin.close()
+    except BrokenPipeError:
+        pass
+
+    while player.poll() is None:
+        if stop_event.wait(0.02):
+            player.terminate()
+            break
+    player.wait()
+
 def piper_speak(text: str):
     """Speak using Piper TTS with WAV playback."""
     if not text:
@@ -26,34 +61,20 @@ def piper_speak(text: str):
     print(f"\n🔊 [Piper] Speaking: {text}")
 
     try:
-        wav_data = piper_tts.synthesize(text=text, length_scale=1.0)
-        temp_file = "piper_output.wav"
-        
-        with open(temp_file, "wb") as f:
-            f.write(wav_data)
-
-        # Play with aplay (best for Raspberry Pi)
-        subprocess.run(["aplay", temp_file], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        play_speech(synthesize_speech(text))
     except Exception as e:
         print(f"❌ Piper error: {e}")
 
 
 # ====== LOGGING SETUP ======
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('voice_assistant.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+setup_logging("voice_assistant.log")  # queued: a slow SD card never stalls a turn
 logger = logging.getLogger(__name__)
 
 # ====== CONFIGURATION ======
 class Config:
     """Centralized configuration with validation"""
     API_KEY = "307ced77979248b8b8b0a07621cc9a3c"
-    MIC_DEVICE_ID = 1
+    MIC_DEVICE_NAME = "USB"  # regex matched against the device name, AURA_MIC overrides
     DEFAULT_DURATION = 8
     SAMPLE_RATE = 16000
     AUDIO_FILENAME = "input.wav"
@@ -71,16 +92,18 @@ class Config:
     EXIT_KEYWORDS = ["stop", "exit", "quit", "goodbye", "bye", "end"]
     CONVERSATION_MODE = True  # Enable continuous conversation
     MAX_CONSECUTIVE_ERRORS = 3  # Exit after this many consecutive errors
+    
+    # Knowledge base: FAQ semantic search loads the sentence encoder, keep off for keyword-only
+    KB_EMBEDDINGS = False
+    
+    # Barge-in: keep the mic open while speaking and stop the answer when the visitor talks
+    BARGE_IN = True
+    BARGE_IN_ACTION = "stop"  # aplay can't change volume, so no "duck" here
+    BARGE_IN_SENSITIVITY = 3.0  # speech = mic energy above the noise/echo floor times this
 
-# Knowledge base
-FACTS = {
-    "principal": "Dr. Ananya Sharma",
-    "school name": "Greenfield International School",
-    "location": "Mumbai",
-    "motto": "Knowledge is Power",
-    "established": "1995",
-    "grades": "kindergarten through grade 12",
-}
+# Knowledge base (shared with queries.py and the GUIs, see knowledge/school_kb.json)
+kb = KnowledgeBase(use_embeddings=Config.KB_EMBEDDINGS)
+kb.start_watching()
 
 # ====== HELPER FUNCTIONS ======
 def validate_environment():
@@ -91,14 +114,15 @@ def validate_environment():
     if not Config.API_KEY or Config.API_KEY == "YOUR_API_KEY_HERE":
         errors.append("AssemblyAI API key not configured")
     
-    # Check if audio devices are available
+    # Resolve the microphone once; every recording after this uses the cached index
     try:
-        devices = sd.query_devices()
-        if Config.MIC_DEVICE_ID >= len(devices):
-            logger.warning(f"Device ID {Config.MIC_DEVICE_ID} not found. Available devices:")
-            for i, device in enumerate(devices):
+        if devices.input_device(Config.MIC_DEVICE_NAME) is None:
+            logger.warning("Available devices:")
+            for i, device in enumerate(sd.query_devices()):
                 logger.info(f"  {i}: {device['name']}")
-            errors.append(f"Invalid microphone device ID: {Config.MIC_DEVICE_ID}")
+        else:
+            logger.info(f"Microphone: {devices.name('input', Config.MIC_DEVICE_NAME)}")
+        devices.watch_hotplug()
     except Exception as e:
         errors.append(f"Could not query audio devices: {e}")
     
@@ -184,30 +208,25 @@ def record_audio(
     device_id: Optional[int] = None
 ) -> Optional[str]:
     """Record audio with error handling and validation"""
-    if device_id is None:
-        device_id = Config.MIC_DEVICE_ID
-    
-    try:
-        # Validate device
-        devices = sd.query_devices()
-        if device_id >= len(devices):
-            logger.error(f"Device {device_id} not found")
-            return None
-        
-        device_info = devices[device_id]
-        logger.info(f"Using device: {device_info['name']}")
-        
-        print(f"\n🎤 Recording for {duration} seconds... Speak now!")
-        
-        # Record with specified device
-        audio_data = sd.rec(
+    def capture(device):
+        data = sd.rec(
             int(duration * samplerate),
             samplerate=samplerate,
             channels=1,
             dtype='int16',
-            device=device_id
+            device=device
         )
         sd.wait()
+        return data
+    
+    try:
+        print(f"\n🎤 Recording for {duration} seconds... Speak now!")
+        
+        # Cached device index; re-resolved only if opening it fails
+        if device_id is None:
+            audio_data = devices.with_input_device(capture, Config.MIC_DEVICE_NAME)
+        else:
+            audio_data = capture(device_id)
         
         # Save audio file
         write(filename, samplerate, audio_data)
@@ -227,7 +246,7 @@ def record_audio(
         try:
             import shutil
             shutil.copy2(filename, Config.BACKUP_AUDIO_FILENAME)
-            logger.info(f"Backup created: {Config.BACKUP_AUDIO_FILENAME}")
+            logger.debug(f"Backup created: {Config.BACKUP_AUDIO_FILENAME}")
         except Exception as e:
             logger.warning(f"Could not create backup: {e}")
         
@@ -238,6 +257,7 @@ def record_audio(
         print(f"❌ Recording error: {e}")
         return None
 
+@metrics.timed("stt")
 def transcribe_audio(filename: str, max_retries: int = Config.MAX_RETRIES) -> Optional[str]:
     """Transcribe audio with retry logic and timeout"""
     if not os.path.exists(filename):
@@ -247,7 +267,7 @@ def transcribe_audio(filename: str, max_retries: int = Config.MAX_RETRIES) -> Op
     for attempt in range(max_retries):
         try:
             print(f"\n🧠 Transcribing... (Attempt {attempt + 1}/{max_retries})")
-            logger.info(f"Transcription attempt {attempt + 1}")
+            logger.debug(f"Transcription attempt {attempt + 1}")
             
             transcriber = aai.Transcriber()
             transcript = transcriber.transcribe(filename)
@@ -290,41 +310,17 @@ def transcribe_audio(filename: str, max_retries: int = Config.MAX_RETRIES) -> Op
     return None
 
 def compare_to_facts(text: str) -> str:
-    """Find answer with fuzzy matching and multiple keyword support"""
+    """Look the query up in the shared knowledge base"""
     if not text:
-        return "Sorry, I didn't catch that. Could you please repeat?"
+        return kb.message("empty")
     
     text = text.lower().strip()
     logger.info(f"Processing query: {text}")
     
-    # Normalize text for better matching
-    responses = []
-    
-    # Check for each fact category
-    if any(word in text for word in ["principal", "head", "headmaster", "director"]):
-        responses.append(f"The principal's name is {FACTS['principal']}.")
-    
-    if any(word in text for word in ["school", "institution", "academy"]) and "name" in text:
-        responses.append(f"The school's name is {FACTS['school name']}.")
-    
-    if any(word in text for word in ["location", "where", "place", "city", "located"]):
-        responses.append(f"The school is located in {FACTS['location']}.")
-    
-    if any(word in text for word in ["motto", "slogan", "tagline"]):
-        responses.append(f"The school motto is '{FACTS['motto']}'.")
-    
-    if any(word in text for word in ["established", "founded", "started", "when"]):
-        responses.append(f"The school was established in {FACTS['established']}.")
-    
-    if any(word in text for word in ["grade", "class", "level"]):
-        responses.append(f"We offer {FACTS['grades']}.")
-    
-    # Return combined response or default
-    if responses:
-        return " ".join(responses)
-    else:
+    answer, source = kb.lookup(text)
+    if source == "unknown":
         logger.info(f"No match found for query: {text}")
-        return "Sorry, I couldn't find an answer for that. You can ask about the principal, school name, location, motto, or grades offered."
+    return answer
 
 def should_exit(text: str) -> bool:
     """Check if the user wants to exit the conversation"""
@@ -351,167 +347,22 @@ def cleanup_files(*filenames):
         try:
             if os.path.exists(filename):
                 os.remove(filename)
-                logger.info(f"Cleaned up: {filename}")
+                logger.debug(f"Cleaned up: {filename}")
         except Exception as e:
             logger.warning(f"Could not delete {filename}: {e}")
 
-def run_single_interaction(engine: Optional[pyttsx3.Engine], turn: int = 1) -> tuple[Optional[str], bool]:
-    """
-    Run a single interaction (record -> transcribe -> respond)
-    Returns: (transcribed_text, should_continue)
-    """
-    audio_file = get_conversation_filename(turn)
-    
-    try:
-        # Record audio
-        recorded_file = record_audio(filename=audio_file)
-        if recorded_file is None:
-            error_msg = "Failed to record audio. Please check your microphone."
-            print(f"\n❌ {error_msg}")
-            speak(error_msg, engine)
-            return None, False
-        
-        # Transcribe
-        user_text = transcribe_audio(recorded_file)
-        if user_text is None:
-            error_msg = "Could not transcribe audio. Please try speaking more clearly."
-            print(f"\n❌ {error_msg}")
-            speak(error_msg, engine)
-            return None, False
-        
-        print(f"\n🗣️ You said: {user_text}")
-        
-        # Check for exit command
-        if should_exit(user_text):
-            logger.info("User requested to exit conversation")
-            return user_text, False
-        
-        # Generate response
-        response = compare_to_facts(user_text)
-        print(f"\n🤖 Bot: {response}")
-        
-        # Speak response
-        speak(response, engine)
-        
-        return user_text, True
-        
-    finally:
-        # Clean up the audio file for this turn
-        cleanup_files(audio_file)
-
 def run_conversation_mode(engine: Optional[pyttsx3.Engine]) -> int:
     """
     Run continuous conversation mode until exit keyword is detected
     Returns: exit code
     """
-    print("\n" + "=" * 50)
-    print("💬 CONVERSATION MODE ACTIVE")
-    print("=" * 50)
-    print(f"Say one of these words to exit: {', '.join(Config.EXIT_KEYWORDS)}")
-    print("=" * 50 + "\n")
-    
-    consecutive_errors = 0
-    turn = 0
-    
-    while True:
-        turn += 1
-        print(f"\n{'='*50}")
-        print(f"🔄 Turn {turn}")
-        print(f"{'='*50}")
-        
-        try:
-            user_text, should_continue = run_single_interaction(engine, turn)
-            
-            if user_text is None:
-                # Error occurred
-                consecutive_errors += 1
-                logger.warning(f"Consecutive errors: {consecutive_errors}/{Config.MAX_CONSECUTIVE_ERRORS}")
-                
-                if consecutive_errors >= Config.MAX_CONSECUTIVE_ERRORS:
-                    error_msg = "Too many errors occurred. Ending conversation."
-                    print(f"\n❌ {error_msg}")
-                    speak(error_msg, engine)
-                    return 1
-                
-                # Ask if user wants to continue and wait for response
-                continue_msg = "Would you like to try again? Say yes to continue or no to exit."
-                print(f"\n🤖 {continue_msg}")
-                speak(continue_msg, engine)
-                
-                # Wait for user's response
-                print("\n⏳ Waiting for your response...")
-                time.sleep(2)  # Give user time to prepare
-                
-                response_file = get_conversation_filename(turn + 1000)  # Use different numbering for yes/no responses
-                try:
-                    recorded_file = record_audio(filename=response_file, duration=5)
-                    if recorded_file:
-                        response_text = transcribe_audio(recorded_file)
-                        if response_text:
-                            print(f"🗣️ You said: {response_text}")
-                            # Check if user wants to continue
-                            if any(word in response_text.lower() for word in ["no", "nope", "exit", "stop", "quit"]):
-                                goodbye_msg = "Okay, ending conversation. Goodbye!"
-                                print(f"\n👋 {goodbye_msg}")
-                                speak(goodbye_msg, engine)
-                                return 0
-                            elif any(word in response_text.lower() for word in ["yes", "yeah", "yep", "sure", "okay", "continue"]):
-                                retry_msg = "Great! Let's try again."
-                                print(f"\n✅ {retry_msg}")
-                                speak(retry_msg, engine)
-                                time.sleep(1)
-                                continue
-                finally:
-                    cleanup_files(response_file)
-                
-                # If we couldn't understand the response, assume they want to continue
-                default_msg = "I'll assume you want to try again."
-                print(f"\n🤖 {default_msg}")
-                speak(default_msg, engine)
-                time.sleep(1)
-                continue
-            
-            # Reset error counter on success
-            consecutive_errors = 0
-            
-            if not should_continue:
-                # User wants to exit
-                goodbye_msg = "Thank you for using Greenfield School Voice Assistant. Goodbye!"
-                print(f"\n👋 {goodbye_msg}")
-                speak(goodbye_msg, engine)
-                logger.info(f"Conversation ended after {turn} turns")
-                return 0
-            
-            # Pause before next turn
-            time.sleep(1)
-            
-        except KeyboardInterrupt:
-            print("\n\n⚠️ Interrupted by user")
-            logger.info(f"User interrupted conversation at turn {turn}")
-            goodbye_msg = "Conversation interrupted. Goodbye!"
-            speak(goodbye_msg, engine)
-            return 0
-            
-        except Exception as e:
-            logger.error(f"Error in conversation turn {turn}: {e}", exc_info=True)
-            consecutive_errors += 1
-            
-            if consecutive_errors >= Config.MAX_CONSECUTIVE_ERRORS:
-                error_msg = "Too many errors occurred. Ending conversation."
-                print(f"\n❌ {error_msg}")
-                speak(error_msg, engine)
-                return 1
-            
-            error_msg = "An error occurred. Let's try again."
-            print(f"\n⚠️ {error_msg}")
-            speak(error_msg, engine)
-            time.sleep(1)
+    return ConversationEngine(sys.modules[__name__]).run_blocking()
 
 # ====== MAIN ======
 def main():
     """Main application loop with comprehensive error handling"""
     print("=" * 50)
-    print("🎓 GREENFIELD SCHOOL VOICE ASSISTANT")
+    print(f"🎓 {kb.facts['school name'].upper()} VOICE ASSISTANT")
     print("=" * 50)
     
     # Validate environment
@@ -527,11 +378,12 @@ def main():
         return 1
     
     # engine = initialize_tts_engine()
+    engine = None  # Piper is used for speech, see piper_speak()
     if engine is None:
         print("\n⚠️ TTS engine failed to initialize. Continuing with text-only mode.")
     
     # Welcome message
-    welcome_msg = f"Welcome to {FACTS['school name']}. How can I help you today?"
+    welcome_msg = f"Welcome to {kb.facts['school name']}. How can I help you today?"
     # speak(welcome_msg, engine)
     piper_speak(welcome_msg)
     
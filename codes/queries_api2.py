@@ -5,28 +5,27 @@ import time
 import os
 import sys
 import logging
+import threading
 from pathlib import Path
 from typing import Optional, Dict
 import warnings
 import pygame
 from io import BytesIO
+from knowledge import KnowledgeBase
+from conversation import ConversationEngine
+from audio_devices import devices
+from log_pipeline import setup_logging
+from metrics import metrics
 
 # ====== LOGGING SETUP ======
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('voice_assistant.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+setup_logging("voice_assistant.log")  # queued: a slow SD card never stalls a turn
 logger = logging.getLogger(__name__)
 
 # ====== CONFIGURATION ======
 class Config:
     """Centralized configuration with validation"""
     API_KEY = "307ced77979248b8b8b0a07621cc9a3c"
-    MIC_DEVICE_ID = 2
+    MIC_DEVICE_NAME = "USB"  # regex matched against the device name, AURA_MIC overrides
     DEFAULT_DURATION = 8
     SAMPLE_RATE = 16000
     AUDIO_FILENAME = "input.wav"
@@ -42,16 +41,19 @@ class Config:
     EXIT_KEYWORDS = ["stop", "exit", "quit", "goodbye", "bye", "end"]
     CONVERSATION_MODE = True  # Enable continuous conversation
     MAX_CONSECUTIVE_ERRORS = 3  # Exit after this many consecutive errors
+    
+    # Knowledge base: FAQ semantic search loads the sentence encoder, keep off for keyword-only
+    KB_EMBEDDINGS = False
+    
+    # Barge-in: keep the mic open while speaking and stop the answer when the visitor talks
+    BARGE_IN = True
+    BARGE_IN_ACTION = "duck"  # "stop", or "duck" to lower the volume on the first sign of speech
+    DUCK_VOLUME = 0.2
+    BARGE_IN_SENSITIVITY = 3.0  # speech = mic energy above the noise/echo floor times this
 
-# Knowledge base
-FACTS = {
-    "principal": "Mrs. Rakhi Mukherjee",
-    "school name": "Utpal Shanghvi Global School",
-    "location": "Juhu",
-    "motto": "Not Just Another School",
-    "established": "1982",
-    "grades": "kindergarten through A Level",
-}
+# Knowledge base (shared with queries.py and the GUIs, see knowledge/school_kb.json)
+kb = KnowledgeBase(use_embeddings=Config.KB_EMBEDDINGS)
+kb.start_watching()
 
 # ====== HELPER FUNCTIONS ======
 def check_dependencies():
@@ -81,14 +83,15 @@ def validate_environment():
     if not Config.API_KEY or Config.API_KEY == "YOUR_API_KEY_HERE":
         errors.append("AssemblyAI API key not configured")
     
-    # Check if audio devices are available
+    # Resolve the microphone once; every recording after this uses the cached index
     try:
-        devices = sd.query_devices()
-        if Config.MIC_DEVICE_ID >= len(devices):
-            logger.warning(f"Device ID {Config.MIC_DEVICE_ID} not found. Available devices:")
-            for i, device in enumerate(devices):
+        if devices.input_device(Config.MIC_DEVICE_NAME) is None:
+            logger.warning("Available devices:")
+            for i, device in enumerate(sd.query_devices()):
                 logger.info(f"  {i}: {device['name']}")
-            errors.append(f"Invalid microphone device ID: {Config.MIC_DEVICE_ID}")
+        else:
+            logger.info(f"Microphone: {devices.name('input', Config.MIC_DEVICE_NAME)}")
+        devices.watch_hotplug()
     except Exception as e:
         errors.append(f"Could not query audio devices: {e}")
     
@@ -202,10 +205,33 @@ def speak(text: str, fallback: bool = True, max_retries: int = 2):
                     except:
                         pass
                     os.remove(temp_audio_file)
-                    logger.info(f"Cleaned up: {temp_audio_file}")
+                    logger.debug(f"Cleaned up: {temp_audio_file}")
                 except Exception as e:
                     logger.warning(f"Could not cleanup {temp_audio_file}: {e}")
 
+@metrics.timed("tts")
+def synthesize_speech(text: str) -> bytes:
+    """Synthesize text with gTTS into in-memory MP3 bytes (no temp file)."""
+    from gtts import gTTS
+    buffer = BytesIO()
+    gTTS(text=text, lang='en', slow=False).write_to_fp(buffer)
+    return buffer.getvalue()
+
+def play_speech(mp3_data: bytes, stop_event: Optional[threading.Event] = None):
+    """Play MP3 bytes through pygame; returns when done or as soon as stop_event is set (barge-in)."""
+    stop_event = stop_event or threading.Event()
+    pygame.mixer.music.set_volume(1.0)
+    pygame.mixer.music.load(BytesIO(mp3_data))
+    pygame.mixer.music.play()
+    while pygame.mixer.music.get_busy():
+        if stop_event.wait(0.05):
+            pygame.mixer.music.stop()
+            break
+
+def duck_speech(active: bool):
+    """Lower the playback volume while the visitor might be talking (barge-in)."""
+    pygame.mixer.music.set_volume(Config.DUCK_VOLUME if active else 1.0)
+
 def record_audio(
     filename: str = Config.AUDIO_FILENAME,
     duration: int = Config.DEFAULT_DURATION,
@@ -213,30 +239,25 @@ def record_audio(
     device_id: Optional[int] = None
 ) -> Optional[str]:
     """Record audio with error handling and validation"""
-    if device_id is None:
-        device_id = Config.MIC_DEVICE_ID
-    
-    try:
-        # Validate device
-        devices = sd.query_devices()
-        if device_id >= len(devices):
-            logger.error(f"Device {device_id} not found")
-            return None
-        
-        device_info = devices[device_id]
-        logger.info(f"Using device: {device_info['name']}")
-        
-        print(f"\n🎤 Recording for {duration} seconds... Speak now!")
-        
-        # Record with specified device
-        audio_data = sd.rec(
+    def capture(device):
+        data = sd.rec(
             int(duration * samplerate),
             samplerate=samplerate,
             channels=1,
             dtype='int16',
-            device=device_id
+            device=device
         )
         sd.wait()
+        return data
+    
+    try:
+        print(f"\n🎤 Recording for {duration} seconds... Speak now!")
+        
+        # Cached device index; re-resolved only if opening it fails
+        if device_id is None:
+            audio_data = devices.with_input_device(capture, Config.MIC_DEVICE_NAME)
+        else:
+            audio_data = capture(device_id)
         
         # Save audio file
         write(filename, samplerate, audio_data)
@@ -256,7 +277,7 @@ def record_audio(
         try:
             import shutil
             shutil.copy2(filename, Config.BACKUP_AUDIO_FILENAME)
-            logger.info(f"Backup created: {Config.BACKUP_AUDIO_FILENAME}")
+            logger.debug(f"Backup created: {Config.BACKUP_AUDIO_FILENAME}")
         except Exception as e:
             logger.warning(f"Could not create backup: {e}")
         
@@ -267,6 +288,7 @@ def record_audio(
         print(f"❌ Recording error: {e}")
         return None
 
+@metrics.timed("stt")
 def transcribe_audio(filename: str, max_retries: int = Config.MAX_RETRIES) -> Optional[str]:
     """Transcribe audio with retry logic and timeout"""
     if not os.path.exists(filename):
@@ -276,7 +298,7 @@ def transcribe_audio(filename: str, max_retries: int = Config.MAX_RETRIES) -> Op
     for attempt in range(max_retries):
         try:
             print(f"\n🧠 Transcribing... (Attempt {attempt + 1}/{max_retries})")
-            logger.info(f"Transcription attempt {attempt + 1}")
+            logger.debug(f"Transcription attempt {attempt + 1}")
             
             transcriber = aai.Transcriber()
             transcript = transcriber.transcribe(filename)
@@ -319,41 +341,17 @@ def transcribe_audio(filename: str, max_retries: int = Config.MAX_RETRIES) -> Op
     return None
 
 def compare_to_facts(text: str) -> str:
-    """Find answer with fuzzy matching and multiple keyword support"""
+    """Look the query up in the shared knowledge base"""
     if not text:
-        return "Sorry, I didn't catch that. Could you please repeat?"
+        return kb.message("empty")
     
     text = text.lower().strip()
     logger.info(f"Processing query: {text}")
     
-    # Normalize text for better matching
-    responses = []
-    
-    # Check for each fact category
-    if any(word in text for word in ["principal", "head", "headmaster", "director"]):
-        responses.append(f"The principal's name is {FACTS['principal']}.")
-    
-    if any(word in text for word in ["school", "institution", "academy"]) and "name" in text:
-        responses.append(f"The school's name is {FACTS['school name']}.")
-    
-    if any(word in text for word in ["location", "where", "place", "city", "located"]):
-        responses.append(f"The school is located in {FACTS['location']}.")
-    
-    if any(word in text for word in ["motto", "slogan", "tagline"]):
-        responses.append(f"The school motto is '{FACTS['motto']}'.")
-    
-    if any(word in text for word in ["established", "founded", "started", "when"]):
-        responses.append(f"The school was established in {FACTS['established']}.")
-    
-    if any(word in text for word in ["grade", "class", "level"]):
-        responses.append(f"We offer {FACTS['grades']}.")
-    
-    # Return combined response or default
-    if responses:
-        return " ".join(responses)
-    else:
+    answer, source = kb.lookup(text)
+    if source == "unknown":
         logger.info(f"No match found for query: {text}")
-        return "Sorry, I couldn't find an answer for that. You can ask about the principal, school name, location, motto, or grades offered."
+    return answer
 
 def should_exit(text: str) -> bool:
     """Check if the user wants to exit the conversation"""
@@ -380,167 +378,22 @@ def cleanup_files(*filenames):
         try:
             if os.path.exists(filename):
                 os.remove(filename)
-                logger.info(f"Cleaned up: {filename}")
+                logger.debug(f"Cleaned up: {filename}")
         except Exception as e:
             logger.warning(f"Could not delete {filename}: {e}")
 
-def run_single_interaction(turn: int = 1) -> tuple[Optional[str], bool]:
-    """
-    Run a single interaction (record -> transcribe -> respond)
-    Returns: (transcribed_text, should_continue)
-    """
-    audio_file = get_conversation_filename(turn)
-    
-    try:
-        # Record audio
-        recorded_file = record_audio(filename=audio_file)
-        if recorded_file is None:
-            error_msg = "Failed to record audio. Please check your microphone."
-            print(f"\n❌ {error_msg}")
-            speak(error_msg)
-            return None, False
-        
-        # Transcribe
-        user_text = transcribe_audio(recorded_file)
-        if user_text is None:
-            error_msg = "Could not transcribe audio. Please try speaking more clearly."
-            print(f"\n❌ {error_msg}")
-            speak(error_msg)
-            return None, False
-        
-        print(f"\n🗣️ You said: {user_text}")
-        
-        # Check for exit command
-        if should_exit(user_text):
-            logger.info("User requested to exit conversation")
-            return user_text, False
-        
-        # Generate response
-        response = compare_to_facts(user_text)
-        print(f"\n🤖 Bot: {response}")
-        
-        # Speak response
-        speak(response)
-        
-        return user_text, True
-        
-    finally:
-        # Clean up the audio file for this turn
-        cleanup_files(audio_file)
-
 def run_conversation_mode() -> int:
     """
     Run continuous conversation mode until exit keyword is detected
     Returns: exit code
     """
-    print("\n" + "=" * 50)
-    print("💬 CONVERSATION MODE ACTIVE")
-    print("=" * 50)
-    print(f"Say one of these words to exit: {', '.join(Config.EXIT_KEYWORDS)}")
-    print("=" * 50 + "\n")
-    
-    consecutive_errors = 0
-    turn = 0
-    
-    while True:
-        turn += 1
-        print(f"\n{'='*50}")
-        print(f"🔄 Turn {turn}")
-        print(f"{'='*50}")
-        
-        try:
-            user_text, should_continue = run_single_interaction(turn)
-            
-            if user_text is None:
-                # Error occurred
-                consecutive_errors += 1
-                logger.warning(f"Consecutive errors: {consecutive_errors}/{Config.MAX_CONSECUTIVE_ERRORS}")
-                
-                if consecutive_errors >= Config.MAX_CONSECUTIVE_ERRORS:
-                    error_msg = "Too many errors occurred. Ending conversation."
-                    print(f"\n❌ {error_msg}")
-                    speak(error_msg)
-                    return 1
-                
-                # Ask if user wants to continue and wait for response
-                continue_msg = "Would you like to try again? Say yes to continue or no to exit."
-                print(f"\n🤖 {continue_msg}")
-                speak(continue_msg)
-                
-                # Wait for user's response
-                print("\n⏳ Waiting for your response...")
-                time.sleep(2)  # Give user time to prepare
-                
-                response_file = get_conversation_filename(turn + 1000)  # Use different numbering for yes/no responses
-                try:
-                    recorded_file = record_audio(filename=response_file, duration=5)
-                    if recorded_file:
-                        response_text = transcribe_audio(recorded_file)
-                        if response_text:
-                            print(f"🗣️ You said: {response_text}")
-                            # Check if user wants to continue
-                            if any(word in response_text.lower() for word in ["no", "nope", "exit", "stop", "quit"]):
-                                goodbye_msg = "Okay, ending conversation. Goodbye!"
-                                print(f"\n👋 {goodbye_msg}")
-                                speak(goodbye_msg)
-                                return 0
-                            elif any(word in response_text.lower() for word in ["yes", "yeah", "yep", "sure", "okay", "continue"]):
-                                retry_msg = "Great! Let's try again."
-                                print(f"\n✅ {retry_msg}")
-                                speak(retry_msg)
-                                time.sleep(1)
-                                continue
-                finally:
-                    cleanup_files(response_file)
-                
-                # If we couldn't understand the response, assume they want to continue
-                default_msg = "I'll assume you want to try again."
-                print(f"\n🤖 {default_msg}")
-                speak(default_msg)
-                time.sleep(1)
-                continue
-            
-            # Reset error counter on success
-            consecutive_errors = 0
-            
-            if not should_continue:
-                # User wants to exit
-                goodbye_msg = "Thank you for using Greenfield School Voice Assistant. Goodbye!"
-                print(f"\n👋 {goodbye_msg}")
-                speak(goodbye_msg)
-                logger.info(f"Conversation ended after {turn} turns")
-                return 0
-            
-            # Pause before next turn
-            time.sleep(1)
-            
-        except KeyboardInterrupt:
-            print("\n\n⚠️ Interrupted by user")
-            logger.info(f"User interrupted conversation at turn {turn}")
-            goodbye_msg = "Conversation interrupted. Goodbye!"
-            speak(goodbye_msg)
-            return 0
-            
-        except Exception as e:
-            logger.error(f"Error in conversation turn {turn}: {e}", exc_info=True)
-            consecutive_errors += 1
-            
-            if consecutive_errors >= Config.MAX_CONSECUTIVE_ERRORS:
-                error_msg = "Too many errors occurred. Ending conversation."
-                print(f"\n❌ {error_msg}")
-                speak(error_msg)
-                return 1
-            
-            error_msg = "An error occurred. Let's try again."
-            print(f"\n⚠️ {error_msg}")
-            speak(error_msg)
-            time.sleep(1)
+    return ConversationEngine(sys.modules[__name__]).run_blocking()
 
 # ====== MAIN ======
 def main():
     """Main application loop with comprehensive error handling"""
     print("=" * 50)
-    print("🎓 GREENFIELD SCHOOL VOICE ASSISTANT")
+    print(f"🎓 {kb.facts['school name'].upper()} VOICE ASSISTANT")
     print("=" * 50)
     
     # Validate environment
@@ -561,7 +414,7 @@ def main():
         print("\n⚠️ Audio playback engine failed to initialize. Continuing with text-only mode.")
     
     # Welcome message
-    welcome_msg = f"Welcome to {FACTS['school name']}. How can I help you today?"
+    welcome_msg = f"Welcome to {kb.facts['school name']}. How can I help you today?"
     speak(welcome_msg)
     
     try:
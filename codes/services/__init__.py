@@ -0,0 +1,2 @@
+from .ipc import ServiceUnavailable, request, address
+from .manager import SERVICES, ServiceManager, ServiceError
@@ -0,0 +1,46 @@
+"""
+Control the resident services from a shell (run from the codes/ folder):
+
+    python -m services up                          # start any that aren't running
+    python -m services status
+    python -m services recognizer start
+    python -m services enroller start name=Asha
+    python -m services voice stop
+    python -m services down
+"""
+import sys
+
+from .ipc import ServiceUnavailable, request
+from .manager import SERVICES, ServiceManager
+
+
+def main(argv):
+    if not argv or argv[0] in ("-h", "--help"):
+        print(__doc__)
+        return 0
+
+    if argv[0] == "up":
+        ServiceManager().ensure_running()
+        return 0
+    if argv[0] in ("status", "down"):
+        for name in SERVICES:
+            try:
+                reply = request(name, "shutdown" if argv[0] == "down" else "status")
+            except ServiceUnavailable:
+                reply = {"state": "stopped"}
+            print(f"{name:<11} {reply.get('state', 'stopping'):<8} {reply.get('message', '')}")
+        return 0
+
+    name, cmd, *rest = argv
+    args = dict(item.split("=", 1) for item in rest)
+    try:
+        reply = request(name, cmd, **args)
+    except ServiceUnavailable as e:
+        print(f"❌ {e}")
+        return 1
+    print(reply)
+    return 0 if reply.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
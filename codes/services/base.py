@@ -0,0 +1,244 @@
+"""
+Base class for a resident worker process.
+
+load() runs once when the process starts (models, datasets). Each "start"
+request queues a job; jobs run one at a time on the main thread (so OpenCV
+windows work) while a background thread keeps answering status/results/stop.
+A "start" with the same arguments as the queued/running job returns that job.
+
+Shorter background work that may overlap a job (retraining while recognition
+runs, re-indexing the FAQ) is a task: a task_<kind>(task, **args) method run
+in its own thread.
+
+    task kind=...      start a task, or get the id of the same one already running
+    task_status task=  {"state": running | done | error | cancelled, "progress", "message"}
+    cancel task=       ask a task to stop at its next progress report
+"""
+import collections
+import logging
+import os
+import queue
+import threading
+import time
+from multiprocessing.connection import AuthenticationError
+
+from .ipc import listen
+
+logger = logging.getLogger(__name__)
+
+KEEP_TASKS = 20  # finished tasks kept for task_status
+
+
+class TaskCancelled(Exception):
+    """Raised from Task.set_progress() once the task has been cancelled."""
+
+
+class Task:
+    def __init__(self, task_id, kind, args):
+        self.id = task_id
+        self.kind = kind
+        self.args = args
+        self.state = "running"  # running | done | error | cancelled
+        self.progress = None
+        self.message = ""
+        self.cancel_event = threading.Event()
+
+    def set_progress(self, done, total, message=""):
+        """Report progress; this is also where a cancelled task stops (TaskCancelled)."""
+        if self.cancel_event.is_set():
+            raise TaskCancelled()
+        self.progress = done / total if total else None
+        if message:
+            self.message = message
+
+    def info(self):
+        return {"ok": True, "task": self.id, "kind": self.kind, "state": self.state,
+                "progress": self.progress, "message": self.message}
+
+
+class Service:
+    name = "service"
+
+    def __init__(self):
+        self.state = "loading"  # loading | idle | running | error
+        self.message = ""
+        self.progress = None  # 0..1 while a job reports progress
+        self.load_error = None
+        self.stop_event = threading.Event()
+        self.jobs = queue.Queue()
+        self._next_job = 1
+        self.finished_job = 0  # id of the last job that finished (ok or error)
+        self._pending = None  # (job, args) queued or running
+        self.tasks = {}  # id -> Task
+        self._next_task = 1
+        self._results = collections.deque(maxlen=200)
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._listener = None
+
+    # ----- for subclasses -----
+    def load(self):
+        """One-time heavy setup."""
+
+    def unload(self):
+        """Release what load() acquired; runs when the service shuts down."""
+
+    def run_job(self, **args):
+        """Do the work for one "start" request. Return early when self.stop_event is set."""
+        raise NotImplementedError
+
+    def handle(self, cmd, args):
+        """Service-specific commands; return a reply dict."""
+        return {"ok": False, "error": f"unknown command {cmd!r}"}
+
+    def publish(self, **item):
+        """Record a result for clients polling "results"."""
+        with self._lock:
+            self._seq += 1
+            self._results.append({"seq": self._seq, "time": time.time(), **item})
+
+    def set_progress(self, done, total, message=""):
+        self.progress = done / total if total else None
+        if message:
+            self.message = message
+
+    # ----- protocol -----
+    def status(self):
+        return {
+            "ok": True,
+            "service": self.name,
+            "pid": os.getpid(),
+            "state": self.state,
+            "message": self.message,
+            "progress": self.progress,
+            "queued": self.jobs.qsize(),
+            "finished_job": self.finished_job,
+        }
+
+    def dispatch(self, msg):
+        args = dict(msg)
+        cmd = args.pop("cmd", None)
+        if cmd == "status":
+            return self.status()
+        if cmd == "start":
+            with self._lock:
+                if self._pending is not None and self._pending[1] == args:
+                    return {"ok": True, "job": self._pending[0], "deduplicated": True}
+                if self.state == "running" or not self.jobs.empty():
+                    return {"ok": False, "error": f"{self.name} is busy"}
+                job = self._next_job
+                self._next_job += 1
+                self._pending = (job, args)
+                self.jobs.put((job, args))
+            return {"ok": True, "job": job}
+        if cmd == "task":
+            return self.start_task(args.pop("kind", None), args)
+        if cmd in ("task_status", "cancel"):
+            task = self.tasks.get(int(args.get("task", 0)))
+            if task is None:
+                return {"ok": False, "error": f"no task {args.get('task')!r}"}
+            if cmd == "cancel":
+                task.cancel_event.set()
+            return task.info()
+        if cmd == "stop":
+            self.stop_event.set()
+            return {"ok": True}
+        if cmd == "results":
+            since = args.get("since", 0)
+            with self._lock:
+                items = [r for r in self._results if r["seq"] > since]
+            return {"ok": True, "results": items, "last": self._seq}
+        if cmd == "shutdown":
+            self.stop_event.set()
+            self.jobs.put(None)
+            return {"ok": True}
+        return self.handle(cmd, args)
+
+    def start_task(self, kind, args):
+        run = getattr(self, f"task_{kind}", None)
+        if run is None:
+            return {"ok": False, "error": f"unknown task {kind!r}"}
+        if self.state == "loading":
+            return {"ok": False, "error": f"{self.name} is still loading"}
+        if self.load_error:
+            return {"ok": False, "error": self.load_error}
+        with self._lock:
+            for task in self.tasks.values():
+                if task.kind == kind and task.args == args and task.state == "running":
+                    return {**task.info(), "deduplicated": True}
+            task = Task(self._next_task, kind, args)
+            self._next_task += 1
+            self.tasks[task.id] = task
+            for old in [t for t in self.tasks.values() if t.state != "running"][:-KEEP_TASKS]:
+                del self.tasks[old.id]
+        threading.Thread(target=self._run_task, args=(task, run), daemon=True,
+                         name=f"{self.name}-{kind}").start()
+        return task.info()
+
+    def _run_task(self, task, run):
+        try:
+            run(task, **task.args)
+            task.state, task.progress = "done", 1.0
+        except TaskCancelled:
+            task.state, task.message = "cancelled", f"{task.kind} cancelled"
+        except Exception as e:
+            task.state, task.message = "error", str(e)
+            logger.error(f"{self.name} {task.kind} task failed: {e}", exc_info=True)
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn = self._listener.accept()
+            except AuthenticationError:
+                logger.warning(f"{self.name}: rejected a connection without the IPC key")
+                continue
+            except OSError:
+                return
+            with conn:
+                try:
+                    conn.send(self.dispatch(conn.recv()))
+                except Exception as e:
+                    logger.error(f"{self.name}: bad request: {e}")
+
+    # ----- main loop -----
+    def serve(self):
+        self._listener = listen(self.name)
+        threading.Thread(target=self._accept_loop, daemon=True, name=f"{self.name}-ipc").start()
+        print(f"🟢 {self.name} service listening (pid {os.getpid()})")
+
+        try:
+            t = time.perf_counter()
+            self.load()
+            self.state = "idle"
+            print(f"✅ {self.name} ready in {time.perf_counter() - t:.1f}s")
+        except Exception as e:
+            self.state = "error"
+            self.load_error = self.message = f"Failed to load: {e}"
+            logger.error(f"{self.name}: {self.message}", exc_info=True)
+
+        try:
+            while True:
+                item = self.jobs.get()
+                if item is None:
+                    break
+                job, args = item
+                if self.load_error:
+                    self.message = self.load_error
+                    self.finished_job = job
+                    self._pending = None
+                    continue
+                self.stop_event.clear()
+                self.state, self.message, self.progress = "running", "", None
+                try:
+                    self.run_job(**args)
+                    self.state = "idle"
+                except Exception as e:
+                    self.state = "error"
+                    self.message = str(e)
+                    logger.error(f"{self.name} job failed: {e}", exc_info=True)
+                self.finished_job = job
+                self._pending = None
+        finally:
+            self.unload()
+            self._listener.close()
+            print(f"🔴 {self.name} service stopped")
@@ -0,0 +1,59 @@
+"""
+Resident face enroller: the SSD detector loads once at boot.
+
+    start name=...   capture faces for one person, save data/<name>.npy and
+                     start the recognizer's retrain task (progress in "status")
+    stop             stop capturing early; what was captured so far is saved
+    results          {"name", "faces"} per finished enrollment
+"""
+import sys
+import time
+
+from vision import FACES_PER_PERSON, WindowSink, capture_faces, load_detector, open_camera, save_faces
+
+from .base import Service
+from .ipc import ServiceUnavailable, request
+
+
+def release_camera(timeout=3.0):
+    """Stop the recognizer (it holds the camera while it runs) and wait until it lets go."""
+    try:
+        request("recognizer", "stop")
+        deadline = time.monotonic() + timeout
+        while request("recognizer", "status")["state"] == "running" and time.monotonic() < deadline:
+            time.sleep(0.05)
+    except ServiceUnavailable:
+        pass
+
+
+class EnrollerService(Service):
+    name = "enroller"
+
+    def load(self):
+        self.net = load_detector()
+
+    def run_job(self, name=None, count=FACES_PER_PERSON):
+        name = (name or "").strip()
+        if not name:
+            raise ValueError("No name provided")
+
+        release_camera()
+        self.message = f"Capturing faces for {name}..."
+        face_data = capture_faces(
+            self.net, open_camera(), WindowSink("Face Capture"), count=count, stop_event=self.stop_event,
+            on_progress=lambda done, total: self.set_progress(done, total, f"Captured {done}/{total} faces"),
+        )
+        if not face_data:
+            raise RuntimeError(f"No faces captured for {name}")
+        shape = save_faces(name, face_data)
+        self.message = f"Saved {shape[0]} faces for {name}"
+        self.publish(name=name, faces=shape[0])
+
+        try:
+            request("recognizer", "task", kind="retrain")
+        except ServiceUnavailable:
+            pass
+
+
+if __name__ == "__main__":
+    sys.exit(EnrollerService().serve())
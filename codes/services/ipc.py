@@ -0,0 +1,139 @@
+"""
+Local IPC for the resident services: one Unix socket (named pipe on Windows)
+per service, one request/reply dict per connection.
+
+Requests:  {"cmd": "start" | "stop" | "status" | "results" | <service specific>, ...args}
+Replies:   {"ok": True, ...} or {"ok": False, "error": "..."}
+
+Messages are pickled, so nothing unauthenticated is ever unpickled:
+
+  - the sockets live in a private directory (mode 0700, owned by us):
+    $XDG_RUNTIME_DIR/aura, or aura-<uid> in the temp directory without one
+  - both ends prove they know a random key (multiprocessing's HMAC
+    challenge) before a message is read; the key is made once per boot and
+    kept in that directory, mode 0600
+"""
+import contextlib
+import os
+import secrets
+import stat
+import sys
+import tempfile
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+def _default_run_dir():
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / "aura"
+    uid = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    return Path(tempfile.gettempdir()) / f"aura-{uid}"
+
+
+RUN_DIR = Path(os.environ.get("AURA_RUN_DIR") or _default_run_dir())
+KEY_FILE = "authkey"
+
+_key = None
+
+if sys.platform.startswith("win"):
+    FAMILY = "AF_PIPE"
+else:
+    FAMILY = "AF_UNIX"
+
+
+class ServiceUnavailable(ConnectionError):
+    """The service is not running (or not accepting connections yet)."""
+
+
+def boot_id():
+    try:
+        return Path("/proc/sys/kernel/random/boot_id").read_text().strip()
+    except OSError:
+        return ""
+
+
+def run_dir():
+    """RUN_DIR, created mode 0700; refuses one that another user owns or others can write to."""
+    RUN_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if hasattr(os, "getuid"):
+        info = os.lstat(RUN_DIR)
+        if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+            raise RuntimeError(f"{RUN_DIR} must be a directory owned by this user with mode 0700")
+    return RUN_DIR
+
+
+@contextlib.contextmanager
+def _locked(path):
+    """Exclusive lock on path while the block runs (fcntl; no-op where there is none)."""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _read_key(path):
+    try:
+        boot, key = path.read_text().split()
+        return bytes.fromhex(key) if boot == (boot_id() or "-") else None
+    except (OSError, ValueError):
+        return None
+
+
+def authkey():
+    """This boot's shared key, created (mode 0600) by whichever process asks first."""
+    global _key
+    if _key is None:
+        path = run_dir() / KEY_FILE
+        with _locked(path.with_suffix(".lock")):
+            _key = _read_key(path)
+            if _key is None:  # first start this boot
+                _key = secrets.token_bytes(32)
+                tmp = path.with_suffix(".tmp")
+                fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "w") as f:
+                    f.write(f"{boot_id() or '-'} {_key.hex()}\n")
+                os.replace(tmp, path)
+    return _key
+
+
+def address(name):
+    if FAMILY == "AF_PIPE":
+        return rf"\\.\pipe\aura-{name}"
+    return str(run_dir() / f"{name}.sock")
+
+
+def listen(name):
+    """Listener for a service, replacing a stale socket left by a crashed process."""
+    addr = address(name)
+    if FAMILY == "AF_UNIX" and os.path.exists(addr):
+        try:
+            request(name, "status")
+        except ServiceUnavailable:
+            os.unlink(addr)
+        else:
+            raise RuntimeError(f"{name} service is already running")
+    listener = Listener(addr, family=FAMILY, authkey=authkey())
+    if FAMILY == "AF_UNIX":
+        os.chmod(addr, 0o600)
+    return listener
+
+
+def request(name, cmd, /, **args):
+    """Send one command to a service and return its reply dict."""
+    try:
+        conn = Client(address(name), family=FAMILY, authkey=authkey())
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        raise ServiceUnavailable(f"{name} service is not running") from e
+    with conn:
+        conn.send({"cmd": cmd, **args})
+        return conn.recv()
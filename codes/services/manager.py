@@ -0,0 +1,86 @@
+"""
+GUI side of the resident services: start them once at boot, then send commands.
+
+    services = ServiceManager()
+    services.ensure_running()                      # at startup, returns immediately
+    job = services.call("enroller", "start", name="Asha")["job"]
+    services.call("recognizer", "stop")
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from .ipc import ServiceUnavailable, request
+
+CODES_DIR = Path(__file__).resolve().parent.parent
+AUTOSTART = os.environ.get("AURA_SERVICES", "1") != "0"  # 0: never spawn (benchmarks, debugging)
+
+SERVICES = {
+    "recognizer": "services.recognizer",
+    "enroller": "services.enroller",
+    "voice": "services.voice",
+}
+
+
+class ServiceError(RuntimeError):
+    """A service answered with {"ok": False}."""
+
+
+class ServiceManager:
+    def __init__(self, names=None):
+        self.names = list(names or SERVICES)
+        self.processes = {}  # services this manager spawned
+
+    def is_running(self, name):
+        try:
+            request(name, "status")
+            return True
+        except ServiceUnavailable:
+            return False
+
+    def spawn(self, name):
+        print(f"🚀 Starting {name} service...")
+        self.processes[name] = subprocess.Popen([sys.executable, "-m", SERVICES[name]], cwd=str(CODES_DIR))
+
+    def ensure_running(self, names=None):
+        """Spawn every service that isn't already up (e.g. left running by an earlier GUI)."""
+        if not AUTOSTART:
+            return
+        for name in names or self.names:
+            proc = self.processes.get(name)
+            if proc is not None and proc.poll() is None:
+                continue
+            if not self.is_running(name):
+                self.spawn(name)
+
+    def call(self, name, cmd, /, **args):
+        """Send a command and return the reply. Raises ServiceError with a readable message."""
+        try:
+            reply = request(name, cmd, **args)
+        except ServiceUnavailable:
+            proc = self.processes.get(name)
+            if AUTOSTART and (proc is None or proc.poll() is not None):
+                self.spawn(name)
+            raise ServiceError(f"The {name} service is starting up, please try again in a moment.")
+        if not reply.get("ok"):
+            raise ServiceError(reply.get("error", f"{name} {cmd} failed"))
+        return reply
+
+    def status(self, name):
+        try:
+            return request(name, "status")
+        except ServiceUnavailable:
+            return {"ok": False, "service": name, "state": "stopped"}
+
+    def shutdown(self):
+        """Stop the services this manager started."""
+        for name, proc in self.processes.items():
+            if proc.poll() is not None:
+                continue
+            try:
+                request(name, "shutdown")
+                proc.wait(timeout=3)
+            except (ServiceUnavailable, subprocess.TimeoutExpired):
+                proc.terminate()
+        self.processes.clear()
@@ -0,0 +1,45 @@
+"""
+Qt helper: poll a service job's status from the GUI thread without blocking it.
+
+    watcher = JobWatcher(services, parent=self)
+    watcher.progress.connect(lambda name, pct, message: ...)
+    watcher.watch("enroller", job, on_done=lambda status: ...)
+    watcher.busy.connect(lambda busy: ...)     # True while any watched job runs
+"""
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class JobWatcher(QObject):
+    progress = pyqtSignal(str, int, str)  # service, percent (-1 if unknown), message
+    busy = pyqtSignal(bool)
+
+    def __init__(self, services, interval_ms=250, parent=None):
+        super().__init__(parent)
+        self.services = services
+        self.watched = {}  # service -> (job, on_done)
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.poll)
+
+    def watch(self, name, job, on_done=None):
+        """on_done(status) runs once the job has finished; status["state"] is "idle" or "error"."""
+        if not self.watched:
+            self.busy.emit(True)
+        self.watched[name] = (job, on_done)
+        self.timer.start()
+
+    def poll(self):
+        for name, (job, on_done) in list(self.watched.items()):
+            status = self.services.status(name)
+            if status.get("state") == "stopped":
+                status["message"] = f"The {name} service stopped"
+            elif status.get("finished_job", 0) < job:
+                progress = status.get("progress")
+                self.progress.emit(name, -1 if progress is None else int(progress * 100), status.get("message", ""))
+                continue
+            del self.watched[name]
+            if on_done is not None:
+                on_done(status)
+        if not self.watched:
+            self.timer.stop()
+            self.busy.emit(False)
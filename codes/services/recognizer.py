@@ -0,0 +1,76 @@
+"""
+Resident face recognizer: the SSD detector and LBPH model load once at boot.
+
+    start          open the camera and run recognition until stop (or the window closes);
+                   view="shared" publishes frames to the GUI's CameraView instead of a window
+    stop           stop recognition and release the camera
+    reload         retrain from data/ and reply when done
+    task kind=retrain
+                   retrain from data/ in the background with progress (the enroller
+                   starts this after saving a person); recognition keeps the old
+                   model until the new one is trained
+    reset          greet everyone again
+    results        recognised names, {"name", "box"} per face
+"""
+import sys
+
+from vision import FaceDatabase, Greeter, RecognitionPipeline, WindowSink, load_detector, open_camera
+from vision.frames import FrameRing, SharedFrameCapture, SharedMemorySink
+
+from .base import Service
+
+
+class RecognizerService(Service):
+    name = "recognizer"
+
+    def load(self):
+        self.net = load_detector()
+        self.faces = FaceDatabase()
+        self.greeter = Greeter()
+        self.ring = FrameRing.create()  # exists for the service's lifetime so the GUI can attach any time
+        self.reload()
+
+    def unload(self):
+        if getattr(self, "ring", None) is not None:
+            self.ring.close()
+
+    def reload(self):
+        try:
+            self.faces.load(verbose=False)
+            self.message = f"{len(self.faces.names)} people registered"
+        except FileNotFoundError as e:
+            self.message = str(e)
+
+    def task_retrain(self, task):
+        self.faces.load(verbose=False, on_progress=task.set_progress)
+        task.message = self.message = f"{len(self.faces.names)} people registered"
+
+    def on_recognised(self, name, box):
+        self.publish(name=name, box=[int(v) for v in box[:4]])
+        self.greeter(name)
+
+    def run_job(self, view="window"):
+        if not self.faces.names:
+            raise RuntimeError(self.message)
+        if view == "shared":
+            # frames are decoded into the ring, annotated in place and published without a copy
+            capture, sink = SharedFrameCapture(open_camera(), self.ring), SharedMemorySink(self.ring)
+        else:
+            capture, sink = open_camera(), WindowSink("Face Recognition", on_key={ord('r'): self.greeter.reset})
+        pipeline = RecognitionPipeline(self.net, self.faces, capture, sink, on_recognised=self.on_recognised)
+        pipeline.run(self.stop_event)
+
+    def handle(self, cmd, args):
+        if cmd == "reload":
+            if self.state == "loading":
+                return {"ok": False, "error": "still loading"}
+            self.reload()
+            return {"ok": True, "people": list(self.faces.names.values())}
+        if cmd == "reset":
+            self.greeter.spoken_names.clear()
+            return {"ok": True}
+        return super().handle(cmd, args)
+
+
+if __name__ == "__main__":
+    sys.exit(RecognizerService().serve())
@@ -0,0 +1,64 @@
+"""
+Resident voice assistant: the assistant module (queries_api.py by default,
+AURA_VOICE_MODULE=queries_api2 for the gTTS one) is imported once at boot, so
+Piper/the knowledge base/the audio devices are ready before the first press.
+
+    start      welcome the visitor and run conversation mode until they say goodbye
+    stop       end the conversation after the current turn
+    results    {"exit_code"} per finished conversation
+    task kind=reindex     re-read the knowledge file and encode new FAQ questions
+    task kind=prerender   synthesize the welcome and the fixed prompts ahead of the
+                          first conversation
+"""
+import importlib
+import os
+import sys
+
+from conversation import ConversationEngine, fixed_prompts
+
+from .base import Service
+
+VOICE_MODULE = os.environ.get("AURA_VOICE_MODULE", "queries_api")
+
+
+class VoiceService(Service):
+    name = "voice"
+
+    def load(self):
+        self.assistant = importlib.import_module(VOICE_MODULE)
+        if not self.assistant.validate_environment():
+            raise RuntimeError("Environment validation failed, see voice_assistant.log")
+        self.assistant.aai.settings.api_key = self.assistant.Config.API_KEY
+        self.speech_cache = {}  # pre-rendered prompts survive between conversations
+
+    def welcome_prompt(self):
+        return f"Welcome to {self.assistant.kb.facts['school name']}. How can I help you today?"
+
+    def run_job(self):
+        a = self.assistant
+        welcome_msg = self.welcome_prompt()
+        self.message = "Conversation active"
+        audio = self.speech_cache.get(welcome_msg)
+        a.play_speech(audio if audio is not None else a.synthesize_speech(welcome_msg))
+
+        engine = ConversationEngine(a, stop_event=self.stop_event, speech_cache=self.speech_cache)
+        exit_code = engine.run_blocking()
+        self.publish(exit_code=exit_code)
+        self.message = "Conversation ended"
+
+    def task_reindex(self, task):
+        task.set_progress(0, 1, "Reading the knowledge base")
+        self.assistant.kb.reload(on_progress=task.set_progress)
+        task.message = f"Knowledge base revision {self.assistant.kb.revision} indexed"
+
+    def task_prerender(self, task):
+        texts = [self.welcome_prompt()] + fixed_prompts(self.assistant)
+        for done, text in enumerate(texts):
+            task.set_progress(done, len(texts), f"Rendering prompt {done + 1}/{len(texts)}")
+            if text not in self.speech_cache:
+                self.speech_cache[text] = self.assistant.synthesize_speech(text)
+        task.message = f"{len(texts)} prompts ready"
+
+
+if __name__ == "__main__":
+    sys.exit(VoiceService().serve())
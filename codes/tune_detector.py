@@ -0,0 +1,32 @@
+"""
+Time the SSD face detector's runtime combinations now (vision/runtime.py), or
+write fp16/int8 copies of an ONNX export of it:
+
+    python tune_detector.py                   # time all, cache the fastest
+    python tune_detector.py --convert assets/res10_300x300_ssd.onnx --calibrate clip.mp4
+"""
+import argparse
+import sys
+
+from vision.runtime import CACHE_FILE, candidates, configured, convert
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--convert", metavar="ONNX", help="write fp16/int8 copies of this ONNX export of the SSD")
+    parser.add_argument("--calibrate", metavar="CLIP", help="recorded clip for the int8 calibration")
+    args = parser.parse_args()
+    if args.convert:
+        convert(args.convert, args.calibrate)
+        return 0
+
+    if not candidates():
+        print("No SSD model could be loaded")
+        return 1
+    CACHE_FILE.unlink(missing_ok=True)
+    configured()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,12 @@
+from .dataset import BASE_DIR, DATASET_DIR, ASSETS_DIR, FACE_SIZE, FaceDatabase, save_faces
+from .pipeline import (
+    DETECTION_CONFIDENCE, RecognitionPipeline, WindowSink, NullSink, Greeter,
+    open_camera, detect_faces, face_crop, annotate,
+)
+from .enroll import FACES_PER_PERSON, capture_faces
+from .batch import FaceBatch, BatchRecognizer
+from .preprocess import SSD_SIZE, FramePreprocessor, default_preprocessor
+from .postprocess import MIN_FACE_SIZE, NMS_THRESHOLD, filter_faces, filter_boxes
+from .detectors import DETECTOR, DETECTORS, Detector, SSDDetector, YuNetDetector, HaarDetector, load_detector
+from .runtime import DnnRuntime, autotune, configured, load_ssd
+from .roi import USE_ROI, RoiScheduler
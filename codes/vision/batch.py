@@ -0,0 +1,82 @@
+"""
+Batched recognition: every face of a frame in one buffer, classified together.
+
+    recogniser = BatchRecognizer(faces)
+    for name, box in recogniser.recognise(frame, detect_faces(net, frame)): ...
+
+FaceBatch crops into one preallocated (N, 128, 128) uint8 array through two
+frame-sized scratch buffers (gray, equalized), so a frame allocates nothing
+per face; the crops are the same pixels face_crop() gives. The buffers grow
+when a bigger group or frame shows up and are reused after that.
+
+FaceDatabase.predict_batch() classifies the whole batch: k-NN as one
+distance matrix, LBPH (which has no batch call) face by face, spread over
+WORKERS threads (OpenCV releases the GIL), so a group costs about one face
+per core instead of one face each.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+from metrics import metrics
+
+from .dataset import FACE_SIZE
+
+CAPACITY = 8  # faces before the buffer first grows
+WORKERS = min(4, os.cpu_count() or 1)
+
+
+class FaceBatch:
+    def __init__(self, capacity=CAPACITY):
+        self.faces = np.empty((capacity, FACE_SIZE[1], FACE_SIZE[0]), np.uint8)
+        self._gray = np.empty((0, 0), np.uint8)
+        self._equalized = np.empty((0, 0), np.uint8)
+        self.boxes = []
+
+    def _reserve(self, count, frame_shape):
+        if count > len(self.faces):
+            self.faces = np.empty((max(count, 2 * len(self.faces)), *self.faces.shape[1:]), np.uint8)
+        h, w = frame_shape[:2]
+        if self._gray.shape[0] < h or self._gray.shape[1] < w:
+            self._gray = np.empty((h, w), np.uint8)
+            self._equalized = np.empty((h, w), np.uint8)
+
+    def fill(self, frame, boxes):
+        """Crop every box of frame into the batch; returns the (n, 128, 128) view (empty boxes are skipped)."""
+        self._reserve(len(boxes), frame.shape)
+        self.boxes = []
+        for box in boxes:
+            x1, y1, x2, y2 = box[:4]
+            section = frame[y1:y2, x1:x2]
+            if section.size == 0:
+                continue
+            h, w = section.shape[:2]
+            gray = cv2.cvtColor(section, cv2.COLOR_BGR2GRAY, dst=self._gray[:h, :w])
+            equalized = cv2.equalizeHist(gray, dst=self._equalized[:h, :w])
+            cv2.resize(equalized, FACE_SIZE, dst=self.faces[len(self.boxes)])
+            self.boxes.append(box)
+        return self.faces[:len(self.boxes)]
+
+
+class BatchRecognizer:
+    """Crops and classifies all the detections of a frame together (see the module docstring)."""
+
+    def __init__(self, faces, capacity=CAPACITY, workers=WORKERS):
+        self.faces = faces
+        self.batch = FaceBatch(capacity)
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix="recognise") if workers > 1 else None
+
+    def recognise(self, frame, boxes):
+        """[(name, box), ...] for every non-empty box."""
+        crops = self.batch.fill(frame, boxes)
+        if not len(crops):
+            return []
+        with metrics.timer("predict_batch"):
+            names = self.faces.predict_batch(crops, map=self.pool.map if self.pool is not None else map)
+        return list(zip(names, self.batch.boxes))
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False)
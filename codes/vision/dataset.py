@@ -0,0 +1,140 @@
+"""
+Face data on disk (data/<name>.npy, one 128x128 grayscale crop per row) and
+the recognizers trained from it.
+"""
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from metrics import metrics
+
+# Handle PyInstaller environment
+if hasattr(sys, '_MEIPASS'):
+    BASE_DIR = Path(sys._MEIPASS)
+else:
+    BASE_DIR = Path(__file__).resolve().parent.parent
+
+DATASET_DIR = BASE_DIR / "data"
+ASSETS_DIR = BASE_DIR / "assets"
+
+MODEL_FILE = ASSETS_DIR / "res10_300x300_ssd_iter_140000.caffemodel"
+CONFIG_FILE = ASSETS_DIR / "deploy.prototxt"
+
+FACE_SIZE = (128, 128)
+
+
+def knn(train, tests, k=5):
+    """
+    Majority label of the k nearest training faces (euclidean) for every row of
+    tests (n, 128*128); ties go to the lower label. train is (faces, norms, labels)
+    from FaceDatabase.load(), all test rows are matched in one matrix product.
+    """
+    faces, norms, labels = train
+    tests = tests.reshape(len(tests), -1).astype(np.float32)
+    # (faces, n): |face|^2 - 2 face.test (+ |test|^2, the same down a column); this
+    # orientation lets BLAS stream the training matrix once for the whole batch
+    dist = norms[:, None] - 2 * (faces @ tests.T)
+    k = min(k, len(dist))
+    nearest = np.argpartition(dist, k - 1, axis=0)[:k]
+    return [int(np.bincount(labels[column]).argmax()) for column in nearest.T]
+
+
+def save_faces(name, faces, path=DATASET_DIR):
+    path = Path(path)
+    path.mkdir(exist_ok=True)
+    faces = np.array(faces)
+    np.save(path / f"{name}.npy", faces)
+    return faces.shape
+
+
+class FaceDatabase:
+    """Registered people and an LBPH (or knn) recognizer trained on their faces."""
+
+    def __init__(self, path=DATASET_DIR, use_lbph=True):
+        self.path = Path(path)
+        self.use_lbph = use_lbph
+        # (names, lbph, trainset), swapped as one so a reload never races predict()
+        self._model = ({}, None, None)
+
+    @property
+    def names(self):
+        return self._model[0]
+
+    def load(self, verbose=True, on_progress=None):
+        """
+        (Re)read every .npy file and retrain. Raises FileNotFoundError when there is no data.
+        on_progress(done, total, message) after each person and before training; the
+        current model stays in use until the new one is complete.
+        """
+        if not self.path.exists():
+            raise FileNotFoundError("'data' folder not found. Please run train.py first.")
+
+        files = sorted(self.path.glob("*.npy"))
+        steps = 2 * len(files) + 1  # read each person, prepare their faces, train
+        names, face_data, labels = {}, [], []
+        for class_id, file in enumerate(files):
+            names[class_id] = file.stem
+            if verbose:
+                print(" Loaded:", file.name)
+            if on_progress is not None:
+                on_progress(class_id, steps, f"Loading {file.stem}")
+            data_item = np.load(file)
+            face_data.append(data_item)
+            labels.append(class_id * np.ones((data_item.shape[0],)))
+
+        if not face_data:
+            raise FileNotFoundError("No training data found in ./data/. Please collect faces first.")
+
+        if self.use_lbph:
+            lbph = cv2.face.LBPHFaceRecognizer_create(
+                radius=1,
+                neighbors=8,
+                grid_x=8,
+                grid_y=8,
+                threshold=70.0
+            )
+            faces, face_ids = [], []
+            for class_id, data in enumerate(face_data):
+                if on_progress is not None:
+                    on_progress(len(files) + class_id, steps, f"Preparing {names[class_id]}")
+                for img in data:
+                    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if len(img.shape) == 3 else img
+                    faces.append(cv2.equalizeHist(gray))
+                    face_ids.append(class_id)
+            if on_progress is not None:
+                on_progress(steps - 1, steps, f"Training on {len(faces)} faces")
+            lbph.train(faces, np.array(face_ids))
+            self._model = (names, lbph, None)
+        else:
+            face_dataset = np.concatenate([d.reshape(d.shape[0], -1) for d in face_data], axis=0).astype(np.float32)
+            face_labels = np.concatenate(labels, axis=0).astype(np.int64)
+            norms = np.einsum("ij,ij->i", face_dataset, face_dataset)
+            self._model = (names, None, (face_dataset, norms, face_labels))
+
+        if verbose:
+            print(f"\n Training data loaded: {len(names)} people, {sum(len(d) for d in face_data)} faces")
+        return self
+
+    def predict(self, face):
+        """Name for a 128x128 equalized grayscale crop, or "Unknown"."""
+        return self.predict_batch(face[None])[0]
+
+    def predict_batch(self, faces, map=map):
+        """
+        Names for an (n, 128, 128) batch of crops. LBPH predicts face by face through
+        map (pass a thread pool's map to spread them over cores); k-NN does the batch at once.
+        """
+        names, lbph, trainset = self._model
+        if lbph is not None:
+            def predict_one(face):
+                with metrics.timer("lbph_predict"):
+                    label, confidence_value = lbph.predict(face)
+                if label >= 0 and confidence_value < 150:
+                    return names[label]
+                return names.get(label, "Unknown")
+            return list(map(predict_one, faces))
+        with metrics.timer("knn_predict"):
+            labels = knn(trainset, faces)
+        return [names[label] for label in labels]
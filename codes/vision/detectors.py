@@ -0,0 +1,187 @@
+"""
+Face detectors behind one interface: detect(frame, confidence) returns
+[(x1, y1, x2, y2, score), ...] in frame pixels, highest score first, boxes
+under MIN_FACE_SIZE dropped and overlaps merged (vision/postprocess.py), so
+recognition and enrollment don't care which one found the faces.
+
+    ssd     res10 300x300 Caffe SSD (assets/deploy.prototxt + .caffemodel), the default;
+            run with the backend/target/threads tuned by vision/runtime.py
+    yunet   OpenCV's YuNet (cv2.FaceDetectorYN), assets/face_detection_yunet_2023mar.onnx
+            from the OpenCV model zoo; run on a 320 px wide copy of the frame
+    haar    frontal-face Haar cascade, assets/haarcascade_frontalface_default.xml (or
+            OpenCV's own copy); fastest, least accurate, score from the cascade's last stage
+
+AURA_DETECTOR=yunet (or haar) picks the backend load_detector() returns.
+Accuracy against FPS on recorded clips: python bench/bench_detectors.py clip.mp4
+"""
+import os
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from metrics import metrics
+
+from .dataset import ASSETS_DIR, MODEL_FILE
+from .postprocess import MIN_FACE_SIZE, NMS_THRESHOLD, filter_boxes, filter_faces
+from .preprocess import default_preprocessor
+from .runtime import load_ssd, set_threads
+
+DETECTOR = os.environ.get("AURA_DETECTOR", "ssd").lower()
+YUNET_FILE = ASSETS_DIR / "face_detection_yunet_2023mar.onnx"
+HAAR_NAME = "haarcascade_frontalface_default.xml"
+INPUT_WIDTH = 320  # yunet/haar detect on a copy this wide (never upscaled)
+
+
+def ssd_detect(net, frame, confidence, preprocessor=None, nms_threshold=NMS_THRESHOLD, min_size=MIN_FACE_SIZE):
+    """One SSD pass over frame with a bare cv2.dnn net (or a stand-in with setInput/forward)."""
+    pre = preprocessor or default_preprocessor()
+    net.setInput(pre.blob_from(frame))
+    with metrics.timer("ssd_forward"):
+        detections = net.forward()
+    return filter_faces(detections, frame.shape, confidence, nms_threshold, min_size)
+
+
+def run_detector(net, frame, confidence, preprocessor=None, nms_threshold=NMS_THRESHOLD, min_size=MIN_FACE_SIZE):
+    """
+    detect_faces() for any net: a Detector, or a bare SSD net. A Detector keeps
+    the nms_threshold/min_size it was built with (those here apply to a bare
+    net); an SSD (bare or SSDDetector) is fed through preprocessor, so callers
+    can pick its input size.
+    """
+    if isinstance(net, SSDDetector):
+        return net.detect(frame, confidence, preprocessor)
+    if isinstance(net, Detector):
+        return net.detect(frame, confidence)
+    return ssd_detect(net, frame, confidence, preprocessor, nms_threshold, min_size)
+
+
+class Detector:
+    name = "detector"
+
+    def detect(self, frame, confidence):
+        """[(x1, y1, x2, y2, score), ...] in frame pixels, highest score first."""
+        raise NotImplementedError
+
+
+class SSDDetector(Detector):
+    name = "ssd"
+
+    def __init__(self, net=None, nms_threshold=NMS_THRESHOLD, min_size=MIN_FACE_SIZE):
+        if net is None:
+            if not MODEL_FILE.exists():
+                raise FileNotFoundError(f"SSD model not found: {MODEL_FILE}")
+            net = load_ssd()  # backend, target and threads from vision/runtime.py
+        self.net = net
+        self.nms_threshold = nms_threshold
+        self.min_size = min_size
+
+    def detect(self, frame, confidence, preprocessor=None):
+        return ssd_detect(self.net, frame, confidence, preprocessor, self.nms_threshold, self.min_size)
+
+
+class _ScaledDetector(Detector):
+    """Runs on a copy of the frame at most input_width wide, resized into a reused buffer."""
+
+    def __init__(self, input_width=INPUT_WIDTH, nms_threshold=NMS_THRESHOLD, min_size=MIN_FACE_SIZE):
+        self.input_width = input_width
+        self.nms_threshold = nms_threshold
+        self.min_size = min_size
+        self.scale = 1.0
+        self.size = None
+        self.small = None
+        set_threads()
+
+    def _resize(self, frame):
+        h, w = frame.shape[:2]
+        scale = min(1.0, self.input_width / w)
+        size = (round(w * scale), round(h * scale))
+        if size != self.size:
+            self.scale, self.size = scale, size
+            self.small = np.empty((size[1], size[0], 3), np.uint8)
+            self.resized(size)
+        if scale == 1.0:
+            return frame
+        return cv2.resize(frame, size, dst=self.small)
+
+    def resized(self, size):
+        """Called when the detector input size changes."""
+
+    def _finish(self, xywh, scores, frame, confidence, nms_threshold):
+        """xywh (n, 4) boxes on the small copy -> filter_boxes() on the frame."""
+        boxes = np.asarray(xywh, np.float64) / self.scale
+        boxes[:, 2:] += boxes[:, :2]
+        return filter_boxes(boxes.astype(int), np.asarray(scores, np.float32), frame.shape, confidence,
+                            nms_threshold, self.min_size)
+
+
+class YuNetDetector(_ScaledDetector):
+    name = "yunet"
+
+    def __init__(self, model=YUNET_FILE, **kwargs):
+        super().__init__(**kwargs)
+        if not Path(model).exists():
+            raise FileNotFoundError(f"YuNet model not found: {model} (download it from the OpenCV model zoo)")
+        # YuNet applies its own NMS; its score threshold is set per call
+        self.model = cv2.FaceDetectorYN.create(str(model), "", (self.input_width, self.input_width),
+                                               0.5, self.nms_threshold, 200)
+
+    def resized(self, size):
+        self.model.setInputSize(size)
+
+    def detect(self, frame, confidence):
+        image = self._resize(frame)
+        self.model.setScoreThreshold(float(confidence))
+        with metrics.timer("yunet_detect"):
+            _, faces = self.model.detect(image)
+        if faces is None or not len(faces):
+            return []
+        return self._finish(faces[:, :4], faces[:, 14], frame, confidence, None)
+
+
+class HaarDetector(_ScaledDetector):
+    name = "haar"
+
+    def __init__(self, cascade=None, scale_factor=1.1, min_neighbors=5, **kwargs):
+        super().__init__(**kwargs)
+        if cascade is None:
+            candidates = [ASSETS_DIR / HAAR_NAME]
+            if getattr(cv2, "data", None) is not None:
+                candidates.append(Path(cv2.data.haarcascades) / HAAR_NAME)
+            cascade = next((path for path in candidates if path.exists()), candidates[0])
+        if not Path(cascade).exists():
+            raise FileNotFoundError(f"Haar cascade not found: {cascade}")
+        self.cascade = cv2.CascadeClassifier(str(cascade))
+        if self.cascade.empty():
+            raise FileNotFoundError(f"Haar cascade could not be loaded: {cascade}")
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+        self.gray = None
+
+    def resized(self, size):
+        self.gray = np.empty((size[1], size[0]), np.uint8)
+
+    def detect(self, frame, confidence):
+        image = self._resize(frame)
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=self.gray)
+        cv2.equalizeHist(gray, dst=gray)
+        min_size = max(1, round(self.min_size * self.scale))
+        with metrics.timer("haar_detect"):
+            rects, _, weights = self.cascade.detectMultiScale3(
+                gray, self.scale_factor, self.min_neighbors, minSize=(min_size, min_size), outputRejectLevels=True)
+        if not len(rects):
+            return []
+        # the last stage's weight is an unbounded margin; squash it to 0..1 like the other scores
+        scores = 1.0 / (1.0 + np.exp(-np.asarray(weights, np.float64).reshape(-1)))
+        return self._finish(rects, scores, frame, confidence, self.nms_threshold)
+
+
+DETECTORS = {"ssd": SSDDetector, "yunet": YuNetDetector, "haar": HaarDetector}
+
+
+def load_detector(kind=None, **kwargs):
+    """The configured face detector (AURA_DETECTOR, default ssd)."""
+    kind = (kind or DETECTOR).lower()
+    if kind not in DETECTORS:
+        raise ValueError(f"Unknown detector {kind!r}, expected one of {', '.join(DETECTORS)}")
+    return DETECTORS[kind](**kwargs)
@@ -0,0 +1,52 @@
+"""
+Face enrollment: capture equalized 128x128 crops of one person for the dataset.
+"""
+import threading
+
+import cv2
+
+from .pipeline import detect_faces, face_crop
+
+FACES_PER_PERSON = 300
+DETECT_EVERY = 5  # run the detector on every 5th frame for speed
+
+
+def capture_faces(net, capture, sink, count=FACES_PER_PERSON, stop_event=None, on_progress=None):
+    """
+    Collect up to count face crops from capture. Stops early when the sink
+    says stop or stop_event is set. on_progress(collected, count) after each frame.
+    """
+    stop_event = stop_event or threading.Event()
+    face_data = []
+    frame_count = 0
+    try:
+        while len(face_data) < count and not stop_event.is_set():
+            ret, frame = capture.read()
+            if not ret:
+                continue
+
+            frame_count += 1
+            if frame_count % DETECT_EVERY != 0:
+                if not sink.show(frame):
+                    break
+                continue
+
+            # the detector resizes the full frame to its 300x300 input once, boxes come back in frame pixels
+            for x1, y1, x2, y2, _ in detect_faces(net, frame):
+                box = (x1, y1, x2, y2)
+                face = face_crop(frame, box)
+                if face is None:
+                    continue
+                face_data.append(face)
+                cv2.rectangle(frame, box[:2], box[2:], (0, 255, 255), 2)
+
+            cv2.putText(frame, f"Count: {len(face_data)}", (10, 30),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+            if on_progress is not None:
+                on_progress(len(face_data), count)
+            if not sink.show(frame):
+                break
+    finally:
+        capture.release()
+        sink.close()
+    return face_data[:count]
@@ -0,0 +1,214 @@
+"""
+Shared-memory ring of frame buffers, recognizer -> GUI.
+
+The recognizer service writes annotated BGR frames into one of N fixed-size
+slots; the GUI maps the same memory and wraps the latest slot in a QImage
+without copying (aura_ui/camera_view.py). Layout of the segment:
+
+    header   int64[8]:  magic, slots, capacity h, capacity w, latest slot,
+                        latest seq, reader slot, unused
+    slot i   int64[4]:  seq (-1 while being written), h, w, unused
+    data     slots * (capacity h * capacity w * 3) bytes
+
+The writer never fills the slot the reader has pinned, and marks a slot -1
+while filling it, so a paint never sees a half-written frame. The ring is
+created before the camera opens, so a camera that delivers more than MAX_FRAME
+(a 1080p webcam ignoring the requested mode) gets its frames scaled down to fit.
+"""
+from multiprocessing import resource_tracker, shared_memory
+
+import cv2
+import numpy as np
+
+FRAME_RING = "aura-frames"
+MAX_FRAME = (720, 1280)  # h, w: largest camera mode we expect
+SLOTS = 3
+
+MAGIC = 0x41555241  # "AURA"
+HEADER = 8
+SLOT_FIELDS = 4
+LATEST_SLOT, LATEST_SEQ, READER_SLOT = 4, 5, 6
+
+_created = set()  # rings created by this process (their tracker entry must stay)
+
+
+class FrameRing:
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+        head = np.ndarray((HEADER,), np.int64, buffer=shm.buf)
+        if head[0] != MAGIC:
+            raise ValueError(f"{shm.name} is not a frame ring")
+        self.slots = int(head[1])
+        self.capacity = (int(head[2]), int(head[3]))
+        self.head = head
+        self.slot_info = np.ndarray((self.slots, SLOT_FIELDS), np.int64, buffer=shm.buf, offset=HEADER * 8)
+        self.data_offset = (HEADER + self.slots * SLOT_FIELDS) * 8
+        self.slot_bytes = self.capacity[0] * self.capacity[1] * 3
+        self._pending = None  # slot handed out by next_buffer(), not yet published
+
+    @classmethod
+    def create(cls, name=FRAME_RING, capacity=MAX_FRAME, slots=SLOTS):
+        size = (HEADER + slots * SLOT_FIELDS) * 8 + slots * capacity[0] * capacity[1] * 3
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # left behind by a crashed recognizer
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        head = np.ndarray((HEADER,), np.int64, buffer=shm.buf)
+        head[:] = [MAGIC, slots, capacity[0], capacity[1], -1, 0, -1, 0]
+        np.ndarray((slots, SLOT_FIELDS), np.int64, buffer=shm.buf, offset=HEADER * 8)[:] = -1
+        _created.add(shm.name)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name=FRAME_RING):
+        """Map an existing ring. Raises FileNotFoundError while the recognizer hasn't created it."""
+        shm = shared_memory.SharedMemory(name=name)
+        # only the creator may unlink; stop this process's tracker from doing it at exit
+        if shm.name not in _created:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm, owner=False)
+
+    def _view(self, slot, h, w):
+        return np.ndarray((h, w, 3), np.uint8, buffer=self.shm.buf, offset=self.data_offset + slot * self.slot_bytes)
+
+    # ----- writer -----
+    def fit(self, shape):
+        """(h, w) of a frame of this shape scaled down, keeping its aspect, to fit the slots."""
+        h, w = shape[:2]
+        scale = min(1.0, self.capacity[0] / h, self.capacity[1] / w)
+        return (h, w) if scale == 1.0 else (int(h * scale), int(w * scale))
+
+    def _next_slot(self):
+        latest, pinned = int(self.head[LATEST_SLOT]), int(self.head[READER_SLOT])
+        for step in range(1, self.slots + 1):
+            slot = (latest + step) % self.slots
+            if slot != pinned and slot != latest:
+                return slot
+        return (latest + 1) % self.slots
+
+    def next_buffer(self, shape):
+        """Writable (h, w, 3) array inside the next free slot, e.g. for cap.read(buffer)."""
+        h, w = shape[:2]
+        if h > self.capacity[0] or w > self.capacity[1]:
+            raise ValueError(f"frame {w}x{h} exceeds ring capacity {self.capacity[1]}x{self.capacity[0]}")
+        slot = self._next_slot()
+        self.slot_info[slot, 0] = -1
+        self.slot_info[slot, 1:3] = (h, w)
+        self._pending = slot
+        return self._view(slot, h, w)
+
+    def publish(self):
+        """Make the buffer from next_buffer() the latest frame."""
+        slot, self._pending = self._pending, None
+        seq = int(self.head[LATEST_SEQ]) + 1
+        self.slot_info[slot, 0] = seq
+        self.head[LATEST_SLOT] = slot
+        self.head[LATEST_SEQ] = seq
+
+    def write(self, frame):
+        """Copy a frame in (scaled down if it doesn't fit) and publish it, when it wasn't captured into the ring already."""
+        h, w = self.fit(frame.shape)
+        if (h, w) == frame.shape[:2]:
+            np.copyto(self.next_buffer(frame.shape), frame)
+        else:
+            cv2.resize(frame, (w, h), dst=self.next_buffer((h, w)), interpolation=cv2.INTER_AREA)
+        self.publish()
+
+    def is_pending(self, frame):
+        """True if frame is the buffer last handed out by next_buffer()."""
+        if self._pending is None:
+            return False
+        h, w = self.slot_info[self._pending, 1:3]
+        return frame.ctypes.data == self._view(self._pending, int(h), int(w)).ctypes.data
+
+    # ----- reader -----
+    def latest_seq(self):
+        return int(self.head[LATEST_SEQ])
+
+    def pin_latest(self):
+        """Pin the newest frame for reading; returns (array, seq) or None. Call unpin() after use."""
+        for _ in range(3):
+            slot = int(self.head[LATEST_SLOT])
+            if slot < 0:
+                return None
+            self.head[READER_SLOT] = slot
+            seq, h, w = (int(v) for v in self.slot_info[slot, :3])
+            if seq >= 0 and slot == int(self.head[LATEST_SLOT]):
+                return self._view(slot, h, w), seq
+        return None
+
+    def unpin(self):
+        self.head[READER_SLOT] = -1
+
+    def close(self):
+        # numpy views keep the mapping busy; drop them before closing
+        self.head = self.slot_info = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+            _created.discard(self.shm.name)
+
+
+class SharedFrameCapture:
+    """
+    Wraps a cv2.VideoCapture so frames are decoded straight into the ring.
+    Frames larger than the ring's slots are decoded into a buffer of their own
+    and scaled down into the slot instead, so recognition sees the smaller frame.
+    """
+
+    def __init__(self, capture, ring):
+        self.capture = capture
+        self.ring = ring
+        self.shape = None
+        self.full = None  # decode buffer when the camera's frames don't fit the ring
+
+    def read(self):
+        if self.shape is None:
+            ret, frame = self.capture.read()
+            if not ret:
+                return ret, frame
+            self.shape = self.ring.fit(frame.shape) + frame.shape[2:]
+            if self.shape == frame.shape:
+                return ret, frame
+            print(f"⚠️ Camera frames are {frame.shape[1]}x{frame.shape[0]}, larger than the frame ring; "
+                  f"scaling them to {self.shape[1]}x{self.shape[0]}")
+            self.full = frame
+            return ret, self._scaled()
+        if self.full is None:
+            return self.capture.read(self.ring.next_buffer(self.shape))
+        ret, frame = self.capture.read(self.full)
+        if not ret:
+            return ret, frame
+        if frame.shape != self.full.shape:  # the camera changed mode; start over
+            self.shape = self.full = None
+            return ret, frame
+        return ret, self._scaled()
+
+    def _scaled(self):
+        h, w = self.shape[:2]
+        return cv2.resize(self.full, (w, h), dst=self.ring.next_buffer(self.shape), interpolation=cv2.INTER_AREA)
+
+    def release(self):
+        self.capture.release()
+
+
+class SharedMemorySink:
+    """Publishes annotated frames to the ring for the GUI's CameraView."""
+
+    def __init__(self, ring):
+        self.ring = ring
+
+    def show(self, frame):
+        if self.ring.is_pending(frame):
+            self.ring.publish()  # captured into the ring and annotated in place: no copy
+        else:
+            self.ring.write(frame)
+        return True
+
+    def close(self):
+        pass
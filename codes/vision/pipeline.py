@@ -0,0 +1,169 @@
+"""
+Face detection + recognition loop with a pluggable capture and sink.
+
+capture: anything with read() -> (ok, frame) and release() (cv2.VideoCapture)
+sink:    anything with show(frame) -> bool (False stops the loop) and close()
+
+recognise.py runs it with a camera and an OpenCV window; the recognizer
+service (services/recognizer.py) runs the same pipeline resident.
+"""
+import threading
+
+import cv2
+
+from metrics import metrics
+
+from .batch import BatchRecognizer
+from .dataset import FACE_SIZE
+from .detectors import run_detector
+from .postprocess import MIN_FACE_SIZE, NMS_THRESHOLD
+from .roi import USE_ROI, RoiScheduler
+
+DETECTION_CONFIDENCE = 0.6
+GREETING = "Hi {name}. Welcome to Utpal Shanghvi Global School!"
+
+
+def open_camera(indices=(1, 0)):
+    """First camera that opens, trying index 1 (USB) before 0 (built-in)."""
+    for index in indices:
+        cap = cv2.VideoCapture(index)
+        if cap.isOpened():
+            return cap
+        print(f"Camera {index} not found.")
+        cap.release()
+    raise RuntimeError("Cannot access webcam. Try changing the camera index.")
+
+
+def detect_faces(net, frame, confidence=DETECTION_CONFIDENCE, preprocessor=None,
+                 nms_threshold=NMS_THRESHOLD, min_size=MIN_FACE_SIZE):
+    """
+    [(x1, y1, x2, y2, score), ...] in frame pixels, highest score first: the
+    detections above confidence, at least min_size pixels, overlaps merged by NMS.
+    net is a Detector from load_detector() (vision/detectors.py), which uses its
+    own nms_threshold/min_size, or a bare SSD net.
+    """
+    return run_detector(net, frame, confidence, preprocessor, nms_threshold, min_size)
+
+
+def face_crop(frame, box):
+    """Equalized 128x128 grayscale crop for recognition/enrollment, or None for an empty box."""
+    x1, y1, x2, y2 = box[:4]
+    face_section = frame[y1:y2, x1:x2]
+    if face_section.size == 0:
+        return None
+    face_section = cv2.cvtColor(face_section, cv2.COLOR_BGR2GRAY)
+    face_section = cv2.equalizeHist(face_section)
+    return cv2.resize(face_section, FACE_SIZE)
+
+
+def annotate(frame, name, box):
+    """Draw the detection box and "name (score%)" onto frame."""
+    x1, y1, x2, y2, score = box
+    cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 255), 2)
+    cv2.putText(
+        frame,
+        f"{name} ({score * 100:.1f}%)",
+        (x1, y1 - 10),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        0.8,
+        (255, 0, 0),
+        2
+    )
+
+
+class WindowSink:
+    """cv2.imshow window. 'q' or closing the window stops; other keys go to on_key."""
+
+    def __init__(self, title="Face Recognition", on_key=None):
+        self.title = title
+        self.on_key = on_key or {}
+
+    def show(self, frame):
+        cv2.imshow(self.title, frame)
+        key = cv2.waitKey(1) & 0xFF
+        if key == ord('q'):
+            return False
+        if key in self.on_key:
+            self.on_key[key]()
+        return cv2.getWindowProperty(self.title, cv2.WND_PROP_VISIBLE) >= 1
+
+    def close(self):
+        cv2.destroyWindow(self.title)
+
+
+class NullSink:
+    """Discards frames (headless runs and benchmarks)."""
+
+    def show(self, frame):
+        return True
+
+    def close(self):
+        pass
+
+
+class Greeter:
+    """Says hello once per person until reset()."""
+
+    def __init__(self, template=GREETING):
+        import pyttsx3
+        self.template = template
+        self.engine = pyttsx3.init()
+        self.engine.setProperty('rate', 150)
+        self.engine.setProperty('volume', 1.0)
+        self.spoken_names = set()
+
+    def __call__(self, name, box=None):
+        if name in self.spoken_names or name == "Unknown":
+            return
+        self.engine.say(self.template.format(name=name))
+        self.engine.runAndWait()
+        self.spoken_names.add(name)
+
+    def reset(self):
+        self.spoken_names.clear()
+        print(" Reset spoken names.")
+
+
+class RecognitionPipeline:
+    """on_recognised(name, box) is called for every recognised face."""
+
+    def __init__(self, net, faces, capture, sink, on_recognised=None, confidence=DETECTION_CONFIDENCE, roi=USE_ROI):
+        self.net = net
+        self.faces = faces
+        self.capture = capture
+        self.sink = sink
+        self.on_recognised = on_recognised
+        self.confidence = confidence
+        self.recogniser = BatchRecognizer(faces)
+        self.roi = RoiScheduler() if roi else None  # detect around known faces between full-frame sweeps
+
+    def process(self, frame):
+        """Detect, recognise (all faces as one batch) and annotate one frame in place. Returns [(name, box), ...]."""
+        if self.roi is not None:
+            boxes = self.roi.detect(self.net, frame, self.confidence)
+        else:
+            boxes = detect_faces(self.net, frame, self.confidence)
+        results = self.recogniser.recognise(frame, boxes)
+        for name, box in results:
+            annotate(frame, name, box)
+        return results
+
+    def run(self, stop_event=None):
+        """Loop until the sink says stop or stop_event is set."""
+        stop_event = stop_event or threading.Event()
+        try:
+            while not stop_event.is_set():
+                ret, frame = self.capture.read()
+                if not ret:
+                    continue
+                with metrics.timer("frame"):
+                    results = self.process(frame)
+                for name, box in results:
+                    if self.on_recognised is not None:
+                        self.on_recognised(name, box)
+                if not self.sink.show(frame):
+                    break
+        finally:
+            self.capture.release()
+            self.sink.close()
+            self.recogniser.close()
@@ -0,0 +1,60 @@
+"""
+SSD output -> face boxes, in one numpy pass.
+
+The res10 detector returns up to 200 candidates per frame, (1, 1, N, 7) rows
+of (image, class, score, x1, y1, x2, y2) normalized to the frame. filter_faces():
+
+  1. keeps rows above the confidence with a boolean mask
+  2. scales and clips all kept boxes to frame pixels at once
+  3. drops boxes narrower or shorter than min_size pixels (too small to recognise)
+  4. runs cv2.dnn.NMSBoxes so overlapping boxes of one face become one
+
+so the recognition stage only gets one crop per face, highest score first.
+"""
+import cv2
+import numpy as np
+
+NMS_THRESHOLD = 0.3  # IoU above which the lower-scoring box is dropped
+MIN_FACE_SIZE = 32   # pixels; the crops are resized to 128x128 for recognition
+
+
+def filter_faces(detections, frame_shape, confidence, nms_threshold=NMS_THRESHOLD, min_size=MIN_FACE_SIZE):
+    """[(x1, y1, x2, y2, score), ...] in frame pixels, highest score first."""
+    rows = detections[0, 0]
+    kept = rows[rows[:, 2] > confidence]
+    if not len(kept):
+        return []
+
+    h, w = frame_shape[:2]
+    boxes = (kept[:, 3:7] * np.array([w, h, w, h], np.float64)).astype(int)  # float64: same pixels as before
+    return filter_boxes(boxes, kept[:, 2], frame_shape, confidence, nms_threshold, min_size)
+
+
+def filter_boxes(boxes, scores, frame_shape, confidence, nms_threshold=NMS_THRESHOLD, min_size=MIN_FACE_SIZE):
+    """
+    Steps 1-4 for boxes already in pixels: (n, 4) int x1, y1, x2, y2 and their
+    (n,) scores. The other detectors (vision/detectors.py) end here too.
+    """
+    strong = scores > confidence
+    boxes, scores = boxes[strong], scores[strong]
+    if not len(boxes):
+        return []
+
+    h, w = frame_shape[:2]
+    np.maximum(boxes[:, :2], 0, out=boxes[:, :2])
+    np.minimum(boxes[:, 2], w - 1, out=boxes[:, 2])
+    np.minimum(boxes[:, 3], h - 1, out=boxes[:, 3])
+    sizes = boxes[:, 2:] - boxes[:, :2]
+    large = (sizes >= min_size).all(axis=1)
+    boxes, sizes, scores = boxes[large], sizes[large], scores[large]
+    if not len(boxes):
+        return []
+
+    if len(boxes) > 1 and nms_threshold is not None:
+        xywh = np.hstack([boxes[:, :2], sizes]).astype(np.float32)
+        order = np.asarray(cv2.dnn.NMSBoxes(xywh, scores, confidence, nms_threshold), int).reshape(-1)
+        boxes, scores = boxes[order], scores[order]
+    elif len(boxes) > 1:
+        order = np.argsort(-scores, kind="stable")
+        boxes, scores = boxes[order], scores[order]
+    return [(*box, score) for box, score in zip(boxes.tolist(), scores.tolist())]
@@ -0,0 +1,43 @@
+"""
+Frame preprocessing for the SSD detector with reusable buffers.
+
+FramePreprocessor owns the 300x300 resize target and the (1, 3, 300, 300)
+float blob, so a frame allocates neither: the frame is resized straight into
+the first and mean-subtracted into the second (the same values
+cv2.dnn.blobFromImage gives). The detector's output goes through
+vision/postprocess.py.
+
+detect_faces() uses one preprocessor per thread (default_preprocessor()), so
+callers don't need to keep one themselves.
+"""
+import threading
+
+import cv2
+import numpy as np
+
+SSD_SIZE = (300, 300)
+SSD_MEAN = (104.0, 177.0, 123.0)
+
+_local = threading.local()
+
+
+class FramePreprocessor:
+    def __init__(self, size=SSD_SIZE, mean=SSD_MEAN):
+        self.size = size
+        self.mean = np.array(mean, np.float32)[:, None, None]
+        self.resized = np.empty((size[1], size[0], 3), np.uint8)
+        self.blob = np.empty((1, 3, size[1], size[0]), np.float32)
+
+    def blob_from(self, frame):
+        """The detector input for frame, written into self.blob (valid until the next call)."""
+        cv2.resize(frame, self.size, dst=self.resized)
+        np.subtract(self.resized.transpose(2, 0, 1), self.mean, out=self.blob[0])
+        return self.blob
+
+
+def default_preprocessor():
+    """This thread's FramePreprocessor."""
+    pre = getattr(_local, "preprocessor", None)
+    if pre is None:
+        pre = _local.preprocessor = FramePreprocessor()
+    return pre
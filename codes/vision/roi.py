@@ -0,0 +1,173 @@
+"""
+Detection around the faces already seen, with a periodic full-frame sweep.
+
+The robot greets people at a fixed spot, so faces show up in a small part of
+the frame, yet every full-frame SSD pass squashes 640x480 into 300x300 (a
+30 px face at the back of the queue becomes 14 px and is missed). RoiScheduler
+keeps the boxes of the last detections as tracks and, between sweeps,
+detects only in a square crop around each one:
+
+  - the crop is the face grown by ROI_MARGIN of its size on every side, at
+    least ROI_MIN_SIDE px, rounded up to ROI_STEP px so only a few SSD input
+    sizes (and FramePreprocessor buffers) ever exist; overlapping crops merge
+  - the SSD input is the crop at its own resolution, clamped to ROI_INPUT
+    (128..224 px): small crops are upscaled instead of downscaled, and a
+    crop costs (side / 300)^2 of a full pass
+  - every FULL_SWEEP_EVERY frames, when nothing is tracked, or when the crops
+    would cover more than MAX_ROI_AREA of the frame, the whole frame is
+    searched instead, so newcomers are picked up
+  - a track the detector misses for TRACK_TTL passes is dropped
+
+Other detectors (vision/detectors.py) get the crops too; YuNet and Haar then
+run at the crop's resolution. AURA_ROI=0 turns it off in RecognitionPipeline.
+Cost and recall against full-frame passes: python bench/bench_roi.py
+"""
+import os
+
+import numpy as np
+
+from metrics import metrics
+
+from .detectors import run_detector
+from .postprocess import NMS_THRESHOLD, filter_boxes
+from .preprocess import FramePreprocessor
+
+USE_ROI = os.environ.get("AURA_ROI", "1") != "0"
+FULL_SWEEP_EVERY = 10  # frames; about 1 s at the Pi's frame rate
+ROI_MARGIN = 0.5       # crop = face + half its size on each side
+ROI_MIN_SIDE = 96      # px
+ROI_STEP = 32          # px; crop sides are rounded up to a multiple of this
+ROI_INPUT = (128, 224)  # smallest/largest SSD input side for a crop (a close face stays ~90 px)
+MAX_ROI_AREA = 0.5     # of the frame; above it one full pass is cheaper
+TRACK_TTL = 3          # passes in a row without a detection that drop a track
+TRACK_IOU = 0.3        # a detection this close to a track updates it
+
+
+def iou(a, b):
+    ix = min(a[2], b[2]) - max(a[0], b[0])
+    iy = min(a[3], b[3]) - max(a[1], b[1])
+    if ix <= 0 or iy <= 0:
+        return 0.0
+    inter = ix * iy
+    return inter / ((a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter)
+
+
+def _overlap(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _place(cx, cy, width, height, w, h):
+    """A crop centred on (cx, cy), sides rounded up to ROI_STEP, shifted to lie inside the w x h frame."""
+    width = int(min(-(-width // ROI_STEP) * ROI_STEP, w))
+    height = int(min(-(-height // ROI_STEP) * ROI_STEP, h))
+    x1 = int(min(max(cx - width / 2, 0), w - width))
+    y1 = int(min(max(cy - height / 2, 0), h - height))
+    return x1, y1, x1 + width, y1 + height
+
+
+class Track:
+    def __init__(self, box):
+        self.box = box[:4]
+        self.misses = 0
+
+
+class RoiScheduler:
+    """Decides, frame by frame, whether to search the whole frame or only around the tracks."""
+
+    def __init__(self, full_every=FULL_SWEEP_EVERY, margin=ROI_MARGIN, min_side=ROI_MIN_SIDE,
+                 max_area=MAX_ROI_AREA, ttl=TRACK_TTL):
+        self.full_every = full_every
+        self.margin = margin
+        self.min_side = min_side
+        self.max_area = max_area
+        self.ttl = ttl
+        self.tracks = []
+        self.frame_index = 0
+        self.full_passes = 0
+        self.roi_passes = 0
+        self.preprocessors = {}  # SSD input size -> FramePreprocessor
+
+    def regions(self, frame_shape):
+        """(x1, y1, x2, y2) crops around the tracks, overlapping ones merged."""
+        h, w = frame_shape[:2]
+        rois = []
+        for track in self.tracks:
+            x1, y1, x2, y2 = track.box
+            side = max(self.min_side, max(x2 - x1, y2 - y1) * (1 + 2 * self.margin))
+            rois.append(_place((x1 + x2) / 2, (y1 + y2) / 2, side, side, w, h))
+
+        while True:
+            pair = next(((a, b) for i, a in enumerate(rois) for b in rois[i + 1:] if _overlap(a, b)), None)
+            if pair is None:
+                return rois
+            a, b = pair
+            rois.remove(a)
+            rois.remove(b)
+            x1, y1, x2, y2 = min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+            rois.append(_place((x1 + x2) / 2, (y1 + y2) / 2, x2 - x1, y2 - y1, w, h))
+
+    def input_size(self, crop_shape):
+        """SSD input (w, h) for a crop: its own size, scaled into ROI_INPUT."""
+        h, w = crop_shape[:2]
+        scale = min(max(1.0, ROI_INPUT[0] / max(w, h)), ROI_INPUT[1] / max(w, h))
+        return round(w * scale), round(h * scale)
+
+    def _preprocessor(self, crop_shape):
+        size = self.input_size(crop_shape)
+        pre = self.preprocessors.get(size)
+        if pre is None:
+            if len(self.preprocessors) >= 16:
+                self.preprocessors.clear()
+            pre = self.preprocessors[size] = FramePreprocessor(size)
+        return pre
+
+    def detect(self, net, frame, confidence):
+        """detect_faces() for this frame, full-frame or around the tracks (see the module docstring)."""
+        rois = None
+        if self.tracks and self.frame_index % self.full_every:
+            rois = self.regions(frame.shape)
+            area = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in rois)
+            if area > self.max_area * frame.shape[0] * frame.shape[1]:
+                rois = None
+        self.frame_index += 1
+
+        if rois is None:
+            self.full_passes += 1
+            metrics.count("detect_full")
+            boxes = run_detector(net, frame, confidence)
+        else:
+            self.roi_passes += 1
+            metrics.count("detect_roi")
+            boxes = self._detect_regions(net, frame, confidence, rois)
+        self._update(boxes)
+        return boxes
+
+    def _detect_regions(self, net, frame, confidence, rois):
+        found = []
+        for x1, y1, x2, y2 in rois:
+            crop = frame[y1:y2, x1:x2]
+            for bx1, by1, bx2, by2, score in run_detector(net, crop, confidence, self._preprocessor(crop.shape)):
+                found.append((bx1 + x1, by1 + y1, bx2 + x1, by2 + y1, score))
+        if len(found) < 2:
+            return found
+        # faces where two crops meet may be found twice
+        boxes = np.array([box[:4] for box in found], int)
+        scores = np.array([box[4] for box in found], np.float32)
+        return filter_boxes(boxes, scores, frame.shape, confidence, NMS_THRESHOLD, 0)
+
+    def _update(self, boxes):
+        unmatched = list(boxes)
+        for track in self.tracks:
+            best = max(unmatched, key=lambda box: iou(track.box, box), default=None)
+            if best is not None and iou(track.box, best) >= TRACK_IOU:
+                track.box, track.misses = best[:4], 0
+                unmatched.remove(best)
+            else:
+                track.misses += 1
+        self.tracks = [track for track in self.tracks if track.misses < self.ttl]
+        self.tracks += [Track(box) for box in unmatched]
+
+    def reset(self):
+        """Forget the tracks; the next frame is a full sweep."""
+        self.tracks = []
+        self.frame_index = 0
@@ -0,0 +1,297 @@
+"""
+How the SSD face detector runs: model file, cv2.dnn backend and target, and
+OpenCV's thread count.
+
+Left at the defaults, OpenCV uses every core for each forward pass and fights
+pyttsx3 and the Qt window for them. At the first start on a machine
+load_ssd() times every available combination on a few forward passes and
+keeps the fastest (with fewer threads preferred when within TIE of the best,
+so a core stays free for speech and the GUI). The choice is cached in
+dnn_runtime.json and reused until OpenCV, the CPU or the model files change:
+
+    model     caffe   assets/res10_300x300_ssd_iter_140000.caffemodel (always)
+              onnx    assets/res10_300x300_ssd.onnx             } only if present, and only
+              fp16    assets/res10_300x300_ssd_fp16.onnx        } if it gives the same
+              int8    assets/res10_300x300_ssd_int8.onnx        } (1, 1, N, 7) output
+    backend   opencv, openvino (when OpenCV was built with it)
+    target    cpu, cpu_fp16, opencl, opencl_fp16 (whichever the backend reports)
+    threads   1, 2, cores - 1, cores
+
+AURA_DNN_MODEL / AURA_DNN_BACKEND / AURA_DNN_TARGET / AURA_DNN_THREADS fix
+one of them (the tune searches the rest), AURA_DNN_TUNE=0 skips the tune
+(opencv on the cpu, cores - 1 threads) and AURA_DNN_RETUNE=1 ignores the cache.
+
+The fp16/int8 files are made from an ONNX export of the SSD (needs onnx,
+onnxconverter-common and onnxruntime, so run it on a laptop):
+
+    python tune_detector.py --convert assets/res10_300x300_ssd.onnx --calibrate clip.mp4
+"""
+import contextlib
+import json
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from .dataset import ASSETS_DIR, CONFIG_FILE, MODEL_FILE
+from .preprocess import SSD_SIZE, FramePreprocessor
+
+CACHE_FILE = Path(__file__).resolve().parent.parent / "dnn_runtime.json"
+ONNX_FILE = ASSETS_DIR / "res10_300x300_ssd.onnx"
+FP16_FILE = ASSETS_DIR / "res10_300x300_ssd_fp16.onnx"
+INT8_FILE = ASSETS_DIR / "res10_300x300_ssd_int8.onnx"
+
+MODELS = {"caffe": MODEL_FILE, "onnx": ONNX_FILE, "fp16": FP16_FILE, "int8": INT8_FILE}
+BACKENDS = {"opencv": cv2.dnn.DNN_BACKEND_OPENCV, "openvino": cv2.dnn.DNN_BACKEND_INFERENCE_ENGINE}
+TARGETS = {
+    "cpu": cv2.dnn.DNN_TARGET_CPU,
+    "cpu_fp16": getattr(cv2.dnn, "DNN_TARGET_CPU_FP16", None),  # OpenCV >= 4.8 (ARM fp16 arithmetic)
+    "opencl": cv2.dnn.DNN_TARGET_OPENCL,
+    "opencl_fp16": cv2.dnn.DNN_TARGET_OPENCL_FP16,
+}
+
+MODEL = os.environ.get("AURA_DNN_MODEL", "auto")
+BACKEND = os.environ.get("AURA_DNN_BACKEND", "auto")
+TARGET = os.environ.get("AURA_DNN_TARGET", "auto")
+THREADS = os.environ.get("AURA_DNN_THREADS", "auto")
+TUNE = os.environ.get("AURA_DNN_TUNE", "1") != "0"
+RETUNE = os.environ.get("AURA_DNN_RETUNE", "0") == "1"
+RUNS = 5     # timed forward passes per combination (after one warm-up)
+TIE = 0.05   # within 5% of the fastest counts as a tie; fewer threads win it
+
+
+class DnnRuntime:
+    """One combination of model file, backend, target and thread count."""
+
+    def __init__(self, model="caffe", backend="opencv", target="cpu", threads=None, ms=None):
+        self.model = model
+        self.backend = backend
+        self.target = target
+        self.threads = threads or default_threads()
+        self.ms = ms
+
+    def __repr__(self):
+        timing = f", {self.ms:.1f} ms" if self.ms is not None else ""
+        return f"{self.model}/{self.backend}/{self.target}/{self.threads} threads{timing}"
+
+    def as_dict(self):
+        return {"model": self.model, "backend": self.backend, "target": self.target,
+                "threads": self.threads, "ms": self.ms}
+
+    def load(self):
+        """The SSD net set up for this combination (also sets OpenCV's thread count)."""
+        cv2.setNumThreads(self.threads)
+        if self.model == "caffe":
+            net = cv2.dnn.readNetFromCaffe(str(CONFIG_FILE), str(MODEL_FILE))
+        else:
+            net = cv2.dnn.readNetFromONNX(str(MODELS[self.model]))
+        net.setPreferableBackend(BACKENDS[self.backend])
+        net.setPreferableTarget(TARGETS[self.target])
+        return net
+
+
+def default_threads():
+    """One core left for pyttsx3 and Qt (at least one thread)."""
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def _pinned(value, choices):
+    return [value] if value != "auto" else list(choices)
+
+
+def candidates():
+    """Every DnnRuntime this machine has the files and OpenCV build for, respecting AURA_DNN_*."""
+    cores = os.cpu_count() or 1
+    models = [name for name in _pinned(MODEL, MODELS) if MODELS[name].exists()]
+    threads = [int(THREADS)] if THREADS != "auto" else sorted({1, min(2, cores), default_threads(), cores})
+    found = []
+    for backend in _pinned(BACKEND, BACKENDS):
+        try:
+            available = set(cv2.dnn.getAvailableTargets(BACKENDS[backend]))
+        except cv2.error:
+            continue
+        targets = [name for name in _pinned(TARGET, TARGETS)
+                   if TARGETS[name] is not None and TARGETS[name] in available]
+        found += [DnnRuntime(model, backend, target, count)
+                  for model in models for target in targets for count in threads]
+    return found
+
+
+def machine_key():
+    """What the cached choice depends on: OpenCV build, CPU, model files and the AURA_DNN_* pins."""
+    files = {name: [path.stat().st_size, int(path.stat().st_mtime)] for name, path in MODELS.items() if path.exists()}
+    return {
+        "opencv": cv2.__version__,
+        "machine": platform.machine(),
+        "cores": os.cpu_count(),
+        "models": files,
+        "pins": [MODEL, BACKEND, TARGET, THREADS],
+    }
+
+
+def time_forward(net, blob, runs=RUNS):
+    """Median ms of net.forward() on blob, or None if the output isn't SSD-shaped (1, 1, N, 7)."""
+    net.setInput(blob)
+    out = net.forward()
+    if out.ndim != 4 or out.shape[-1] != 7:
+        return None
+    times = []
+    for _ in range(runs):
+        net.setInput(blob)
+        t = time.perf_counter()
+        net.forward()
+        times.append((time.perf_counter() - t) * 1000)
+    return statistics.median(times)
+
+
+def autotune(runs=RUNS, log=print):
+    """Time every candidate on a gray frame and return the fastest DnnRuntime (None if none loads)."""
+    blob = FramePreprocessor().blob_from(np.full((SSD_SIZE[1], SSD_SIZE[0], 3), 128, np.uint8)).copy()
+    timed = []
+    for runtime in candidates():
+        try:
+            runtime.ms = time_forward(runtime.load(), blob, runs)
+        except cv2.error as e:
+            log(f"   {runtime}: failed ({str(e).strip().splitlines()[-1]})")
+            continue
+        if runtime.ms is None:
+            log(f"   {runtime}: output is not (1, 1, N, 7), skipped")
+            continue
+        log(f"   {runtime}")
+        timed.append(runtime)
+    if not timed:
+        return None
+    fastest = min(runtime.ms for runtime in timed)
+    return min((runtime for runtime in timed if runtime.ms <= fastest * (1 + TIE)),
+               key=lambda runtime: (runtime.threads, runtime.ms))
+
+
+def cached(cache_file=CACHE_FILE):
+    """The DnnRuntime tuned earlier on this machine, or None."""
+    try:
+        data = json.loads(Path(cache_file).read_text(encoding="utf-8"))
+        if data.get("key") == machine_key():
+            return DnnRuntime(**data["runtime"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+@contextlib.contextmanager
+def _locked(path):
+    """Exclusive lock on path while the block runs (fcntl; no-op where there is none)."""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
+
+def _mtime(path):
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def configured(cache_file=CACHE_FILE, log=print):
+    """The DnnRuntime to use: cached for this machine, tuned now, or the defaults."""
+    cache_file = Path(cache_file)
+    runtime = None if RETUNE else cached(cache_file)
+    if runtime is not None:
+        return runtime
+
+    # the recognizer and enroller services start together: one tunes, the other
+    # waits here and then uses its result instead of timing against it
+    seen = _mtime(cache_file)
+    with _locked(cache_file.with_suffix(".lock")):
+        runtime = cached(cache_file)
+        if runtime is not None and (not RETUNE or _mtime(cache_file) != seen):
+            return runtime
+
+        runtime = None
+        if TUNE:
+            log(f"🔧 Timing the face detector on this machine (once; cached in {cache_file.name})...")
+            runtime = autotune(log=log)
+        if runtime is None:
+            pinned = [default if value == "auto" else value for value, default in
+                      ((MODEL, "caffe"), (BACKEND, "opencv"), (TARGET, "cpu"))]
+            return DnnRuntime(*pinned, threads=int(THREADS) if THREADS != "auto" else None)
+
+        log(f"✅ Face detector runtime: {runtime}")
+        tmp = cache_file.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps({"key": machine_key(), "runtime": runtime.as_dict()}, indent=2),
+                           encoding="utf-8")
+            os.replace(tmp, cache_file)
+        except OSError as e:
+            log(f"⚠️ Could not write {cache_file}: {e}")
+    return runtime
+
+
+def set_threads():
+    """Give OpenCV the tuned (or AURA_DNN_THREADS, or default) thread count without tuning; for YuNet/Haar."""
+    runtime = cached()
+    threads = int(THREADS) if THREADS != "auto" else runtime.threads if runtime else default_threads()
+    cv2.setNumThreads(threads)
+    return threads
+
+
+def load_ssd():
+    """The res10 SSD, loaded with the configured (or just tuned) runtime."""
+    return configured().load()
+
+
+def calibration_blobs(clip, count=100):
+    """SSD input blobs from up to count frames of a recorded clip, for int8 calibration."""
+    pre = FramePreprocessor()
+    cap = cv2.VideoCapture(str(clip))
+    blobs = []
+    while len(blobs) < count:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        blobs.append(pre.blob_from(frame).copy())
+    cap.release()
+    if not blobs:
+        raise RuntimeError(f"No frames read from {clip}")
+    return blobs
+
+
+def convert(onnx_file=ONNX_FILE, clip=None):
+    """Write the fp16 copy of an ONNX export of the SSD and, given a clip to calibrate on, the int8 one."""
+    import onnx
+    from onnxconverter_common import float16
+
+    onnx_file = Path(onnx_file)
+    print(f"Converting {onnx_file} to fp16: {FP16_FILE}")
+    onnx.save(float16.convert_float_to_float16(onnx.load(str(onnx_file)), keep_io_types=True), str(FP16_FILE))
+
+    if clip is None:
+        print("No --calibrate clip given, skipping int8")
+        return
+    from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_static
+
+    class ClipReader(CalibrationDataReader):
+        def __init__(self, name, blobs):
+            self.feeds = iter([{name: blob} for blob in blobs])
+
+        def get_next(self):
+            return next(self.feeds, None)
+
+    name = onnx.load(str(onnx_file)).graph.input[0].name
+    print(f"Quantizing to int8 (QDQ, calibrated on {clip}): {INT8_FILE}")
+    quantize_static(str(onnx_file), str(INT8_FILE), ClipReader(name, calibration_blobs(clip)),
+                    quant_format=QuantFormat.QDQ, activation_type=QuantType.QUInt8, weight_type=QuantType.QInt8)
+    print("Conversion complete! Run python tune_detector.py to time the new files.")
+